@@ -2,7 +2,7 @@
 
 
 from django.contrib import admin
-from django.db.models import QuerySet
+from django.db.models import Count, QuerySet
 from django.http import HttpRequest
 from django.utils.html import format_html
 
@@ -153,7 +153,7 @@ class FileAdmin(admin.ModelAdmin[File]):
 
         count = 0
         for file_obj in queryset.filter(is_deleted=True):
-            restore_file(file_obj.id)
+            restore_file(file_obj)
             count += 1
 
         self.message_user(request, f'Restored {count} files from trash')
@@ -170,14 +170,10 @@ class FileAdmin(admin.ModelAdmin[File]):
             request: HTTP request.
             queryset: Selected files.
         """
-        from server.apps.files.logic.trash_operations import (
-            permanent_delete_file,
-        )
+        from server.apps.files.logic.trash_operations import purge_trash_files
 
-        count = 0
-        for file_obj in queryset.filter(is_deleted=True):
-            permanent_delete_file(file_obj.id)
-            count += 1
+        # Bulk delete: storage objects go in batched DeleteObjects calls
+        count = purge_trash_files(queryset.filter(is_deleted=True))
 
         self.message_user(request, f'Permanently deleted {count} files')
 
@@ -242,11 +238,14 @@ class TagAdmin(admin.ModelAdmin[Tag]):
         Returns:
             Number of files tagged with this tag.
         """
-        return obj.files.count()
+        return obj.tagged_files  # type: ignore[attr-defined]
     file_count.short_description = 'Files'  # type: ignore[attr-defined]
+    file_count.admin_order_field = 'tagged_files'  # type: ignore[attr-defined]
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Tag]:
-        """Optimize queryset with select_related.
+        """Optimize queryset with select_related and file counts.
+
+        Counting in the changelist query avoids one COUNT per row.
 
         Args:
             request: HTTP request.
@@ -254,7 +253,11 @@ class TagAdmin(admin.ModelAdmin[Tag]):
         Returns:
             Optimized QuerySet.
         """
-        return super().get_queryset(request).select_related('user')
+        return super().get_queryset(request).select_related(
+            'user',
+        ).annotate(
+            tagged_files=Count('files'),
+        )
 
 
 def _format_bytes(size_bytes: int) -> str:
@@ -1,5 +1,7 @@
 """Exceptions for files app."""
 
+from typing import override
+
 
 class QuotaExceededError(Exception):
     """Raised when upload would exceed user's storage quota."""
@@ -17,13 +19,18 @@ class QuotaExceededError(Exception):
             used_bytes: Currently used bytes.
             required_bytes: Bytes needed for the operation.
         """
+        # Keep raw values as args so the error also pickles cleanly
+        super().__init__(quota_bytes, used_bytes, required_bytes)
         self.quota_bytes = quota_bytes
         self.used_bytes = used_bytes
         self.required_bytes = required_bytes
 
-        available = quota_bytes - used_bytes
-        super().__init__(
-            f'Quota exceeded: need {required_bytes} bytes, '
+    @override
+    def __str__(self) -> str:
+        """Format the message only when it is actually displayed."""
+        available = self.quota_bytes - self.used_bytes
+        return (
+            f'Quota exceeded: need {self.required_bytes} bytes, '
             f'only {available} bytes available '
-            f'(quota: {quota_bytes}, used: {used_bytes})',
+            f'(quota: {self.quota_bytes}, used: {self.used_bytes})'
         )
@@ -0,0 +1,175 @@
+"""Server-side copies and batched deletes for FileStorage objects."""
+
+import logging
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from server.apps.files.infrastructure.storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+# Leaves pool headroom for reads on the same client during bulk copies
+_COPY_MAX_WORKERS: Final = 10
+# S3 DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_SIZE: Final = 1000
+
+# One listing page of (storage path, last modified) pairs
+type ObjectPage = list[tuple[str, datetime]]
+
+
+def copy_object(storage: 'FileStorage', source: str, destination: str) -> None:
+    """Copy an object within the bucket without downloading it.
+
+    Uses CopyObject, or UploadPartCopy for large objects, so no
+    content passes through the application server.
+
+    Args:
+        storage: Storage holding the object.
+        source: Source storage path.
+        destination: Destination storage path.
+
+    Raises:
+        Exception: If the copy fails.
+    """
+    _copy_object(
+        storage.connection.meta.client,
+        storage.bucket_name,
+        source,
+        destination,
+    )
+
+
+def copy_objects(
+    storage: 'FileStorage',
+    pairs: Sequence[tuple[str, str]],
+) -> None:
+    """Copy many objects concurrently using server-side copies.
+
+    S3 has no folder rename, so every object needs its own
+    CopyObject call. Running them in a thread pool makes bulk moves
+    scale with S3 concurrency instead of per-request latency.
+
+    Args:
+        storage: Storage holding the objects.
+        pairs: Sequence of (source, destination) storage paths.
+
+    Raises:
+        Exception: If any copy fails (after all copies finish).
+    """
+    # boto3 clients are thread-safe, resources are not
+    client = storage.connection.meta.client
+    logger.info('Copying %d objects in storage', len(pairs))
+    with ThreadPoolExecutor(max_workers=_COPY_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_copy_object, client, storage.bucket_name, *pair)
+            for pair in pairs
+        ]
+    for future in futures:
+        future.result()
+
+
+def delete_objects(storage: 'FileStorage', names: Sequence[str]) -> None:
+    """Delete many objects using batched DeleteObjects requests.
+
+    Args:
+        storage: Storage holding the objects.
+        names: Storage paths of objects to delete.
+
+    Raises:
+        Exception: If a batch request fails.
+    """
+    for start in range(0, len(names), _DELETE_BATCH_SIZE):
+        batch = names[start : start + _DELETE_BATCH_SIZE]
+        try:
+            storage.bucket.delete_objects(
+                Delete={
+                    'Objects': [{'Key': name} for name in batch],
+                    'Quiet': True,
+                },
+            )
+        except Exception:
+            logger.exception(
+                'Failed to delete %d objects from storage',
+                len(batch),
+            )
+            raise
+        else:
+            logger.info('Deleted %d objects from storage', len(batch))
+
+
+def rollback_copies(storage: 'FileStorage', names: Sequence[str]) -> None:
+    """Delete copied objects after a failed bulk move.
+
+    Best-effort counterpart of FileStorage.rollback_upload() for
+    batches.
+
+    Args:
+        storage: Storage holding the copies.
+        names: Storage paths of copies to delete.
+    """
+    try:
+        logger.warning('Rolling back %d copied objects', len(names))
+        delete_objects(storage, names)
+    except Exception:
+        logger.exception(
+            'Failed to rollback copies, %d objects orphaned',
+            len(names),
+        )
+
+
+def list_object_pages(
+    storage: 'FileStorage',
+    prefix: str,
+) -> Iterator[ObjectPage]:
+    """List objects under a prefix, one ListObjectsV2 page at a time.
+
+    Storage does the enumeration, so each page of up to 1000 keys
+    costs one request regardless of how many objects exist.
+
+    Args:
+        storage: Storage to list.
+        prefix: Storage path prefix ('' for the whole bucket).
+
+    Yields:
+        Lists of (storage path, last modified) pairs.
+    """
+    paginator = storage.connection.meta.client.get_paginator(
+        'list_objects_v2',
+    )
+    pages = paginator.paginate(Bucket=storage.bucket_name, Prefix=prefix)
+    for page in pages:
+        yield [
+            (entry['Key'], entry['LastModified'])
+            for entry in page.get('Contents', [])
+        ]
+
+
+def _copy_object(
+    client: Any,
+    bucket_name: str,
+    source: str,
+    destination: str,
+) -> None:
+    """Server-side copy of a single object.
+
+    Args:
+        client: boto3 S3 client shared across worker threads.
+        bucket_name: Bucket holding both objects.
+        source: Source storage path.
+        destination: Destination storage path.
+
+    Raises:
+        Exception: If the copy fails.
+    """
+    try:
+        client.copy(
+            {'Bucket': bucket_name, 'Key': source},
+            bucket_name,
+            destination,
+        )
+    except Exception:
+        logger.exception('Copy failed: %s -> %s', source, destination)
+        raise
@@ -2,15 +2,24 @@
 
 import hashlib
 import mimetypes
-from pathlib import Path
-from typing import BinaryIO, Final
+import re
+from functools import lru_cache
+from typing import BinaryIO, Final, override
 
 from django.core.exceptions import ValidationError
+from django.core.files.base import File
+from django.core.files.utils import FileProxyMixin
 
 _CHUNK_SIZE: Final = 8192  # 8KB chunks for checksum calculation
+_MIME_CACHE_SIZE: Final = 4096
+_DEFAULT_MIME_TYPE: Final = 'application/octet-stream'
+_USER_ID_PREFIX_RE: Final = re.compile(r'(\d+)(?:/|$)')
 
+# Load the system MIME database once at import instead of on first lookup
+mimetypes.init()
 
-def detect_mime_type(file_obj: BinaryIO, filename: str) -> str:
+
+def detect_mime_type(file_obj: BinaryIO | None, filename: str) -> str:
     """Detect MIME type from file.
 
     Uses Python's built-in mimetypes module to guess MIME type
@@ -18,23 +27,47 @@ def detect_mime_type(file_obj: BinaryIO, filename: str) -> str:
     on file contents, consider adding python-magic library.
 
     Args:
-        file_obj: File-like object (not used in basic implementation).
+        file_obj: File-like object (not used in basic implementation),
+            or None when the content is not at hand.
         filename: Filename with extension.
 
     Returns:
         MIME type string (e.g., 'image/jpeg', 'application/pdf').
         Returns 'application/octet-stream' if type cannot be determined.
     """
-    mime_type, _ = mimetypes.guess_type(filename)
-    if mime_type is None:
-        return 'application/octet-stream'
-    return mime_type
+    extension = f'.{get_file_extension(filename)}'
+    is_compound = (
+        extension in mimetypes.encodings_map
+        or extension in mimetypes.suffix_map
+    )
+    if is_compound:
+        # Compound suffixes like '.tar.gz' need the full filename
+        mime_type, _ = mimetypes.guess_type(filename)
+        return mime_type or _DEFAULT_MIME_TYPE
+    return _guess_by_extension(extension)
+
+
+@lru_cache(maxsize=_MIME_CACHE_SIZE)
+def _guess_by_extension(extension: str) -> str:
+    """Look up MIME type for a lowercase extension.
+
+    Args:
+        extension: Lowercase extension with leading dot (e.g., '.pdf').
+
+    Returns:
+        MIME type string, or 'application/octet-stream' if unknown.
+    """
+    return mimetypes.types_map.get(extension, _DEFAULT_MIME_TYPE)
 
 
 def calculate_checksum(file_obj: BinaryIO) -> str:
     """Calculate SHA256 checksum of file.
 
-    Reads file in chunks to handle large files efficiently.
+    Hashes with hashlib.file_digest(), which reads into a reusable
+    buffer and hashes in C without holding the GIL. Django File wrappers
+    are unwrapped first, so in-memory content (e.g. ContentFile) is
+    hashed straight from its buffer without copying. Objects that cannot
+    read into a buffer fall back to reading in chunks.
     Resets file pointer to beginning after calculation.
 
     Args:
@@ -43,14 +76,19 @@ def calculate_checksum(file_obj: BinaryIO) -> str:
     Returns:
         Hex-encoded SHA256 hash string.
     """
-    sha256_hash = hashlib.sha256()
-
     # Reset file pointer to beginning
     file_obj.seek(0)
 
-    # Read in chunks to handle large files
-    for chunk in iter(lambda: file_obj.read(_CHUNK_SIZE), b''):
-        sha256_hash.update(chunk)
+    # Django File proxies hide BytesIO.getbuffer() from file_digest()
+    raw_file = file_obj.file if isinstance(file_obj, File) else file_obj
+
+    if raw_file is not None and hasattr(raw_file, 'readinto'):
+        sha256_hash = hashlib.file_digest(raw_file, 'sha256')
+    else:
+        # Not a readinto()-capable binary file, e.g. a plain read() stream
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: file_obj.read(_CHUNK_SIZE), b''):
+            sha256_hash.update(chunk)
 
     # Reset file pointer to beginning for subsequent operations
     file_obj.seek(0)
@@ -58,6 +96,59 @@ def calculate_checksum(file_obj: BinaryIO) -> str:
     return sha256_hash.hexdigest()
 
 
+class ChecksumReader(FileProxyMixin[bytes]):
+    """File proxy that computes a SHA256 checksum while being read.
+
+    Wrapping an upload with it hashes each chunk as the storage backend
+    reads it, so the content is not read a second time just for the
+    checksum. Bytes re-read after a seek back (e.g. on a retried
+    request) are hashed only once.
+    """
+
+    file: BinaryIO  # type: ignore[mutable-override]  # noqa: WPS110
+
+    def __init__(self, file_obj: BinaryIO, size: int) -> None:
+        """Initialize checksum reader.
+
+        Args:
+            file_obj: File-like object to read from.
+            size: Total content size in bytes.
+        """
+        self.file = file_obj  # noqa: WPS110
+        self.size = size
+        self._sha256_hash = hashlib.sha256()
+        self._hashed_bytes = 0
+
+    @override
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped file and hash bytes not yet seen.
+
+        Args:
+            size: Maximum number of bytes to read (-1 for all).
+
+        Returns:
+            Bytes read.
+        """
+        position = self.file.tell()
+        chunk = self.file.read(size)
+        unseen_offset = self._hashed_bytes - position
+        if 0 <= unseen_offset < len(chunk):
+            self._sha256_hash.update(memoryview(chunk)[unseen_offset:])
+            self._hashed_bytes += len(chunk) - unseen_offset
+        return chunk
+
+    def hexdigest(self) -> str | None:
+        """Get checksum of the content read so far.
+
+        Returns:
+            Hex-encoded SHA256 hash string, or None if the content was
+            not read in full and in order.
+        """
+        if self._hashed_bytes != self.size:
+            return None
+        return self._sha256_hash.hexdigest()
+
+
 def extract_filename(storage_path: str) -> str:
     """Extract filename from storage path.
 
@@ -67,7 +158,7 @@ def extract_filename(storage_path: str) -> str:
     Returns:
         Filename (e.g., 'file.pdf').
     """
-    return Path(storage_path).name
+    return storage_path.rpartition('/')[2]
 
 
 def extract_folder_path(storage_path: str) -> str:
@@ -77,9 +168,42 @@ def extract_folder_path(storage_path: str) -> str:
         storage_path: Full path (e.g., '123/docs/reports/file.pdf').
 
     Returns:
-        Folder path (e.g., '123/docs/reports').
+        Folder path (e.g., '123/docs/reports'), or '.' for a bare
+        filename.
+    """
+    folder, separator, _ = storage_path.rpartition('/')
+    return folder if separator else '.'
+
+
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """Get half-open key range covering every path with the given prefix.
+
+    Example: '123/docs/' -> ('123/docs/', '123/docs0')
+
+    Args:
+        prefix: Non-empty storage path prefix.
+
+    Returns:
+        Tuple of (inclusive lower bound, exclusive upper bound) in
+        byte order.
+    """
+    # Bumping the last character bounds everything that extends prefix
+    next_char = chr(ord(prefix[-1]) + 1)
+    return prefix, prefix[:-1] + next_char
+
+
+def extract_user_id(storage_path: str) -> int | None:
+    """Extract owner's user ID from storage path.
+
+    Args:
+        storage_path: Full path (e.g., '123/docs/file.pdf').
+
+    Returns:
+        User ID (e.g., 123), or None if the first path component is not
+        a numeric user ID.
     """
-    return str(Path(storage_path).parent)
+    match = _USER_ID_PREFIX_RE.match(storage_path)
+    return None if match is None else int(match.group(1))
 
 
 def validate_storage_path(user_id: int, storage_path: str) -> None:
@@ -98,21 +222,12 @@ def validate_storage_path(user_id: int, storage_path: str) -> None:
     if not storage_path:
         raise ValidationError('Storage path cannot be empty')
 
-    # Extract first path component
-    path_parts = Path(storage_path).parts
-    if not path_parts:
-        raise ValidationError('Storage path must have at least one component')
-
-    first_component = path_parts[0]
-
-    # Check if first component matches user_id
-    try:
-        path_user_id = int(first_component)
-    except ValueError as error:
-        raise ValidationError(
-            'Storage path must start with user ID',
-        ) from error
+    # First path component must be the numeric user ID
+    match = _USER_ID_PREFIX_RE.match(storage_path)
+    if match is None:
+        raise ValidationError('Storage path must start with user ID')
 
+    path_user_id = int(match.group(1))
     if path_user_id != user_id:
         raise ValidationError(
             f'Storage path user ID ({path_user_id}) does not match '
@@ -130,5 +245,9 @@ def get_file_extension(filename: str) -> str:
         Extension without dot, lowercase (e.g., 'pdf').
         Returns empty string if no extension.
     """
-    extension = Path(filename).suffix
-    return extension.lstrip('.').lower()
+    # Same rules as Path.suffix: dotfiles and trailing dots have none
+    name = filename.rpartition('/')[2]
+    dot_index = name.rfind('.')
+    if 0 < dot_index < len(name) - 1:
+        return name[dot_index + 1 :].lower()
+    return ''
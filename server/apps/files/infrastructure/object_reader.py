@@ -0,0 +1,228 @@
+"""Seekable read stream over S3 objects using ranged GETs."""
+
+import io
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.client import IncompleteRead
+from typing import Any, Final, final, override
+
+# Ranged GET window size (AWS recommends 8-16 MB byte-range requests)
+_RANGE_CHUNK_SIZE: Final = 8 * 1024 * 1024
+# Objects at least this large (64 MB) are read ahead with parallel GETs
+_PARALLEL_MIN_SIZE: Final = 8 * _RANGE_CHUNK_SIZE
+# Windows fetched ahead of the reader (bounds memory per stream)
+_PREFETCH_WINDOWS: Final = 4
+# Read-ahead threads shared by all streams (within the connection pool)
+_PREFETCH_MAX_WORKERS: Final = 8
+# Threads start on first use, so streams that never read ahead cost none
+_PREFETCH_EXECUTOR: Final = ThreadPoolExecutor(
+    max_workers=_PREFETCH_MAX_WORKERS,
+    thread_name_prefix='s3-prefetch',
+)
+
+# Start offset and pending content of a window fetched ahead
+type _PrefetchedWindow = tuple[int, Future[bytes]]
+
+
+@final
+class S3ObjectReader(io.RawIOBase):
+    """Seekable read-only stream over an S3 object using ranged GETs.
+
+    Nothing is fetched until the first read. Reads are served from
+    bounded windows of _RANGE_CHUNK_SIZE bytes starting at the current
+    position, so time to first byte does not depend on object size and
+    a seek followed by a short read transfers at most one window.
+
+    Once a large object is read past its first window without seeking
+    (a full download rather than a short Range request), the following
+    windows are fetched concurrently ahead of the reader, on a thread
+    pool shared by all streams.
+
+    Every GET after the first is conditional on the first response's
+    ETag, so an object replaced mid-read fails instead of mixing
+    content from two versions.
+    """
+
+    def __init__(self, s3_object: Any, size: int) -> None:
+        """Initialize reader.
+
+        Args:
+            s3_object: boto3 S3 Object resource.
+            size: Object size in bytes.
+        """
+        super().__init__()
+        self._object = s3_object
+        self._size = size
+        self._position = 0
+        self._window_end = 0
+        self._body: Any = None
+        self._etag: str | None = None
+        self._prefetched: deque[_PrefetchedWindow] = deque()
+        self._prefetch_start = 0
+
+    @override
+    def readable(self) -> bool:
+        """Check if stream is readable.
+
+        Returns:
+            True - stream supports reading.
+        """
+        return True
+
+    @override
+    def seekable(self) -> bool:
+        """Check if stream is seekable.
+
+        Returns:
+            True - seeking restarts the ranged GET lazily.
+        """
+        return True
+
+    @override
+    def tell(self) -> int:
+        """Get current position.
+
+        Returns:
+            Current byte offset.
+        """
+        return self._position
+
+    @override
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a new position, dropping any open response body.
+
+        Args:
+            offset: Byte offset relative to whence.
+            whence: io.SEEK_SET, io.SEEK_CUR or io.SEEK_END.
+
+        Returns:
+            New absolute position.
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        if offset != self._position:
+            self._close_body()
+            self._cancel_prefetch()
+            self._position = offset
+        return self._position
+
+    @override
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes into a buffer, opening a ranged GET if needed.
+
+        Args:
+            buffer: Writable buffer to fill.
+
+        Returns:
+            Number of bytes read (0 at end of object).
+
+        Raises:
+            IncompleteRead: If the body ends before the object size.
+        """
+        if self._position >= self._size:
+            return 0
+        if self._position >= self._window_end:
+            self._close_body()
+        if self._body is None:
+            self._open_window()
+        limit = min(len(buffer), self._window_end - self._position)
+        chunk = self._body.read(limit)
+        if not chunk:
+            raise IncompleteRead(b'', self._size - self._position)
+        buffer[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    @override
+    def close(self) -> None:
+        """Close stream and release the HTTP connection."""
+        self._close_body()
+        self._cancel_prefetch()
+        super().close()
+
+    def _open_window(self) -> None:
+        """Open the window at the current position.
+
+        Uses a prefetched window when one starts here, otherwise starts
+        a ranged GET and, for sequential reads of large objects, begins
+        fetching the following windows.
+        """
+        start = self._position
+        is_sequential = start > 0 and start == self._window_end
+        self._window_end = min(start + _RANGE_CHUNK_SIZE, self._size)
+        last_byte = self._window_end - 1
+
+        if self._prefetched and self._prefetched[0][0] == start:
+            _, window = self._prefetched.popleft()
+            self._body = io.BytesIO(window.result())
+            self._schedule_prefetch()
+            return
+
+        self._cancel_prefetch()
+        response = self._object.get(**self._range_params(start, last_byte))
+        self._etag = response['ETag']
+        self._body = response['Body']
+        if is_sequential and self._size >= _PARALLEL_MIN_SIZE:
+            self._prefetch_start = self._window_end
+            self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        """Keep up to _PREFETCH_WINDOWS windows in flight ahead."""
+        while (
+            len(self._prefetched) < _PREFETCH_WINDOWS
+            and self._prefetch_start < self._size
+        ):
+            start = self._prefetch_start
+            end = min(start + _RANGE_CHUNK_SIZE, self._size)
+            window = _PREFETCH_EXECUTOR.submit(self._fetch_range, start, end)
+            self._prefetched.append((start, window))
+            self._prefetch_start = end
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        """Download a byte range on a worker thread.
+
+        Uses the low-level client, which unlike resources is thread-safe.
+
+        Args:
+            start: First byte offset.
+            end: Offset after the last byte.
+
+        Returns:
+            Range content.
+        """
+        response = self._object.meta.client.get_object(
+            Bucket=self._object.bucket_name,
+            Key=self._object.key,
+            **self._range_params(start, end - 1),
+        )
+        return response['Body'].read()
+
+    def _range_params(self, start: int, last_byte: int) -> dict[str, str]:
+        """Build GET parameters for a byte range of the read version.
+
+        Args:
+            start: First byte offset.
+            last_byte: Offset of the last byte (inclusive).
+
+        Returns:
+            Range parameter, plus IfMatch once the ETag is known.
+        """
+        request = {'Range': f'bytes={start}-{last_byte}'}
+        if self._etag is not None:
+            request['IfMatch'] = self._etag
+        return request
+
+    def _cancel_prefetch(self) -> None:
+        """Drop windows fetched ahead, e.g. after a seek."""
+        for _, window in self._prefetched:
+            window.cancel()
+        self._prefetched.clear()
+        self._prefetch_start = 0
+
+    def _close_body(self) -> None:
+        """Close the current response body, if any."""
+        if self._body is not None:
+            self._body.close()
+            self._body = None
@@ -0,0 +1,104 @@
+"""S3 storage base sharing one boto3 session across threads."""
+
+import threading
+from typing import Any, Final, override
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from storages.backends.s3 import S3Storage
+
+# HTTP connections kept open per S3 client (botocore default: 10)
+_MAX_POOL_CONNECTIONS: Final = 20
+# Uploads above this size go multipart, in parts of the same size
+_MULTIPART_CHUNK_SIZE: Final = 8 * 1024 * 1024
+# Parts uploaded in parallel per file (within the connection pool)
+_UPLOAD_MAX_CONCURRENCY: Final = 8
+# Used unless a transfer_config option is given
+_TRANSFER_CONFIG: Final = TransferConfig(
+    multipart_threshold=_MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=_MULTIPART_CHUNK_SIZE,
+    max_concurrency=_UPLOAD_MAX_CONCURRENCY,
+    use_threads=True,
+)
+# Merged over the configured client config (addressing style etc.)
+_CLIENT_CONFIG: Final = Config(
+    max_pool_connections=_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+
+
+class PooledS3Storage(S3Storage):
+    """S3Storage with pooled connections and parallel multipart uploads.
+
+    Per-thread resources are built from one shared boto3 session and
+    keep their HTTP connections alive, so requests on any thread reuse
+    warm connections instead of loading a new session each.
+    """
+
+    def __init__(self, **settings: Any) -> None:
+        """Initialize storage with connection pooling settings.
+
+        Args:
+            settings: Storage options (see S3Storage).
+        """
+        settings.setdefault('transfer_config', _TRANSFER_CONFIG)
+        super().__init__(**settings)
+        self.client_config = self.client_config.merge(_CLIENT_CONFIG)
+        self._session: boto3.Session | None = None
+        self._session_lock = threading.Lock()
+
+    @property
+    @override
+    def connection(self) -> Any:
+        """Get this thread's S3 resource.
+
+        boto3 resources are not thread-safe, so S3Storage keeps one per
+        thread, but it also builds a new session (and reloads service
+        models) for each. Resources here come from a single shared
+        session, created under a lock because sessions are not
+        thread-safe either.
+
+        Returns:
+            boto3 S3 resource for the current thread.
+        """
+        connection = getattr(self._connections, 'connection', None)
+        if connection is None:
+            with self._session_lock:
+                connection = super().connection
+        return connection
+
+    @override
+    def __getstate__(self) -> dict[str, Any]:
+        """Get picklable state without the session and its lock.
+
+        Returns:
+            Storage state.
+        """
+        state = super().__getstate__()
+        state.pop('_session', None)
+        state.pop('_session_lock', None)
+        return state
+
+    @override
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore state with a fresh session slot and lock.
+
+        Args:
+            state: Storage state from __getstate__().
+        """
+        super().__setstate__(state)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @override
+    def _create_session(self) -> boto3.Session:
+        """Get the session shared by all threads' resources.
+
+        Returns:
+            boto3 session, created on first use.
+        """
+        if self._session is None:
+            self._session = super()._create_session()
+        return self._session
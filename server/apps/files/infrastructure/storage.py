@@ -1,21 +1,33 @@
 """Custom storage backend for S3-compatible storage."""
 
+import base64
+import io
 import logging
-from typing import Any, final, override
+from typing import Any, BinaryIO, Final, final, override
 
-from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+from server.apps.files.infrastructure.object_reader import S3ObjectReader
+from server.apps.files.infrastructure.pooled_storage import PooledS3Storage
 
 logger = logging.getLogger(__name__)
 
+# Lifetime of presigned upload URLs (15 minutes)
+_PRESIGNED_UPLOAD_EXPIRY: Final = 900
+
 
 @final
-class FileStorage(S3Storage):
+class FileStorage(PooledS3Storage):
     """Custom S3 storage backend for user files.
 
     Extends django-storages S3Storage with:
     - Transaction rollback support for failed DB operations
     - Enhanced error logging
+    - Pooled, kept-alive connections from one shared boto3 session
+    - Parallel multipart uploads for large files
     - Future: metrics, caching, CDN integration
+
+    Bulk copies and deletes live in batch_operations.
     """
 
     @override
@@ -124,3 +136,77 @@ class FileStorage(S3Storage):
         except Exception:
             logger.exception('Move failed: %s -> %s', source, destination)
             raise
+
+    def open_stream(self, name: str, size: int) -> BinaryIO:
+        """Open a lazy, range-aware read stream for an object.
+
+        Unlike open(), which downloads the whole object on first access,
+        the stream issues no request until read and then fetches bounded
+        byte ranges from the current position onward.
+
+        Args:
+            name: Storage path of the object.
+            size: Object size in bytes (known from the database).
+
+        Returns:
+            Buffered, seekable binary stream.
+        """
+        s3_object = self.bucket.Object(self._normalize_name(clean_name(name)))
+        return io.BufferedReader(S3ObjectReader(s3_object, size))
+
+    def presigned_upload_url(
+        self,
+        name: str,
+        size: int,
+        checksum_sha256: str,
+    ) -> str:
+        """Generate a presigned URL for uploading an object directly.
+
+        The signature covers the SHA256 checksum header, so storage
+        rejects a PUT whose content does not match it.
+
+        Args:
+            name: Storage path to upload to.
+            size: Content size in bytes.
+            checksum_sha256: Hex-encoded SHA256 checksum of the content.
+
+        Returns:
+            URL accepting a single PUT with the
+            x-amz-checksum-sha256 header set to the base64 checksum.
+        """
+        checksum = base64.b64encode(bytes.fromhex(checksum_sha256)).decode()
+        return self.connection.meta.client.generate_presigned_url(
+            'put_object',
+            Params={
+                'Bucket': self.bucket_name,
+                'Key': self._normalize_name(clean_name(name)),
+                'ContentLength': size,
+                'ChecksumSHA256': checksum,
+            },
+            ExpiresIn=_PRESIGNED_UPLOAD_EXPIRY,
+        )
+
+    def stat_upload(self, name: str) -> tuple[int, str | None]:
+        """Get size and stored SHA256 checksum of an uploaded object.
+
+        Storage keeps the checksum sent with a single PUT (see
+        presigned_upload_url()), so it describes the content actually
+        stored, not what a client claims.
+
+        Args:
+            name: Storage path of the object.
+
+        Returns:
+            Tuple of (size in bytes, hex-encoded SHA256 checksum), the
+            checksum being None if the object was stored without one or
+            only with a multipart (composite) checksum.
+        """
+        response = self.connection.meta.client.head_object(
+            Bucket=self.bucket_name,
+            Key=self._normalize_name(clean_name(name)),
+            ChecksumMode='ENABLED',
+        )
+        checksum = response.get('ChecksumSHA256')
+        if checksum is None or '-' in checksum:
+            return response['ContentLength'], None
+        return response['ContentLength'], base64.b64decode(checksum).hex()
@@ -1,25 +1,50 @@
 """Business logic for file operations."""
 
 import logging
-from typing import TYPE_CHECKING, BinaryIO
+from datetime import datetime
+from functools import partial
+from io import SEEK_END
+from typing import TYPE_CHECKING, BinaryIO, Final
 
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from django.core.files.base import File as DjangoFile
 from django.core.files.storage import default_storage
-from django.db import transaction
-from django.db.models import QuerySet
-
+from django.db import IntegrityError, transaction
+from django.db.models import (  # noqa: WPS347
+    CharField,
+    Func,
+    Max,
+    Q,
+    QuerySet,
+    Value,
+)
+from django.db.models.functions import Collate, Concat, Substr
+from django.utils import timezone
+
+from server.apps.files.exceptions import QuotaExceededError
+from server.apps.files.infrastructure.batch_operations import (
+    ObjectPage,
+    copy_object,
+    copy_objects,
+    delete_objects,
+    list_object_pages,
+    rollback_copies,
+)
 from server.apps.files.infrastructure.metadata import (
+    ChecksumReader,
     calculate_checksum,
     detect_mime_type,
     extract_filename,
+    extract_user_id,
+    prefix_range,
     validate_storage_path,
 )
 from server.apps.files.logic.quota_operations import (
-    adjust_usage,
     check_quota,
     decrement_usage,
-    increment_usage,
+    release_usage,
+    reserve_quota,
 )
 from server.apps.files.models import File
 
@@ -29,6 +54,9 @@ if TYPE_CHECKING:
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Columns needed to delete a file and release its quota
+_DELETE_FIELDS: Final = ('file', 'size_bytes', 'user')
+
 
 def _get_storage() -> 'FileStorage':
     """Get the configured default storage backend.
@@ -69,18 +97,13 @@ def upload_file(
     # Extract filename from path
     filename = extract_filename(storage_path)
 
-    # Calculate metadata
+    # Calculate metadata (checksum is computed during upload)
     logger.info('Calculating metadata for file: %s', storage_path)
-    checksum = calculate_checksum(file_obj)
     mime_type = detect_mime_type(file_obj, filename)
-    if hasattr(file_obj, 'size'):
-        file_size = file_obj.size
-    else:
-        file_size = len(file_obj.read())
-        file_obj.seek(0)  # Reset after reading for size
+    file_size = _get_file_size(file_obj)
 
-    # Check quota BEFORE upload to prevent orphaned files in S3
-    check_quota(user, file_size)
+    # Reserve quota BEFORE upload to prevent orphaned files in S3
+    reserve_quota(user, file_size)
 
     # Initialize storage
     storage = _get_storage()
@@ -88,10 +111,16 @@ def upload_file(
     # Step 1: Upload to storage first
     try:
         logger.info('Uploading file to storage: %s', storage_path)
-        saved_name = storage.save(storage_path, file_obj)
+        saved_name, checksum = _save_with_checksum(
+            storage,
+            storage_path,
+            file_obj,
+            file_size,
+        )
         logger.info('File uploaded successfully: %s', saved_name)
     except Exception:
         logger.exception('Failed to upload file to storage: %s', storage_path)
+        decrement_usage(user, file_size)
         raise
 
     # Step 2: Create database record (in transaction)
@@ -104,8 +133,6 @@ def upload_file(
                 mime_type=mime_type,
                 checksum_sha256=checksum,
             )
-            # Update quota usage
-            increment_usage(user, file_size)
             logger.info(
                 'File record created in database: %s (ID: %d)',
                 saved_name,
@@ -119,14 +146,166 @@ def upload_file(
             saved_name,
         )
         storage.rollback_upload(saved_name)
+        decrement_usage(user, file_size)
+        raise
+
+
+def create_presigned_upload(
+    user: User,
+    storage_path: str,
+    size_bytes: int,
+    checksum_sha256: str,
+) -> str:
+    """Start a direct-to-storage upload that bypasses the app server.
+
+    The client PUTs the content to the returned URL and then calls
+    commit_upload(). Quota is checked here to fail early, but only
+    reserved on commit.
+
+    Args:
+        user: Owner of the file.
+        storage_path: Full storage path ({user_id}/folder/file.ext).
+        size_bytes: Content size in bytes.
+        checksum_sha256: Hex-encoded SHA256 checksum of the content.
+
+    Returns:
+        Presigned PUT URL.
+
+    Raises:
+        ValidationError: If the path is invalid or already taken.
+        QuotaExceededError: If upload would exceed user's quota.
+    """
+    validate_storage_path(user.id, storage_path)
+    # A direct PUT overwrites, so never hand out URLs for paths owned by
+    # a record, including trashed files whose objects are kept
+    if File.all_objects.filter(user=user, file=storage_path).exists():
+        raise ValidationError(f'File already exists: {storage_path}')
+    check_quota(user, size_bytes)
+
+    logger.info('Presigning direct upload: %s', storage_path)
+    return _get_storage().presigned_upload_url(
+        storage_path,
+        size_bytes,
+        checksum_sha256,
+    )
+
+
+def commit_upload(
+    user: User,
+    storage_path: str,
+    size_bytes: int,
+    checksum_sha256: str,
+) -> File:
+    """Record a file uploaded directly to storage.
+
+    Counterpart of create_presigned_upload(). The stored object's size
+    and SHA256 checksum, as reported by storage, must match the declared
+    ones. Objects that cannot be committed are deleted, unless a file
+    record owns the path: the upload URL stays valid for a while, so a
+    late PUT may have overwritten a file created in the meantime.
+
+    Args:
+        user: Owner of the file.
+        storage_path: Full storage path ({user_id}/folder/file.ext).
+        size_bytes: Declared content size in bytes.
+        checksum_sha256: Hex-encoded SHA256 checksum of the content.
+
+    Returns:
+        Created File instance.
+
+    Raises:
+        ValidationError: If the path is invalid or taken, or the stored
+            object does not match the declared size and checksum.
+        QuotaExceededError: If upload would exceed user's quota.
+        Exception: If the object is missing or the DB operation fails.
+    """
+    validate_storage_path(user.id, storage_path)
+    if File.all_objects.filter(user=user, file=storage_path).exists():
+        raise ValidationError(f'File already exists: {storage_path}')
+
+    _verify_upload(user, storage_path, size_bytes, checksum_sha256)
+
+    try:
+        reserve_quota(user, size_bytes)
+    except QuotaExceededError:
+        _discard_upload(user, storage_path)
         raise
 
+    try:
+        with transaction.atomic():
+            file_instance = File.objects.create(
+                user=user,
+                file=storage_path,
+                size_bytes=size_bytes,
+                mime_type=detect_mime_type(
+                    None,
+                    extract_filename(storage_path),
+                ),
+                checksum_sha256=checksum_sha256,
+            )
+    except Exception as exc:
+        logger.exception('Failed to commit direct upload: %s', storage_path)
+        decrement_usage(user, size_bytes)
+        if isinstance(exc, IntegrityError):
+            # E.g. a concurrent commit created the record first
+            _discard_upload(user, storage_path)
+        raise
+
+    logger.info(
+        'Direct upload committed: %s (ID: %d)',
+        storage_path,
+        file_instance.id,
+    )
+    return file_instance
+
+
+def _verify_upload(
+    user: User,
+    storage_path: str,
+    size_bytes: int,
+    checksum_sha256: str,
+) -> None:
+    """Check a direct upload against storage's own size and checksum.
+
+    Args:
+        user: Owner of the upload.
+        storage_path: Full storage path of the uploaded object.
+        size_bytes: Declared content size in bytes.
+        checksum_sha256: Declared hex-encoded SHA256 checksum.
+
+    Raises:
+        ValidationError: If the stored object does not match; it is
+            deleted first.
+    """
+    stored_size, stored_checksum = _get_storage().stat_upload(storage_path)
+    if (stored_size, stored_checksum) != (size_bytes, checksum_sha256):
+        _discard_upload(user, storage_path)
+        raise ValidationError(
+            f'Uploaded object ({stored_size} bytes, SHA256 '
+            f'{stored_checksum}) does not match declared size and checksum',
+        )
+
+
+def _discard_upload(user: User, storage_path: str) -> None:
+    """Delete an uncommitted direct upload from storage.
+
+    Args:
+        user: Owner of the upload.
+        storage_path: Full storage path of the uploaded object.
+    """
+    # Never delete an object that a file record owns
+    if File.all_objects.filter(user=user, file=storage_path).exists():
+        logger.warning('Not discarding upload of owned path: %s', storage_path)
+        return
+    _get_storage().rollback_upload(storage_path)
+
 
 def delete_file(file_id: int) -> None:
     """Delete file from database and storage.
 
     Transaction safety: Delete DB record first. Storage deletion is handled
-    automatically by the post_delete signal handler in signals.py.
+    automatically by the post_delete signal handler in signals.py, once
+    the DB delete has committed.
 
     Args:
         file_id: ID of file to delete.
@@ -135,9 +314,9 @@ def delete_file(file_id: int) -> None:
         File.DoesNotExist: If file doesn't exist.
         Exception: If DB deletion fails.
     """
-    # Get file instance
+    # Get file instance (only the columns the delete and quota need)
     try:
-        file_instance = File.objects.get(id=file_id)
+        file_instance = File.objects.only(*_DELETE_FIELDS).get(id=file_id)
     except File.DoesNotExist:
         logger.exception('File not found: ID=%d', file_id)
         raise
@@ -151,18 +330,179 @@ def delete_file(file_id: int) -> None:
 
     # Delete from database - storage cleanup handled by post_delete signal
     file_size = file_instance.size_bytes
-    file_user = file_instance.user
     try:
         with transaction.atomic():
             file_instance.delete()
-            # Update quota usage
-            decrement_usage(file_user, file_size)
+            # Update quota usage (by owner ID, no user lookup)
+            release_usage({file_instance.user_id: file_size})
             logger.info('File record deleted from database: ID=%d', file_id)
     except Exception:
         logger.exception('Failed to delete file from database: ID=%d', file_id)
         raise
 
 
+def delete_files(user: User, file_ids: list[int]) -> int:
+    """Delete many of a user's files in bulk.
+
+    IDs that don't exist or belong to another user are ignored.
+
+    Args:
+        user: Owner of the files.
+        file_ids: IDs of files to delete.
+
+    Returns:
+        Number of files deleted.
+    """
+    count = purge_files(File.objects.filter(user=user, id__in=file_ids))
+    logger.info('Deleted %d files in bulk for user %s', count, user.username)
+    return count
+
+
+def purge_files(files: QuerySet[File], *, skip_locked: bool = False) -> int:
+    """Delete the files selected by a queryset with a few bulk queries.
+
+    Rows are claimed with SELECT ... FOR UPDATE, waiting for rows other
+    transactions hold. Background workers pass skip_locked so parallel
+    runs each claim a disjoint set of rows instead of waiting on each
+    other. Claimed rows are removed with a single DELETE that bypasses
+    the per-instance post_delete storage cleanup; storage objects are
+    removed with batched DeleteObjects requests once the delete commits.
+    Quota is decremented with one UPDATE per owner.
+
+    Args:
+        files: Files to delete; may be ordered and sliced.
+        skip_locked: Skip rows locked by other transactions.
+
+    Returns:
+        Number of files deleted.
+    """
+    sizes_by_user_id: dict[int, int] = {}
+
+    with transaction.atomic():
+        claimed = files.select_for_update(skip_locked=skip_locked)
+        rows = list(claimed.values_list('id', 'user_id', 'file', 'size_bytes'))
+        deleted_ids = [row[0] for row in rows]
+        storage_paths = [row[2] for row in rows if row[2]]
+        for _, user_id, _, size_bytes in rows:
+            sizes_by_user_id[user_id] = (
+                sizes_by_user_id.get(user_id, 0) + size_bytes
+            )
+
+        File.tags.through.objects.filter(file_id__in=deleted_ids).delete()
+        deleted_rows = File.all_objects.filter(id__in=deleted_ids)
+        deleted_rows._raw_delete(deleted_rows.db)  # noqa: SLF001, WPS437
+        release_usage(sizes_by_user_id)
+
+        # Like the post_delete signal, a rolled back delete (e.g. by an
+        # outer transaction) must never lose content
+        if storage_paths:
+            transaction.on_commit(
+                partial(_delete_purged_objects, storage_paths),
+            )
+
+    return len(deleted_ids)
+
+
+def _delete_purged_objects(storage_paths: list[str]) -> None:
+    """Delete committed-purged files' content from storage.
+
+    Args:
+        storage_paths: Storage paths of the purged files.
+    """
+    try:
+        delete_objects(_get_storage(), storage_paths)
+    except Exception:
+        # Log but don't raise - DB delete already succeeded
+        logger.exception(
+            'Failed to delete %d purged files from storage (orphaned)',
+            len(storage_paths),
+        )
+
+
+def delete_orphaned_objects(
+    prefix: str,
+    modified_before: datetime,
+    *,
+    dry_run: bool = False,
+) -> list[str]:
+    """Delete storage objects that no file record references.
+
+    Failed rollbacks and interrupted moves can leave objects without a
+    record. Objects are listed page by page; each page is checked with
+    one query and its orphans removed with one DeleteObjects request.
+    Only keys under a numeric user ID are considered, and objects
+    modified after the cutoff are kept, since uploads store the object
+    before creating its record.
+
+    Args:
+        prefix: Storage path prefix to scan ('' for all users).
+        modified_before: Only objects last modified before this count.
+        dry_run: Find orphans without deleting them.
+
+    Returns:
+        Storage paths of the orphaned objects.
+    """
+    storage = _get_storage()
+    orphaned: list[str] = []
+
+    for page in list_object_pages(storage, prefix):
+        candidates = _orphan_candidates(page, modified_before)
+        if not candidates:
+            continue
+
+        referenced = _referenced_paths(candidates)
+        page_orphans = [
+            storage_path
+            for storage_path in candidates
+            if storage_path not in referenced
+        ]
+        if page_orphans and not dry_run:
+            delete_objects(storage, page_orphans)
+        orphaned.extend(page_orphans)
+
+    logger.info('Found %d orphaned objects under %r', len(orphaned), prefix)
+    return orphaned
+
+
+def _orphan_candidates(
+    page: ObjectPage,
+    modified_before: datetime,
+) -> dict[str, int]:
+    """Pick objects of a listing page that may be orphaned.
+
+    Args:
+        page: (storage path, last modified) pairs of one listing page.
+        modified_before: Only objects last modified before this count.
+
+    Returns:
+        Storage path -> owner ID taken from its first component.
+    """
+    candidates: dict[str, int] = {}
+    for storage_path, last_modified in page:
+        user_id = extract_user_id(storage_path)
+        if user_id is not None and last_modified < modified_before:
+            candidates[storage_path] = user_id
+    return candidates
+
+
+def _referenced_paths(candidates: dict[str, int]) -> set[str]:
+    """Find candidate storage paths that a file record references.
+
+    Args:
+        candidates: Storage path -> owner ID.
+
+    Returns:
+        Referenced storage paths, trashed files included since they
+        keep their object.
+    """
+    return set(
+        File.all_objects.filter(
+            user_id__in=set(candidates.values()),
+            file__in=list(candidates),
+        ).values_list('file', flat=True),
+    )
+
+
 def list_directory(user: User, folder_path: str = '') -> QuerySet[File]:
     """List files in a directory.
 
@@ -179,21 +519,16 @@ def list_directory(user: User, folder_path: str = '') -> QuerySet[File]:
     """
     # Construct full path
     if folder_path:
-        full_path = '{user_id}/{folder}'.format(
-            user_id=user.id,
-            folder=folder_path.strip('/'),
-        )
+        full_path = f"{user.id}/{folder_path.strip('/')}"
     else:
         full_path = str(user.id)
 
     logger.debug('Listing directory: %s', full_path)
 
-    # Query files starting with this path
-    # Use startswith to include files in subdirectories
-    return File.objects.filter(
-        user=user,
-        file__startswith=full_path,
-    ).select_related('user')
+    # Range scan over paths under this folder (includes subdirectories);
+    # the trailing slash keeps sibling folders like 'documents2' out.
+    # Owners are joined in so callers reading file.user stay at 1 query.
+    return files_with_prefix(user, f'{full_path}/').select_related('user')
 
 
 def get_folder_tree(user: User) -> dict[str, list[str]]:
@@ -264,6 +599,95 @@ def file_exists(user: User, storage_path: str) -> bool:
     return File.objects.filter(user=user, file=storage_path).exists()
 
 
+def files_with_prefix(user: User, prefix: str) -> QuerySet[File]:
+    """Get user's files whose storage path starts with a prefix.
+
+    Filters on a byte-ordered (C collation) key range instead of
+    ``LIKE 'prefix%'``, so Postgres performs a plain btree range scan
+    on ``files_user_file_range_idx`` without pattern matching.
+
+    Args:
+        user: Owner of files.
+        prefix: Non-empty storage path prefix.
+
+    Returns:
+        QuerySet of File objects under the prefix.
+    """
+    lower, upper = prefix_range(prefix)
+    return File.objects.alias(
+        file_key=Collate('file', 'C'),
+    ).filter(
+        user=user,
+        file_key__gte=lower,
+        file_key__lt=upper,
+    )
+
+
+def resolve_storage_path(
+    user: User,
+    storage_path: str,
+) -> tuple[File | None, bool]:
+    """Resolve a storage path to a file or an implicit folder.
+
+    A single byte-ordered query matches both the exact path and paths
+    under it; the exact path sorts first, so at most one row is loaded.
+
+    Args:
+        user: Owner of files.
+        storage_path: Full storage path.
+
+    Returns:
+        Tuple of (file at the path or None, whether the path is a folder).
+    """
+    lower, upper = prefix_range(storage_path.rstrip('/') + '/')
+    match = File.objects.alias(
+        file_key=Collate('file', 'C'),
+    ).filter(
+        Q(file=storage_path) | Q(file_key__gte=lower, file_key__lt=upper),
+        user=user,
+    ).order_by('file_key').first()
+    if match is None:
+        return None, False
+    if match.file.name == storage_path:
+        return match, False
+    return None, True
+
+
+def list_folder_children(user: User, prefix: str) -> dict[str, datetime]:
+    """Get direct children under a prefix with their latest modification.
+
+    Groups all files under the prefix by their first path component in a
+    single query, so a folder listing and its modification time need
+    only one round-trip.
+
+    Example: prefix '123/docs/' with files '123/docs/a.txt' and
+    '123/docs/sub/b.txt' -> {'a.txt': ..., 'sub': ...}
+
+    Args:
+        user: Owner of files.
+        prefix: Folder storage path prefix ending with '/'.
+
+    Returns:
+        Dict of child name (file or subfolder) to latest modified_at.
+    """
+    # First path component after the prefix: file or subfolder name
+    child_name = Func(
+        Substr('file', len(prefix) + 1),
+        Value('/'),
+        Value(1),
+        function='SPLIT_PART',
+        output_field=CharField(),
+    )
+    children = (
+        files_with_prefix(user, prefix)
+        .order_by()
+        .values(child=child_name)
+        .annotate(latest_modified=Max('modified_at'))
+        .values_list('child', 'latest_modified')
+    )
+    return dict(children)
+
+
 def folder_exists(user: User, folder_path: str) -> bool:
     """Check if a folder exists (has files with the given prefix).
 
@@ -278,7 +702,49 @@ def folder_exists(user: User, folder_path: str) -> bool:
         True if folder exists (has files), False otherwise.
     """
     prefix = folder_path.rstrip('/') + '/'
-    return File.objects.filter(user=user, file__startswith=prefix).exists()
+    return files_with_prefix(user, prefix).exists()
+
+
+def _claim_destinations(user: User, storage_paths: list[str]) -> None:
+    """Make sure a move can write to the given storage paths.
+
+    Trashed files keep their objects at their original keys, so copying
+    onto such a key would destroy content that can still be restored.
+    Their objects are copied to free keys and the records follow them;
+    the old keys are left for the move to overwrite.
+
+    Args:
+        user: Owner of the files.
+        storage_paths: Storage paths that a move is going to write.
+
+    Raises:
+        ValidationError: If an active file already uses one of the paths.
+    """
+    taken = list(
+        File.all_objects.filter(user=user, file__in=storage_paths).only(
+            'id',
+            'file',
+            'is_deleted',
+        ),
+    )
+    if any(not taken_file.is_deleted for taken_file in taken):
+        raise ValidationError('File already exists at destination')
+    if not taken:
+        return
+
+    storage = _get_storage()
+    old_names = [taken_file.file.name for taken_file in taken]
+    new_names = [storage.get_available_name(name) for name in old_names]
+    logger.info('Moving %d trashed objects out of the way', len(old_names))
+    try:
+        copy_objects(storage, list(zip(old_names, new_names, strict=True)))
+        for taken_file, new_name in zip(taken, new_names, strict=True):
+            taken_file.file.name = new_name
+        File.all_objects.bulk_update(taken, ['file'])
+    except Exception:
+        logger.exception('Failed to move trashed objects, rolling back')
+        rollback_copies(storage, new_names)
+        raise
 
 
 def move_file(user: User, old_path: str, new_path: str) -> File:
@@ -296,13 +762,14 @@ def move_file(user: User, old_path: str, new_path: str) -> File:
 
     Raises:
         File.DoesNotExist: If source file not found.
-        ValidationError: If new path validation fails.
+        ValidationError: If new path validation fails or is taken.
     """
     # Validate new path follows user isolation rules
     validate_storage_path(user.id, new_path)
 
     # Get the file
     file_instance = File.objects.get(user=user, file=old_path)
+    _claim_destinations(user, [new_path])
     storage = _get_storage()
 
     logger.info(
@@ -311,11 +778,9 @@ def move_file(user: User, old_path: str, new_path: str) -> File:
         new_path,
     )
 
-    # Step 1: Copy file in storage
+    # Step 1: Copy file in storage (server-side, no bytes through app)
     try:
-        old_file = file_instance.file.open('rb')
-        storage.save(new_path, old_file)
-        old_file.close()
+        copy_object(storage, old_path, new_path)
         logger.info('File copied to new location: %s', new_path)
     except Exception:
         logger.exception('Failed to copy file in storage')
@@ -351,6 +816,8 @@ def copy_file(user: User, source_path: str, dest_path: str) -> File:
     """Copy a file to a new location.
 
     Creates a new file with the same content at the destination path.
+    Content is copied server-side in storage and the source metadata
+    (size, MIME type, checksum) is reused, so nothing is re-read.
 
     Args:
         user: Owner of the file.
@@ -372,8 +839,8 @@ def copy_file(user: User, source_path: str, dest_path: str) -> File:
     source_file = File.objects.get(user=user, file=source_path)
     storage = _get_storage()
 
-    # Check quota BEFORE copy to prevent orphaned files in S3
-    check_quota(user, source_file.size_bytes)
+    # Reserve quota BEFORE copy to prevent orphaned files in S3
+    reserve_quota(user, source_file.size_bytes)
 
     logger.info(
         'Copying file from %s to %s',
@@ -381,14 +848,13 @@ def copy_file(user: User, source_path: str, dest_path: str) -> File:
         dest_path,
     )
 
-    # Step 1: Copy file in storage
+    # Step 1: Copy file in storage (server-side, no download)
     try:
-        file_content = source_file.file.open('rb')
-        storage.save(dest_path, file_content)
-        file_content.close()
+        copy_object(storage, source_file.file.name, dest_path)
         logger.info('File copied to storage: %s', dest_path)
     except Exception:
         logger.exception('Failed to copy file in storage')
+        decrement_usage(user, source_file.size_bytes)
         raise
 
     # Step 2: Create new database record
@@ -403,8 +869,6 @@ def copy_file(user: User, source_path: str, dest_path: str) -> File:
             )
             # Copy tags from source file
             new_file.tags.set(source_file.tags.all())
-            # Update quota usage
-            increment_usage(user, source_file.size_bytes)
             logger.info(
                 'File record created: %s (ID: %d)',
                 dest_path,
@@ -415,6 +879,7 @@ def copy_file(user: User, source_path: str, dest_path: str) -> File:
         # Rollback: Delete the copied file
         logger.exception('Database creation failed, rolling back storage copy')
         storage.rollback_upload(dest_path)
+        decrement_usage(user, source_file.size_bytes)
         raise
 
 
@@ -444,36 +909,39 @@ def update_file_content(
         QuotaExceededError: If update would exceed user's quota.
         Exception: If upload or DB operation fails.
     """
-    # Get existing file
-    file_instance = File.objects.get(id=file_id)
+    # Get existing file (with owner, needed for quota updates)
+    file_instance = File.objects.select_related('user').get(id=file_id)
     old_storage_path = file_instance.file.name
     old_size = file_instance.size_bytes
     storage = _get_storage()
 
     # Extract filename and calculate new metadata
     filename = extract_filename(old_storage_path)
-    checksum = calculate_checksum(file_obj)
     mime_type = detect_mime_type(file_obj, filename)
     file_size = _get_file_size(file_obj)
 
-    # Check quota for size increase only
+    # Reserve quota for size increase only
     size_increase = file_size - old_size
     if size_increase > 0:
-        check_quota(file_instance.user, size_increase)
+        reserve_quota(file_instance.user, size_increase)
 
     logger.info('Updating file content: %s (ID: %d)', old_storage_path, file_id)
 
     # Upload new content, update DB, cleanup old content
-    _upload_and_update_file(
-        file_instance,
-        storage,
-        old_storage_path,
-        old_size,
-        file_size,
-        mime_type,
-        checksum,
-        file_obj,
-    )
+    try:
+        _upload_and_update_file(
+            file_instance,
+            storage,
+            old_storage_path,
+            old_size,
+            file_size,
+            mime_type,
+            file_obj,
+        )
+    except Exception:
+        if size_increase > 0:
+            decrement_usage(file_instance.user, size_increase)
+        raise
 
     return file_instance
 
@@ -489,11 +957,38 @@ def _get_file_size(file_obj: BinaryIO | DjangoFile) -> int:
     """
     if hasattr(file_obj, 'size'):
         return file_obj.size
-    file_size = len(file_obj.read())
+    # Seek to the end instead of reading the content into memory
+    file_size = file_obj.seek(0, SEEK_END)
     file_obj.seek(0)
     return file_size
 
 
+def _save_with_checksum(
+    storage: 'FileStorage',
+    storage_path: str,
+    file_obj: BinaryIO | DjangoFile,
+    file_size: int,
+) -> tuple[str, str]:
+    """Upload file content, computing its checksum in the same pass.
+
+    Falls back to a separate checksum pass only if the storage backend
+    did not read the content in full and in order.
+
+    Args:
+        storage: Storage backend.
+        storage_path: Storage path to save to.
+        file_obj: File content.
+        file_size: Content size in bytes.
+
+    Returns:
+        Tuple of (saved name, hex-encoded SHA256 checksum).
+    """
+    reader = ChecksumReader(file_obj, file_size)  # type: ignore[arg-type]
+    saved_name = storage.save(storage_path, reader)
+    checksum = reader.hexdigest() or calculate_checksum(file_obj)
+    return saved_name, checksum
+
+
 def _upload_and_update_file(  # noqa: WPS211
     file_instance: File,
     storage: 'FileStorage',
@@ -501,7 +996,6 @@ def _upload_and_update_file(  # noqa: WPS211
     old_size: int,
     file_size: int,
     mime_type: str,
-    checksum: str,
     file_obj: BinaryIO | DjangoFile,
 ) -> None:
     """Upload new content and update file record atomically.
@@ -513,7 +1007,6 @@ def _upload_and_update_file(  # noqa: WPS211
         old_size: Previous file size in bytes.
         file_size: New file size.
         mime_type: New MIME type.
-        checksum: New checksum.
         file_obj: New file content.
     """
     # Generate temporary path for new content
@@ -522,7 +1015,12 @@ def _upload_and_update_file(  # noqa: WPS211
     # Step 1: Upload new content to temporary path
     try:
         logger.debug('Uploading to temp path: %s', temp_storage_path)
-        storage.save(temp_storage_path, file_obj)
+        _, checksum = _save_with_checksum(
+            storage,
+            temp_storage_path,
+            file_obj,
+            file_size,
+        )
     except Exception:
         logger.exception('Failed to upload: %s', temp_storage_path)
         raise
@@ -539,8 +1037,9 @@ def _upload_and_update_file(  # noqa: WPS211
                 'checksum_sha256',
                 'modified_at',
             ])
-            # Update quota usage
-            adjust_usage(file_instance.user, old_size, file_size)
+            # Release usage on shrink (growth was reserved up front)
+            if file_size < old_size:
+                decrement_usage(file_instance.user, old_size - file_size)
     except Exception:
         logger.exception('DB update failed, rolling back')
         storage.rollback_upload(temp_storage_path)
@@ -580,6 +1079,11 @@ def _update_file_path_fallback(file_instance: File, temp_path: str) -> None:
 def move_folder(user: User, old_prefix: str, new_prefix: str) -> int:
     """Move/rename a folder by updating all file paths with the prefix.
 
+    Objects are copied concurrently in storage, then every database path
+    is rewritten in a single UPDATE. Destination keys are claimed first,
+    so no record owns a copy and copies can be removed again if either
+    step fails; old objects are deleted in batches afterwards.
+
     Args:
         user: Owner of files.
         old_prefix: Current folder path prefix.
@@ -589,7 +1093,8 @@ def move_folder(user: User, old_prefix: str, new_prefix: str) -> int:
         Number of files moved.
 
     Raises:
-        ValidationError: If new prefix validation fails.
+        ValidationError: If new prefix validation fails or a file
+            already exists at one of the new paths.
     """
     # Validate new prefix follows user isolation rules
     validate_storage_path(user.id, new_prefix)
@@ -603,27 +1108,57 @@ def move_folder(user: User, old_prefix: str, new_prefix: str) -> int:
         new_prefix_normalized,
     )
 
-    # Get all files with the old prefix
-    files = File.objects.filter(
-        user=user,
-        file__startswith=old_prefix_normalized,
+    old_paths = list(
+        files_with_prefix(user, old_prefix_normalized)
+        .order_by()
+        .values_list('file', flat=True),
     )
+    if not old_paths:
+        return 0
 
-    moved_count = 0
-    for file_instance in files:
-        # Calculate new path
-        relative_path = file_instance.file.name[len(old_prefix_normalized):]
-        new_path = new_prefix_normalized + relative_path
-
-        try:
-            move_file(user, file_instance.file.name, new_path)
-            moved_count += 1
-        except Exception:
-            logger.exception(
-                'Failed to move file: %s',
-                file_instance.file.name,
+    storage = _get_storage()
+    new_paths = [
+        new_prefix_normalized + old_path[len(old_prefix_normalized):]
+        for old_path in old_paths
+    ]
+    _claim_destinations(user, new_paths)
+
+    # Step 1: Copy all objects in storage concurrently
+    try:
+        copy_objects(storage, list(zip(old_paths, new_paths, strict=True)))
+    except Exception:
+        logger.exception('Failed to copy folder in storage, rolling back')
+        rollback_copies(storage, new_paths)
+        raise
+
+    # Step 2: Rewrite every path prefix in a single UPDATE
+    try:
+        with transaction.atomic():
+            moved_count = File.objects.filter(
+                user=user,
+                file__in=old_paths,
+            ).update(
+                file=Concat(
+                    Value(new_prefix_normalized),
+                    Substr('file', len(old_prefix_normalized) + 1),
+                    output_field=CharField(),
+                ),
+                modified_at=timezone.now(),
             )
-            raise
+    except Exception:
+        logger.exception('Database update failed, rolling back storage copy')
+        rollback_copies(storage, new_paths)
+        raise
+
+    # Step 3: Delete old objects from storage
+    try:
+        delete_objects(storage, old_paths)
+    except Exception:
+        # Log but don't raise - the move succeeded, old files are orphaned
+        logger.exception(
+            'Failed to delete old folder objects (orphaned): %s',
+            old_prefix_normalized,
+        )
 
     logger.info(
         'Moved %d files from %s to %s',
@@ -1,10 +1,19 @@
 """Business logic for storage quota operations."""
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from django.db import transaction
-from django.db.models import F, Sum  # noqa: WPS347
+from django.db.models import (  # noqa: WPS347
+    BigIntegerField,
+    Case,
+    F,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Greatest
 
 from server.apps.files.exceptions import QuotaExceededError
 from server.apps.files.models import File, UserQuota
@@ -21,19 +30,27 @@ logger = logging.getLogger(__name__)
 def get_or_create_quota(user: _User) -> UserQuota:
     """Get or create quota for user (on-demand creation).
 
+    A missing row is created with INSERT ... ON CONFLICT DO NOTHING, so
+    concurrent first uploads never hit an IntegrityError and need no
+    savepoint to recover from one.
+
     Args:
         user: User to get quota for.
 
     Returns:
         UserQuota instance for the user.
     """
-    quota, created = UserQuota.objects.get_or_create(user=user)
-    if created:
-        logger.info(
-            'Created quota for user %s: %d bytes',
-            user.username,
-            quota.quota_bytes,
-        )
+    quota = UserQuota.objects.filter(user=user).first()
+    if quota is not None:
+        return quota
+
+    _insert_quota(user)
+    quota = UserQuota.objects.get(user=user)
+    logger.info(
+        'Created quota for user %s: %d bytes',
+        user.username,
+        quota.quota_bytes,
+    )
     return quota
 
 
@@ -65,6 +82,41 @@ def check_quota(user: _User, size_bytes: int) -> None:
         )
 
 
+def reserve_quota(user: _User, size_bytes: int) -> None:
+    """Check quota and add size to usage in one conditional UPDATE.
+
+    The UPDATE only matches while the new usage fits within the quota,
+    so concurrent uploads cannot both pass the check and overshoot it.
+    Creates quota on-demand if it doesn't exist.
+
+    Args:
+        user: User to reserve quota for.
+        size_bytes: Bytes to add to usage.
+
+    Raises:
+        QuotaExceededError: If the reservation would exceed quota.
+    """
+    if _try_reserve(user, size_bytes):
+        return
+
+    # Either no quota row yet or not enough space
+    quota = get_or_create_quota(user)
+    if quota.has_space_for(size_bytes) and _try_reserve(user, size_bytes):
+        return
+
+    logger.warning(
+        'Quota exceeded for user %s: need %d, have %d available',
+        user.username,
+        size_bytes,
+        quota.available_bytes(),
+    )
+    raise QuotaExceededError(
+        quota_bytes=quota.quota_bytes,
+        used_bytes=quota.used_bytes,
+        required_bytes=size_bytes,
+    )
+
+
 def increment_usage(user: _User, size_bytes: int) -> None:
     """Atomically increment user's storage usage.
 
@@ -79,9 +131,7 @@ def increment_usage(user: _User, size_bytes: int) -> None:
 
         if updated == 0:
             # Quota doesn't exist yet, create it
-            quota = get_or_create_quota(user)
-            quota.used_bytes = size_bytes
-            quota.save(update_fields=[_USED_BYTES_FIELD])
+            _create_quota_with_usage(user, size_bytes)
 
     logger.debug(
         'Incremented usage for user %s by %d bytes',
@@ -93,52 +143,86 @@ def increment_usage(user: _User, size_bytes: int) -> None:
 def decrement_usage(user: _User, size_bytes: int) -> None:
     """Atomically decrement user's storage usage.
 
-    Prevents negative values by clamping to 0.
+    Prevents negative values by clamping to 0 in the same UPDATE, so
+    there is no read-modify-write window.
 
     Args:
         user: User to decrement usage for.
         size_bytes: Bytes to subtract from usage.
     """
-    with transaction.atomic():
-        # Get current quota to check if decrement would go negative
-        try:
-            quota = UserQuota.objects.select_for_update().get(user=user)
-        except UserQuota.DoesNotExist:
-            # No quota exists, nothing to decrement
-            logger.debug(
-                'No quota exists for user %s, skipping decrement',
-                user.username,
-            )
-            return
-
-        # Calculate new usage, clamping to 0
-        new_usage = max(0, quota.used_bytes - size_bytes)
-        quota.used_bytes = new_usage
-        quota.save(update_fields=[_USED_BYTES_FIELD])
+    updated = UserQuota.objects.filter(user=user).update(
+        used_bytes=Greatest(F(_USED_BYTES_FIELD) - size_bytes, 0),
+    )
+
+    if updated == 0:
+        # No quota exists, nothing to decrement
+        logger.debug(
+            'No quota exists for user %s, skipping decrement',
+            user.username,
+        )
+        return
 
     logger.debug(
-        'Decremented usage for user %s by %d bytes (new: %d)',
+        'Decremented usage for user %s by %d bytes',
         user.username,
         size_bytes,
-        new_usage,
     )
 
 
+def release_usage(sizes_by_user_id: Mapping[int, int]) -> None:
+    """Decrement storage usage of many users at once.
+
+    Issues a single UPDATE for all users, picking each user's size with
+    a CASE expression, and clamps usage to 0 like decrement_usage().
+    Users without a quota are skipped.
+
+    Args:
+        sizes_by_user_id: Bytes to subtract, keyed by user ID.
+    """
+    if not sizes_by_user_id:
+        return
+
+    released_bytes = Case(
+        *(
+            When(user_id=user_id, then=Value(size_bytes))
+            for user_id, size_bytes in sizes_by_user_id.items()
+        ),
+        default=Value(0),
+        output_field=BigIntegerField(),
+    )
+    UserQuota.objects.filter(user_id__in=list(sizes_by_user_id)).update(
+        used_bytes=Greatest(F(_USED_BYTES_FIELD) - released_bytes, 0),
+    )
+    logger.debug('Released usage for %d users', len(sizes_by_user_id))
+
+
 def adjust_usage(user: _User, old_size: int, new_size: int) -> None:
     """Adjust user's storage usage for content updates.
 
+    Applies the size difference with a single clamped UPDATE.
+
     Args:
         user: User to adjust usage for.
         old_size: Previous file size in bytes.
         new_size: New file size in bytes.
     """
     size_diff = new_size - old_size
+    if size_diff == 0:
+        return
 
-    if size_diff > 0:
-        increment_usage(user, size_diff)
-    elif size_diff < 0:
-        decrement_usage(user, -size_diff)
-    # If size_diff == 0, no adjustment needed
+    updated = UserQuota.objects.filter(user=user).update(
+        used_bytes=Greatest(F(_USED_BYTES_FIELD) + size_diff, 0),
+    )
+
+    if updated == 0 and size_diff > 0:
+        # Quota doesn't exist yet, create it
+        _create_quota_with_usage(user, size_diff)
+
+    logger.debug(
+        'Adjusted usage for user %s by %d bytes',
+        user.username,
+        size_diff,
+    )
 
 
 def recalculate_usage(user: _User) -> int:
@@ -173,3 +257,47 @@ def recalculate_usage(user: _User) -> int:
     )
 
     return total
+
+
+def _create_quota_with_usage(user: _User, used_bytes: int) -> None:
+    """Create missing quota for user and add usage to it.
+
+    Adds with an F() update instead of setting the value, so usage
+    added by a concurrent creator is not overwritten.
+
+    Args:
+        user: User to create quota for.
+        used_bytes: Bytes to add to usage.
+    """
+    _insert_quota(user)
+    UserQuota.objects.filter(user=user).update(
+        used_bytes=F(_USED_BYTES_FIELD) + used_bytes,
+    )
+
+
+def _insert_quota(user: _User) -> None:
+    """Insert a default quota row unless the user already has one.
+
+    Args:
+        user: User to create quota for.
+    """
+    UserQuota.objects.bulk_create([UserQuota(user=user)], ignore_conflicts=True)
+
+
+def _try_reserve(user: _User, size_bytes: int) -> bool:
+    """Add size to usage if it fits within quota.
+
+    Args:
+        user: User to reserve quota for.
+        size_bytes: Bytes to add to usage.
+
+    Returns:
+        True if the quota row was updated.
+    """
+    updated = UserQuota.objects.filter(
+        user=user,
+        quota_bytes__gte=F(_USED_BYTES_FIELD) + size_bytes,
+    ).update(
+        used_bytes=F(_USED_BYTES_FIELD) + size_bytes,
+    )
+    return updated > 0
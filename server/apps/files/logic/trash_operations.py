@@ -1,47 +1,66 @@
 """Business logic for trash (soft delete) operations."""
 
 import logging
-from datetime import UTC, datetime
+import time
+from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
-from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Count, Max, QuerySet
 from django.utils import timezone
 
-from server.apps.files.logic.quota_operations import decrement_usage
+from server.apps.files.logic.file_operations import purge_files
 from server.apps.files.models import File
 
 # User type for Django's dynamic user model
 _User = Any
 
+_DELETED_AT_FIELD = 'deleted_at'  # noqa: WPS226
+
+# Columns written when files are moved to trash
+_SOFT_DELETE_FIELDS: Final = (
+    'is_deleted',
+    _DELETED_AT_FIELD,
+    'original_path',
+    'trash_name',
+    'modified_at',
+)
+
+# Rows per UPDATE statement when trashing many files at once
+_SOFT_DELETE_BATCH_SIZE: Final = 500
+
 logger = logging.getLogger(__name__)
 
 
 def _generate_trash_name(storage_path: str) -> str:
     """Generate unique trash filename with timestamp.
 
+    The timestamp is the nanosecond epoch time in hex: trash names are
+    internal (never displayed), so no date formatting is needed.
+
     Args:
         storage_path: Original storage path (e.g., '123/docs/report.pdf').
 
     Returns:
-        Trash name with timestamp (e.g., 'report__20260131T143052123456.pdf').
+        Trash name with timestamp (e.g., 'report__188f3a6c2e1b4d00.pdf').
     """
     path = Path(storage_path)
-    stem = path.stem
-    suffix = path.suffix
-    timestamp = datetime.now(tz=UTC).strftime('%Y%m%dT%H%M%S%f')
-    return f'{stem}__{timestamp}{suffix}'
+    return f'{path.stem}__{time.time_ns():x}{path.suffix}'
 
 
-def soft_delete_file(file_id: int) -> File:
+def soft_delete_file(file_or_id: File | int) -> File:
     """Move file to trash (soft delete).
 
     Sets is_deleted=True and records original path for restore.
     Quota is NOT decremented - trash files count toward quota.
 
+    The flags are written with a single UPDATE. Given an ID, only the
+    storage path is loaded first, so the returned instance defers its
+    other fields; a given instance is updated in place with no SELECT.
+
     Args:
-        file_id: ID of file to soft delete.
+        file_or_id: File to soft delete, or its ID.
 
     Returns:
         Updated File instance.
@@ -49,24 +68,33 @@ def soft_delete_file(file_id: int) -> File:
     Raises:
         File.DoesNotExist: If file not found.
     """
-    file_instance = File.objects.get(id=file_id)
+    if isinstance(file_or_id, File):
+        file_instance = file_or_id
+    else:
+        file_instance = File.objects.only('file').get(id=file_or_id)
+    file_id = file_instance.id
     original_path = file_instance.file.name
 
     # Generate unique trash name
     trash_name = _generate_trash_name(original_path)
+    deleted_at = timezone.now()
+
+    # Update file record; the filter skips rows trashed concurrently
+    updated = File.objects.filter(id=file_id).update(
+        is_deleted=True,
+        deleted_at=deleted_at,
+        original_path=original_path,
+        trash_name=trash_name,
+        modified_at=deleted_at,
+    )
+    if not updated:
+        raise File.DoesNotExist(f'File {file_id} is already in trash')
 
-    # Update file record
     file_instance.is_deleted = True
-    file_instance.deleted_at = timezone.now()
+    file_instance.deleted_at = deleted_at
     file_instance.original_path = original_path
     file_instance.trash_name = trash_name
-    file_instance.save(update_fields=[
-        'is_deleted',
-        'deleted_at',
-        'original_path',
-        'trash_name',
-        'modified_at',
-    ])
+    file_instance.modified_at = deleted_at
 
     logger.info(
         'File moved to trash: %s -> %s (ID: %d)',
@@ -78,11 +106,59 @@ def soft_delete_file(file_id: int) -> File:
     return file_instance
 
 
-def restore_file(file_id: int, destination_path: str | None = None) -> File:
+def soft_delete_files(files: Iterable[File]) -> int:
+    """Move many files to trash (soft delete) at once.
+
+    Same semantics as soft_delete_file(), but all files share one
+    deletion timestamp and are written with batched bulk UPDATEs
+    instead of one UPDATE per file.
+
+    Args:
+        files: Active files to soft delete.
+
+    Returns:
+        Number of files moved to trash.
+    """
+    deleted_at = timezone.now()
+    trash_names: set[str] = set()
+    trashed: list[File] = []
+
+    for file_instance in files:
+        original_path = file_instance.file.name
+        trash_name = _generate_trash_name(original_path)
+        # Files with the same name in different subfolders must not
+        # share a trash name, however fast the loop runs
+        while trash_name in trash_names:
+            trash_name = _generate_trash_name(original_path)
+        trash_names.add(trash_name)
+
+        file_instance.is_deleted = True
+        file_instance.deleted_at = deleted_at
+        file_instance.original_path = original_path
+        file_instance.trash_name = trash_name
+        file_instance.modified_at = deleted_at
+        trashed.append(file_instance)
+
+    File.all_objects.bulk_update(
+        trashed,
+        _SOFT_DELETE_FIELDS,
+        batch_size=_SOFT_DELETE_BATCH_SIZE,
+    )
+
+    logger.info('Moved %d files to trash', len(trashed))
+
+    return len(trashed)
+
+
+def restore_file(
+    file_or_id: File | int,
+    destination_path: str | None = None,
+) -> File:
     """Restore file from trash.
 
     Args:
-        file_id: ID of file to restore.
+        file_or_id: Trashed file to restore, or its ID. Passing an
+            already loaded instance saves a SELECT.
         destination_path: Optional new storage path. If None, restores to
             original_path.
 
@@ -92,7 +168,13 @@ def restore_file(file_id: int, destination_path: str | None = None) -> File:
     Raises:
         File.DoesNotExist: If file not found or not in trash.
     """
-    file_instance = File.all_objects.get(id=file_id, is_deleted=True)
+    if isinstance(file_or_id, File):
+        file_instance = file_or_id
+        if not file_instance.is_deleted:
+            raise File.DoesNotExist(f'File {file_instance.id} is not in trash')
+    else:
+        file_instance = File.all_objects.get(id=file_or_id, is_deleted=True)
+    file_id = file_instance.id
     user = file_instance.user
     original_storage_path = file_instance.original_path
 
@@ -180,7 +262,11 @@ def _ensure_parent_folder(user: _User, storage_path: str) -> None:
     """
     from django.core.files.base import ContentFile
 
-    from server.apps.files.logic.file_operations import file_exists, upload_file
+    from server.apps.files.logic.file_operations import (
+        file_exists,
+        files_with_prefix,
+        upload_file,
+    )
 
     path = Path(storage_path)
     parent = str(path.parent)
@@ -197,10 +283,7 @@ def _ensure_parent_folder(user: _User, storage_path: str) -> None:
         return
 
     # Check if any file exists in parent folder
-    if File.objects.filter(
-        user=user,
-        file__startswith=f'{parent}/',
-    ).exists():
+    if files_with_prefix(user, f'{parent}/').exists():
         return
 
     # Create marker file
@@ -209,36 +292,68 @@ def _ensure_parent_folder(user: _User, storage_path: str) -> None:
     upload_file(user, marker_path, marker_content)
 
 
-def permanent_delete_file(file_id: int) -> None:
+def permanent_delete_file(file_or_id: File | int) -> None:
     """Permanently delete file from trash.
 
-    Removes file from database and S3, decrements quota.
+    Removes file from database and S3, decrements quota. Uses the bulk
+    path (see purge_files()), so no model signals are dispatched. A row
+    locked by another transaction is waited for, so a missing row always
+    means the file was restored or deleted meanwhile.
 
     Args:
-        file_id: ID of file to permanently delete.
+        file_or_id: Trashed file to permanently delete, or its ID.
 
     Raises:
         File.DoesNotExist: If file not found or not in trash.
     """
-    file_instance = File.all_objects.get(id=file_id, is_deleted=True)
-    file_size = file_instance.size_bytes
-    file_user = file_instance.user
-    trash_name = file_instance.trash_name
+    file_id = file_or_id.id if isinstance(file_or_id, File) else file_or_id
+    deleted = purge_files(
+        File.all_objects.filter(id=file_id, is_deleted=True),
+    )
+    if not deleted:
+        raise File.DoesNotExist(f'File {file_id} is not in trash')
 
-    with transaction.atomic():
-        # Delete triggers post_delete signal for S3 cleanup
-        file_instance.delete()
-        # Decrement quota
-        decrement_usage(file_user, file_size)
+    logger.info('File permanently deleted (ID: %d)', file_id)
 
-    logger.info(
-        'File permanently deleted: %s (ID: %d, size: %d)',
-        trash_name,
-        file_id,
-        file_size,
+
+def permanent_delete_files(file_ids: list[int]) -> int:
+    """Permanently delete many files from trash in bulk.
+
+    IDs that are not (or no longer) in trash are ignored.
+
+    Args:
+        file_ids: IDs of trashed files to delete.
+
+    Returns:
+        Number of files deleted.
+    """
+    return purge_trash_files(
+        File.all_objects.filter(id__in=file_ids, is_deleted=True),
     )
 
 
+def purge_trash_files(
+    trashed: QuerySet[File],
+    *,
+    skip_locked: bool = False,
+) -> int:
+    """Permanently delete the trashed files selected by a queryset.
+
+    Background workers (e.g. parallel cleanup_trash runs) pass
+    skip_locked to each claim a disjoint set of rows, see purge_files().
+
+    Args:
+        trashed: Trashed files to delete; may be ordered and sliced.
+        skip_locked: Skip rows locked by other transactions.
+
+    Returns:
+        Number of files deleted.
+    """
+    count = purge_files(trashed, skip_locked=skip_locked)
+    logger.info('Permanently deleted %d files from trash', count)
+    return count
+
+
 def list_trash(user: _User) -> QuerySet[File]:
     """List all files in user's trash.
 
@@ -254,28 +369,53 @@ def list_trash(user: _User) -> QuerySet[File]:
     ).order_by('-deleted_at')
 
 
+def latest_trash_modified(user: _User) -> datetime | None:
+    """Get the most recent deletion time in user's trash.
+
+    Args:
+        user: User whose trash to inspect.
+
+    Returns:
+        Latest deleted_at timestamp, or None if trash is empty.
+    """
+    return list_trash(user).values_list(_DELETED_AT_FIELD, flat=True).first()
+
+
+def get_trash_state(user: _User) -> tuple[int, datetime | None]:
+    """Get a cheap fingerprint of user's trash contents.
+
+    Every soft delete, restore or permanent delete changes either the
+    number of trashed files or the latest deletion time, so the pair
+    can key caches of trash listings.
+
+    Args:
+        user: User whose trash to inspect.
+
+    Returns:
+        Tuple of (number of trashed files, latest deleted_at or None).
+    """
+    state = list_trash(user).order_by().aggregate(
+        count=Count('id'),
+        latest=Max(_DELETED_AT_FIELD),
+    )
+    return state['count'], state['latest']
+
+
 def empty_trash(user: _User) -> int:
     """Permanently delete all files in user's trash.
 
+    Runs a fixed number of bulk queries and batched storage deletes
+    regardless of trash size, see purge_files(). Waits for rows locked
+    by concurrent restores or purges instead of skipping them, so no
+    trashed file is left behind.
+
     Args:
         user: User whose trash to empty.
 
     Returns:
         Number of files deleted.
     """
-    trash_files = list(list_trash(user))
-    count = 0
-
-    for file_instance in trash_files:
-        try:
-            permanent_delete_file(file_instance.id)
-            count += 1
-        except Exception:
-            logger.exception(
-                'Failed to permanently delete file: %d',
-                file_instance.id,
-            )
-            raise
+    count = purge_files(list_trash(user).order_by())
 
     logger.info(
         'Trash emptied for user %s: %d files deleted',
@@ -299,8 +439,55 @@ def get_trash_file_by_name(user: _User, trash_name: str) -> File:
     Raises:
         File.DoesNotExist: If file not found.
     """
-    return File.all_objects.get(
+    file_instance = get_trash_files_by_names(user, [trash_name]).get(
+        trash_name,
+    )
+    if file_instance is None:
+        raise File.DoesNotExist(f'No trash file named {trash_name}')
+    return file_instance
+
+
+def get_trash_files_by_names(
+    user: _User,
+    trash_names: Iterable[str],
+) -> dict[str, File]:
+    """Get many trash files by their unique trash names in one query.
+
+    Built from a plain filter rather than in_bulk(), which only accepts
+    fields with a database unique constraint.
+
+    Args:
+        user: File owner.
+        trash_names: Unique trash filenames to look up.
+
+    Returns:
+        Dict of trash name to File instance; names not found in the
+        user's trash are omitted.
+    """
+    trashed = File.all_objects.filter(
         user=user,
         is_deleted=True,
-        trash_name=trash_name,
+        trash_name__in=list(trash_names),
     )
+    return {
+        file_instance.trash_name: file_instance for file_instance in trashed
+    }
+
+
+def find_trash_file_by_filename(user: _User, filename: str) -> File | None:
+    """Find trash file by its original filename.
+
+    Matches on the last component of original_path in the database, so
+    only the matching row is loaded. When several trashed files share a
+    filename, the most recently deleted one is returned.
+
+    Args:
+        user: File owner.
+        filename: Original filename (e.g., 'report.pdf').
+
+    Returns:
+        File instance, or None if not found.
+    """
+    return list_trash(user).filter(
+        original_path__endswith=f'/{filename}',
+    ).first()
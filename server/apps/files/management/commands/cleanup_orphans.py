@@ -0,0 +1,77 @@
+"""Management command to delete storage objects without file records."""
+
+from datetime import timedelta
+from typing import Any, Final
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from server.apps.files.logic.file_operations import delete_orphaned_objects
+
+_DEFAULT_MIN_AGE_HOURS: Final = 24
+
+
+class Command(BaseCommand):
+    """Delete objects in storage that no file record references."""
+
+    help = 'Clean up orphaned objects from storage'
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add command line arguments.
+
+        Args:
+            parser: Argument parser.
+        """
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be deleted without deleting',
+        )
+        parser.add_argument(
+            '--prefix',
+            default='',
+            help='Only scan storage paths with this prefix (e.g. "123/")',
+        )
+        parser.add_argument(
+            '--min-age-hours',
+            type=int,
+            default=_DEFAULT_MIN_AGE_HOURS,
+            help=(
+                'Skip objects modified more recently, e.g. uploads in '
+                f'progress (default: {_DEFAULT_MIN_AGE_HOURS})'
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Execute the cleanup command.
+
+        Args:
+            args: Positional arguments (unused).
+            options: Command options.
+        """
+        dry_run = options['dry_run']
+        cutoff = timezone.now() - timedelta(hours=options['min_age_hours'])
+
+        self.stdout.write(
+            f'Looking for orphaned objects modified before {cutoff}',
+        )
+
+        orphaned = delete_orphaned_objects(
+            options['prefix'],
+            cutoff,
+            dry_run=dry_run,
+        )
+
+        if dry_run:
+            for storage_path in orphaned:
+                self.stdout.write(f'Would delete: {storage_path}')
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Would delete {len(orphaned)} orphaned objects',
+                ),
+            )
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Deleted {len(orphaned)} orphaned objects'),
+        )
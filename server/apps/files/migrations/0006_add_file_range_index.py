@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:53
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Collate
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('files', '0005_add_soft_delete'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(
+                models.F('user'),
+                Collate('file', 'C'),
+                condition=models.Q(('is_deleted', False)),
+                name='files_user_file_range_idx',
+            ),
+        ),
+    ]
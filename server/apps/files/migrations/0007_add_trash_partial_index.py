@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-16 00:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('files', '0006_add_file_range_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='file',
+            name='files_user_trash_idx',
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(
+                condition=models.Q(('is_deleted', True)),
+                fields=['user', '-deleted_at'],
+                name='files_user_trash_idx',
+            ),
+        ),
+    ]
@@ -1,11 +1,17 @@
 """Database models for files app."""
 
-from pathlib import Path
 from typing import TYPE_CHECKING, Final, final, override
 
 from django.contrib.auth import get_user_model
 from django.db import models
 from django.db.models import QuerySet
+from django.db.models.functions import Collate
+
+from server.apps.files.infrastructure.metadata import (
+    extract_filename,
+    extract_folder_path,
+    get_file_extension,
+)
 
 User = get_user_model()
 
@@ -133,15 +139,25 @@ class File(models.Model):
                 fields=['user', 'file'],
                 name='files_user_file_idx',
             ),
+            # Optimize byte-ordered range scans over storage paths
+            # (see `files_with_prefix`)
+            models.Index(
+                models.F('user'),
+                Collate('file', 'C'),
+                name='files_user_file_range_idx',
+                condition=models.Q(is_deleted=False),
+            ),
             # Optimize recent files queries
             models.Index(
                 fields=['user', '-uploaded_at'],
                 name='files_user_recent_idx',
             ),
-            # Optimize trash listing queries
+            # Optimize trash listing queries (newest first); partial, so
+            # active files, the vast majority, are not indexed
             models.Index(
-                fields=['user', 'is_deleted', 'deleted_at'],
+                fields=['user', '-deleted_at'],
                 name='files_user_trash_idx',
+                condition=models.Q(is_deleted=True),
             ),
             # Optimize trash lookup by name
             models.Index(
@@ -160,8 +176,18 @@ class File(models.Model):
 
     @override
     def __str__(self) -> str:
-        """String representation."""
-        return f'{self.user.username}:{self.file.name}'
+        """String representation.
+
+        Falls back to the owner's ID when the user is not loaded, so
+        listing many files (e.g. admin action logs) does not fetch each
+        owner separately.
+        """
+        if File.user.is_cached(self):
+            owner = self.user.username
+        else:
+            owner = str(self.user_id)
+        storage_path = self.file.name
+        return f'{owner}:{storage_path}'
 
     def get_folder_path(self) -> str:
         """Extract folder path from file.name.
@@ -171,7 +197,7 @@ class File(models.Model):
         Returns:
             Folder path (parent directory of file).
         """
-        return str(Path(self.file.name).parent)
+        return extract_folder_path(self.file.name)
 
     def get_filename(self) -> str:
         """Extract filename from file.name.
@@ -181,7 +207,7 @@ class File(models.Model):
         Returns:
             Filename without path.
         """
-        return Path(self.file.name).name
+        return extract_filename(self.file.name)
 
     def get_extension(self) -> str:
         """Extract file extension.
@@ -191,8 +217,7 @@ class File(models.Model):
         Returns:
             Extension without dot (lowercase).
         """
-        extension = Path(self.file.name).suffix
-        return extension.lstrip('.').lower()
+        return get_file_extension(self.file.name)
 
     def get_url(self) -> str:
         """Get download URL for file.
@@ -256,7 +281,8 @@ class Tag(models.Model):
     @override
     def __str__(self) -> str:
         """String representation."""
-        return f'{self.user.username}:{self.name}'
+        owner = self.user.username
+        return f'{owner}:{self.name}'
 
 
 # Default quota: 10 GB in bytes
@@ -311,7 +337,8 @@ class UserQuota(models.Model):
     @override
     def __str__(self) -> str:
         """String representation."""
-        return f'{self.user.username}: {self.used_bytes}/{self.quota_bytes}'
+        owner = self.user.username
+        return f'{owner}: {self.used_bytes}/{self.quota_bytes}'
 
     def has_space_for(self, size_bytes: int) -> bool:
         """Check if there's enough space for the given size.
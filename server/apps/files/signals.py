@@ -1,8 +1,10 @@
 """Signal handlers for files app."""
 
 import logging
+from functools import partial
 
 from django.core.files.storage import default_storage
+from django.db import transaction
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
 
@@ -31,21 +33,28 @@ def delete_file_from_storage(
     if not instance.file:
         return
 
-    storage_name = instance.file.name
+    # Defer the S3 calls until the delete commits, so a rolled back
+    # delete never loses content and the transaction is not held open
+    # across storage round-trips
+    transaction.on_commit(
+        partial(_delete_from_storage, instance.file.name),
+    )
+
+
+def _delete_from_storage(storage_name: str) -> None:
+    """Delete a committed-deleted file's content from storage.
+
+    Args:
+        storage_name: Storage path of the deleted file.
+    """
     logger.info(
         'Deleting file from storage after DB delete: %s',
         storage_name,
     )
 
     try:
-        if default_storage.exists(storage_name):
-            default_storage.delete(storage_name)
-            logger.info('File deleted from storage: %s', storage_name)
-        else:
-            logger.warning(
-                'File not found in storage (already deleted?): %s',
-                storage_name,
-            )
+        # S3 deletes are idempotent, so no existence check round-trip
+        default_storage.delete(storage_name)
     except Exception:
         # Log error but don't raise - DB delete already succeeded
         # Orphaned file can be cleaned up by background job
@@ -53,3 +62,5 @@ def delete_file_from_storage(
             'Failed to delete file from storage (orphaned): %s',
             storage_name,
         )
+    else:
+        logger.info('File deleted from storage: %s', storage_name)
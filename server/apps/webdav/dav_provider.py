@@ -5,7 +5,6 @@ Django models and S3 storage.
 """
 
 import logging
-from pathlib import Path
 from typing import TYPE_CHECKING, final, override
 
 from wsgidav.dav_provider import DAVCollection, DAVNonCollection, DAVProvider
@@ -13,9 +12,15 @@ from wsgidav.dav_provider import DAVCollection, DAVNonCollection, DAVProvider
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
 
-from server.apps.files.models import File
+from server.apps.files.logic.file_operations import resolve_storage_path
+from server.apps.files.logic.trash_operations import (
+    find_trash_file_by_filename,
+)
 from server.apps.webdav.path_mapper import PathMapper
-from server.apps.webdav.resources.base import get_user_from_environ
+from server.apps.webdav.resources.base import (
+    ENVIRON_TRASH_KEY,
+    get_user_from_environ,
+)
 from server.apps.webdav.resources.collection import FolderCollection
 from server.apps.webdav.resources.file_resource import FileResource
 from server.apps.webdav.resources.trash_collection import TrashCollection
@@ -85,29 +90,16 @@ class DjangoDAVProvider(DAVProvider):
         # Convert to storage path
         storage_path = path_mapper.to_storage_path(path)
 
-        # Check if it's an existing file
-        try:
-            file_instance = File.objects.get(
-                user=user,
-                file=storage_path,
-            )
+        # Look up the file, or files under the folder, in one query
+        file_instance, is_folder = resolve_storage_path(user, storage_path)
+        if file_instance is not None:
             return FileResource(
                 path,
                 environ,
                 file_instance,
                 path_mapper,
             )
-        except File.DoesNotExist:
-            pass
-
-        # Check if it's a folder (has files with this prefix)
-        folder_prefix = storage_path.rstrip('/') + '/'
-        has_children = File.objects.filter(
-            user=user,
-            file__startswith=folder_prefix,
-        ).exists()
-
-        if has_children:
+        if is_folder:
             return FolderCollection(path, environ, user, path_mapper)
 
         # Path doesn't exist
@@ -142,20 +134,20 @@ class DjangoDAVProvider(DAVProvider):
         if not trash_item:
             return None
 
-        # Find file by original filename
-        files = File.all_objects.filter(
-            user=user,
-            is_deleted=True,
+        # Reuse trash listed earlier in this request, else fetch one row
+        preload = environ.get(ENVIRON_TRASH_KEY)
+        if preload is None:
+            file_obj = find_trash_file_by_filename(user, trash_item)
+        else:
+            file_obj = preload.get(trash_item)
+        if file_obj is None:
+            return None
+        return TrashFileResource(
+            path,
+            environ,
+            file_obj,
+            path_mapper,
         )
-        for file_obj in files:
-            if Path(file_obj.original_path).name == trash_item:
-                return TrashFileResource(
-                    path,
-                    environ,
-                    file_obj,
-                    path_mapper,
-                )
-        return None
 
     @override
     def is_readonly(self) -> bool:
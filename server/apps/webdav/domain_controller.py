@@ -8,8 +8,10 @@ Django's User model.
 import logging
 from typing import TYPE_CHECKING, Final, final, override
 
-from django.contrib.auth import authenticate
+from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
 from django.core.handlers.wsgi import WSGIRequest
+from django.utils.crypto import constant_time_compare, salted_hmac
 from wsgidav.dc.base_dc import BaseDomainController
 
 if TYPE_CHECKING:
@@ -20,6 +22,11 @@ logger = logging.getLogger(__name__)
 # Key to store authenticated user in WSGI environ
 ENVIRON_USER_KEY: Final = 'webdav.user'
 
+# How long verified Basic Auth credentials skip the password hasher
+_AUTH_CACHE_TIMEOUT: Final = 60
+_AUTH_CACHE_KEY_SALT: Final = 'webdav.basic_auth'
+_CACHED_USER_FIELDS: Final = ('id', 'username', 'password', 'is_active')
+
 
 @final
 class DjangoDomainController(BaseDomainController):
@@ -88,6 +95,8 @@ class DjangoDomainController(BaseDomainController):
 
         Validates credentials against Django's authentication system
         and stores the authenticated user in the WSGI environ.
+        Successful logins are cached briefly, so repeated requests with
+        the same credentials skip password hashing.
 
         Args:
             realm_name: Realm name.
@@ -100,23 +109,19 @@ class DjangoDomainController(BaseDomainController):
         """
         logger.debug('Authenticating user: %s', user_name)
 
-        # Create Django request from WSGI environ for django-axes compatibility
-        request = WSGIRequest(environ)
-
-        # Authenticate using Django
-        user: User | None = authenticate(
-            request=request,
-            username=user_name,
-            password=password,
-        )
-
+        # WebDAV clients resend credentials on every request, so skip the
+        # deliberately slow password hasher for recently verified ones
+        cache_key = _get_auth_cache_key(user_name, password)
+        user = _get_cached_user(cache_key)
         if user is None:
-            logger.warning('Authentication failed for user: %s', user_name)
-            return False
-
-        if not user.is_active:
-            logger.warning('Inactive user attempted login: %s', user_name)
-            return False
+            user = _authenticate(user_name, password, environ)
+            if user is None:
+                return False
+            cache.set(
+                cache_key,
+                (user.pk, user.get_session_auth_hash()),
+                _AUTH_CACHE_TIMEOUT,
+            )
 
         # Store authenticated user in environ for provider access
         environ[ENVIRON_USER_KEY] = user
@@ -133,3 +138,91 @@ class DjangoDomainController(BaseDomainController):
             False - only Basic Auth is supported.
         """
         return False
+
+
+def _authenticate(
+    user_name: str,
+    password: str,
+    environ: dict,
+) -> 'User | None':
+    """Verify credentials with Django's authentication backends.
+
+    Args:
+        user_name: Username from Basic Auth.
+        password: Password from Basic Auth.
+        environ: WSGI environ dictionary.
+
+    Returns:
+        Authenticated active user, or None if authentication failed.
+    """
+    # Create Django request from WSGI environ for django-axes compatibility
+    request = WSGIRequest(environ)
+
+    # Authenticate using Django
+    user: User | None = authenticate(
+        request=request,
+        username=user_name,
+        password=password,
+    )
+
+    if user is None:
+        logger.warning('Authentication failed for user: %s', user_name)
+        return None
+
+    if not user.is_active:
+        logger.warning('Inactive user attempted login: %s', user_name)
+        return None
+
+    return user
+
+
+def _get_auth_cache_key(user_name: str, password: str) -> str:
+    """Build cache key for a username and password pair.
+
+    The key is an HMAC keyed with SECRET_KEY, so the password cannot be
+    recovered from it.
+
+    Args:
+        user_name: Username from Basic Auth.
+        password: Password from Basic Auth.
+
+    Returns:
+        Cache key string.
+    """
+    digest = salted_hmac(
+        _AUTH_CACHE_KEY_SALT,
+        f'{user_name}\0{password}',
+        algorithm='sha256',
+    ).hexdigest()
+    return f'webdav:auth:{digest}'
+
+
+def _get_cached_user(cache_key: str) -> 'User | None':
+    """Get user for recently verified credentials.
+
+    Only successful logins are cached, so failed attempts always reach
+    django-axes. The entry is dropped when the user has been deactivated
+    or their password changed since it was cached.
+
+    Args:
+        cache_key: Key from _get_auth_cache_key().
+
+    Returns:
+        Active user, or None if the credentials must be verified again.
+    """
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+
+    user_id, auth_hash = cached
+    # Only what WebDAV handling and the password check use
+    user = get_user_model().objects.only(
+        *_CACHED_USER_FIELDS,
+    ).filter(pk=user_id, is_active=True).first()
+    if user is None or not constant_time_compare(
+        user.get_session_auth_hash(),
+        auth_hash,
+    ):
+        cache.delete(cache_key)
+        return None
+    return user
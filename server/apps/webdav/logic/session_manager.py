@@ -6,10 +6,14 @@ Tracks active WebDAV sessions and enforces per-user limits.
 import logging
 import secrets
 from datetime import timedelta
-from typing import TYPE_CHECKING, Final
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.signals import setting_changed
 from django.db import transaction
+from django.dispatch import receiver
 from django.utils import timezone
 
 from server.apps.webdav.models import WebDAVSession
@@ -22,25 +26,51 @@ logger = logging.getLogger(__name__)
 # Session ID length in bytes (generates 32 hex chars)
 _SESSION_ID_BYTES: Final = 16
 
+# Settings read by the cached getters below
+_SESSION_SETTINGS: Final = frozenset((
+    'WEBDAV_SESSION_LIMIT',
+    'WEBDAV_SESSION_TIMEOUT',
+))
 
+
+@lru_cache(maxsize=1)
 def get_session_limit() -> int:
     """Get maximum concurrent sessions per user.
 
+    Read once per process, as it is needed on every session creation;
+    overrides clear the cache, see _clear_session_settings().
+
     Returns:
         Session limit from settings or default of 5.
     """
     return getattr(settings, 'WEBDAV_SESSION_LIMIT', 5)
 
 
+@lru_cache(maxsize=1)
 def get_session_timeout() -> int:
     """Get session timeout in seconds.
 
+    Cached like get_session_limit().
+
     Returns:
         Timeout in seconds from settings or default of 1800 (30 min).
     """
     return getattr(settings, 'WEBDAV_SESSION_TIMEOUT', 1800)
 
 
+@receiver(setting_changed)
+def _clear_session_settings(*, setting: str, **kwargs: Any) -> None:
+    """Drop cached session settings when they are overridden.
+
+    Args:
+        setting: Name of the changed setting.
+        kwargs: Other signal arguments (unused).
+    """
+    if setting in _SESSION_SETTINGS:
+        get_session_limit.cache_clear()
+        get_session_timeout.cache_clear()
+
+
 def create_session(
     user: 'User',
     ip_address: str,
@@ -65,14 +95,17 @@ def create_session(
     # Clean stale sessions first
     cleanup_stale_sessions()
 
+    limit = get_session_limit()
+
     with transaction.atomic():
-        # Row-level locking prevents race condition when checking limit
-        active_count = (
-            WebDAVSession.objects.select_for_update()
-            .filter(user=user)
-            .count()
+        # Lock the owner row to serialize concurrent logins of one user.
+        # COUNT(*) cannot take row locks, and locking existing sessions
+        # would not block concurrent inserts anyway.
+        get_user_model().objects.select_for_update().values('pk').get(
+            pk=user.pk,
         )
-        limit = get_session_limit()
+        # The guard only needs to know whether the limit is reached
+        active_count = WebDAVSession.objects.filter(user=user)[:limit].count()
 
         if active_count >= limit:
             logger.warning(
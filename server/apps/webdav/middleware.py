@@ -0,0 +1,195 @@
+"""WSGI middleware for the WebDAV application."""
+
+import hashlib
+import time
+from collections.abc import Callable, Iterable
+from io import BytesIO
+from typing import Any, Final, cast, final, override
+
+from django.core.cache import cache
+from wsgidav.mw.base_mw import BaseMiddleware
+
+from server.apps.files.logic.trash_operations import get_trash_state
+from server.apps.webdav.domain_controller import ENVIRON_USER_KEY
+from server.apps.webdav.path_mapper import PathMapper
+
+# WSGI environ key holding the request start time (Unix timestamp)
+REQUEST_TIME_KEY: Final = 'webdav.request_time'
+
+# Upper bound on how long a cached trash PROPFIND response is kept
+_PROPFIND_CACHE_TIMEOUT: Final = 60 * 60
+
+
+@final
+class RequestTimeMiddleware(BaseMiddleware):  # type: ignore[misc]
+    """Stamp each request with its start time.
+
+    Resources use the stamp as a fallback modification time, so every
+    timestamp in one response is consistent and no clock call is made
+    per collection.
+    """
+
+    @override
+    def __call__(
+        self,
+        environ: dict[str, Any],
+        start_response: Callable[..., Any],
+    ) -> Iterable[bytes]:
+        """Record request time and pass the request on.
+
+        Args:
+            environ: WSGI environ dictionary.
+            start_response: WSGI start_response callable.
+
+        Returns:
+            Response body iterable from the next application.
+        """
+        environ[REQUEST_TIME_KEY] = time.time()
+        return cast('Iterable[bytes]', self.next_app(environ, start_response))
+
+
+@final
+class TrashPropfindCacheMiddleware(BaseMiddleware):  # type: ignore[misc]
+    """Serve repeated PROPFIND requests on /.Trash/ from Django's cache.
+
+    Trash contents change rarely, while clients re-list them on every
+    folder visit. The multistatus response is cached per user, keyed by
+    the trash state (count and latest deletion time, one aggregate
+    query), the Depth header and the request body. Any trash change
+    therefore produces a new key and stale entries simply expire.
+
+    Must run after HTTPAuthenticator, which puts the user in environ.
+    """
+
+    @override
+    def __call__(
+        self,
+        environ: dict[str, Any],
+        start_response: Callable[..., Any],
+    ) -> Iterable[bytes]:
+        """Serve a cached trash listing or cache a fresh one.
+
+        Args:
+            environ: WSGI environ dictionary.
+            start_response: WSGI start_response callable.
+
+        Returns:
+            Response body iterable.
+        """
+        user = environ.get(ENVIRON_USER_KEY)
+        if (
+            user is None
+            or environ.get('REQUEST_METHOD') != 'PROPFIND'
+            or 'HTTP_TRANSFER_ENCODING' in environ
+            or not PathMapper(user.id).is_trash_root(
+                environ.get('PATH_INFO', ''),
+            )
+        ):
+            return cast(
+                'Iterable[bytes]',
+                self.next_app(environ, start_response),
+            )
+
+        cache_key = self._get_cache_key(environ, user)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            status, headers, body = cached
+            start_response(status, headers)
+            return [body]
+
+        return self._call_and_cache(environ, start_response, cache_key)
+
+    def _get_cache_key(self, environ: dict[str, Any], user: Any) -> str:
+        """Build cache key, buffering the request body for reuse.
+
+        Args:
+            environ: WSGI environ dictionary.
+            user: Authenticated Django user.
+
+        Returns:
+            Cache key string.
+        """
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        body = environ['wsgi.input'].read(length) if length else b''
+        environ['wsgi.input'] = BytesIO(body)
+
+        count, latest = get_trash_state(user)
+        latest_ts = latest.timestamp() if latest else 0
+        depth = environ.get('HTTP_DEPTH', 'infinity')
+        digest = hashlib.sha256(body).hexdigest()
+        key_parts = (
+            'webdav:propfind',
+            user.id,
+            count,
+            latest_ts,
+            depth,
+            digest,
+        )
+        return ':'.join(str(part) for part in key_parts)
+
+    def _call_and_cache(
+        self,
+        environ: dict[str, Any],
+        start_response: Callable[..., Any],
+        cache_key: str,
+    ) -> Iterable[bytes]:
+        """Run the request and cache successful multistatus responses.
+
+        Args:
+            environ: WSGI environ dictionary.
+            start_response: WSGI start_response callable.
+            cache_key: Key to store the response under.
+
+        Returns:
+            Response body iterable.
+        """
+        captured: dict[str, Any] = {}
+
+        def capture_start_response(  # noqa: WPS430
+            status: str,
+            headers: list[tuple[str, str]],
+            exc_info: Any = None,
+        ) -> Any:
+            captured.update(status=status, headers=headers)
+            return start_response(status, headers, exc_info)
+
+        response = cast(
+            'Iterable[bytes]',
+            self.next_app(environ, capture_start_response),
+        )
+        try:  # noqa: WPS501
+            body = b''.join(response)
+        finally:
+            if hasattr(response, 'close'):
+                response.close()
+
+        status, headers = captured['status'], captured['headers']
+        if status.startswith('207'):
+            # Date must reflect when the cached copy is served
+            cached_headers = [
+                header for header in headers if header[0].lower() != 'date'
+            ]
+            cache.set(
+                cache_key,
+                (status, cached_headers, body),
+                _PROPFIND_CACHE_TIMEOUT,
+            )
+        return [body]
+
+
+def get_request_time(environ: dict[str, Any]) -> float:
+    """Get request start time from environ.
+
+    Falls back to the current time when the request did not pass
+    through RequestTimeMiddleware (e.g. resources built in tests).
+
+    Args:
+        environ: WSGI environ dictionary.
+
+    Returns:
+        Unix timestamp.
+    """
+    request_time = environ.get(REQUEST_TIME_KEY)
+    if request_time is None:
+        return time.time()
+    return float(request_time)
@@ -11,6 +11,8 @@ _PATH_SEPARATOR: Final = '/'
 
 # Special trash path
 _TRASH_PATH: Final = '/.Trash'
+_TRASH_PATH_PREFIX: Final = f'{_TRASH_PATH}{_PATH_SEPARATOR}'
+_TRASH_ITEM_PREFIX: Final = '.Trash/'
 
 
 @final
@@ -23,6 +25,13 @@ class PathMapper:
     This class handles all path translation and validation.
     """
 
+    __slots__ = (
+        '_storage_prefix',
+        '_storage_prefix_length',
+        '_storage_root',
+        '_user_id',
+    )
+
     def __init__(self, user_id: int) -> None:
         """Initialize path mapper with user ID.
 
@@ -30,6 +39,11 @@ class PathMapper:
             user_id: ID of the authenticated user.
         """
         self._user_id = user_id
+        # Storage root and key prefix never change for a user, so they
+        # are formatted once instead of on every translation
+        self._storage_root = str(user_id)
+        self._storage_prefix = f'{user_id}{_PATH_SEPARATOR}'
+        self._storage_prefix_length = len(self._storage_prefix)
 
     @property
     def user_id(self) -> int:
@@ -50,10 +64,10 @@ class PathMapper:
 
         # Handle root path
         if not normalized:
-            return str(self._user_id)
+            return self._storage_root
 
         # Prepend user ID
-        return f'{self._user_id}/{normalized}'
+        return self._storage_prefix + normalized
 
     def to_webdav_path(self, storage_path: str) -> str:
         """Convert storage path to WebDAV path.
@@ -68,13 +82,12 @@ class PathMapper:
         normalized = storage_path.strip(_PATH_SEPARATOR)
 
         # Handle root path (just user ID)
-        if normalized == str(self._user_id):
+        if normalized == self._storage_root:
             return _PATH_SEPARATOR
 
         # Remove user ID prefix
-        prefix = f'{self._user_id}/'
-        if normalized.startswith(prefix):
-            return _PATH_SEPARATOR + normalized[len(prefix):]
+        if normalized.startswith(self._storage_prefix):
+            return _PATH_SEPARATOR + normalized[self._storage_prefix_length:]
 
         # If path doesn't match user, return as-is with leading slash
         return _PATH_SEPARATOR + normalized
@@ -90,11 +103,7 @@ class PathMapper:
             Returns / for root-level items.
         """
         normalized = webdav_path.strip(_PATH_SEPARATOR)
-
-        if not normalized or _PATH_SEPARATOR not in normalized:
-            return _PATH_SEPARATOR
-
-        parent = normalized.rsplit(_PATH_SEPARATOR, 1)[0]
+        parent = normalized.rpartition(_PATH_SEPARATOR)[0]
         return _PATH_SEPARATOR + parent
 
     def get_name(self, webdav_path: str) -> str:
@@ -108,14 +117,7 @@ class PathMapper:
             Returns empty string for root path.
         """
         normalized = webdav_path.strip(_PATH_SEPARATOR)
-
-        if not normalized:
-            return ''
-
-        if _PATH_SEPARATOR in normalized:
-            return normalized.rsplit(_PATH_SEPARATOR, 1)[1]
-
-        return normalized
+        return normalized.rpartition(_PATH_SEPARATOR)[2]
 
     def join_paths(self, parent: str, name: str) -> str:
         """Join parent path and name to create full WebDAV path.
@@ -131,10 +133,11 @@ class PathMapper:
         name_normalized = name.strip(_PATH_SEPARATOR)
 
         if not parent_normalized:
-            return _PATH_SEPARATOR + name_normalized
-
-        joined = parent_normalized + _PATH_SEPARATOR + name_normalized
-        return _PATH_SEPARATOR + joined
+            return f'{_PATH_SEPARATOR}{name_normalized}'
+        return (
+            f'{_PATH_SEPARATOR}{parent_normalized}'
+            f'{_PATH_SEPARATOR}{name_normalized}'
+        )
 
     def is_root(self, webdav_path: str) -> bool:
         """Check if path is the root directory.
@@ -158,7 +161,8 @@ class PathMapper:
         Returns:
             True if path is valid and safe.
         """
-        # Check for path traversal attempts
+        # Check for path traversal attempts; a plain substring scan also
+        # rejects names like 'a..b', which is deliberately conservative
         if '..' in webdav_path:
             return False
 
@@ -176,7 +180,7 @@ class PathMapper:
         """
         normalized = webdav_path.rstrip(_PATH_SEPARATOR)
         return normalized == _TRASH_PATH or normalized.startswith(
-            _TRASH_PATH + _PATH_SEPARATOR,
+            _TRASH_PATH_PREFIX,
         )
 
     def is_trash_root(self, webdav_path: str) -> bool:
@@ -200,7 +204,6 @@ class PathMapper:
             Item name (e.g., report.pdf), empty string if not a trash item.
         """
         normalized = webdav_path.strip(_PATH_SEPARATOR)
-        prefix = '.Trash/'
-        if normalized.startswith(prefix):
-            return normalized[len(prefix):]
+        if normalized.startswith(_TRASH_ITEM_PREFIX):
+            return normalized[len(_TRASH_ITEM_PREFIX):]
         return ''
@@ -1,12 +1,19 @@
 """Base utilities for WebDAV resources."""
 
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
+from server.apps.files.logic.trash_operations import list_trash
 from server.apps.webdav.domain_controller import ENVIRON_USER_KEY
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
 
+    from server.apps.files.models import File
+
+# Key to cache the user's trash (by original filename) for one request
+ENVIRON_TRASH_KEY: Final = 'webdav.trash_preload'
+
 
 def get_user_from_environ(environ: dict) -> 'User':
     """Get authenticated Django user from WSGI environ.
@@ -22,3 +29,37 @@ def get_user_from_environ(environ: dict) -> 'User':
                   if domain controller is working correctly).
     """
     return environ[ENVIRON_USER_KEY]
+
+
+def get_trash_preload(environ: dict, user: 'User') -> dict[str, 'File']:
+    """Get user's trash keyed by original filename, loaded once per request.
+
+    A PROPFIND on /.Trash/ lists member names and then resolves every
+    member; sharing one query through environ keeps that O(1) in
+    database round-trips. When several trashed files share a name, the
+    most recently deleted one wins.
+
+    Args:
+        environ: WSGI environ dictionary.
+        user: Authenticated Django user.
+
+    Returns:
+        Dict of original filename to File instance.
+    """
+    preload = environ.get(ENVIRON_TRASH_KEY)
+    if preload is None:
+        preload = {}
+        for file_obj in list_trash(user):
+            name = Path(file_obj.original_path).name
+            preload.setdefault(name, file_obj)
+        environ[ENVIRON_TRASH_KEY] = preload
+    return preload
+
+
+def clear_trash_preload(environ: dict) -> None:
+    """Drop the cached trash after it has been modified.
+
+    Args:
+        environ: WSGI environ dictionary.
+    """
+    environ.pop(ENVIRON_TRASH_KEY, None)
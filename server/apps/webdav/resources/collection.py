@@ -1,15 +1,24 @@
 """WebDAV folder collection (DAVCollection) implementation."""
 
 import logging
-from datetime import UTC, datetime
+from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING, final, override
 
+from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
+from wsgidav.dav_error import HTTP_PRECONDITION_FAILED, DAVError
 from wsgidav.dav_provider import DAVCollection
 
-from server.apps.files.logic.file_operations import upload_file
-from server.apps.files.logic.trash_operations import soft_delete_file
+from server.apps.files.logic.file_operations import (
+    files_with_prefix,
+    list_folder_children,
+    resolve_storage_path,
+    upload_file,
+)
+from server.apps.files.logic.trash_operations import soft_delete_files
 from server.apps.files.models import File
+from server.apps.webdav.middleware import get_request_time
 from server.apps.webdav.path_mapper import PathMapper
 from server.apps.webdav.resources.file_resource import (
     FileResource,
@@ -56,6 +65,8 @@ class FolderCollection(DAVCollection):
     that starts with the folder path.
     """
 
+    __slots__ = ('_path_mapper', '_user')
+
     def __init__(
         self,
         path: str,
@@ -92,26 +103,15 @@ class FolderCollection(DAVCollection):
         """Get folder modification timestamp.
 
         Returns the most recent modification time of any file in folder.
+        Shares one grouped query with get_member_names().
 
         Returns:
             Unix timestamp.
         """
-        storage_prefix = self._path_mapper.to_storage_path(self.path)
-
-        # Get most recently modified file in this folder
-        latest_file = (
-            File.objects.filter(
-                user=self._user,
-                file__startswith=storage_prefix,
-            )
-            .order_by('-modified_at')
-            .first()
-        )
-
-        if latest_file:
-            return latest_file.modified_at.timestamp()
+        if self._children:
+            return max(self._children.values()).timestamp()
 
-        return datetime.now(tz=UTC).timestamp()
+        return get_request_time(self.environ)
 
     @override
     def get_member_names(self) -> list[str]:
@@ -123,47 +123,17 @@ class FolderCollection(DAVCollection):
         Returns:
             List of member names (filenames and folder names).
         """
-        storage_path = self._path_mapper.to_storage_path(self.path)
-
-        # Handle root vs subfolder differently
-        if self._path_mapper.is_root(self.path):
-            prefix = f'{self._user.id}/'
-        else:
-            prefix = storage_path.rstrip('/') + '/'
-
-        # Get all files under this prefix
-        files = File.objects.filter(
-            user=self._user,
-            file__startswith=prefix,
-        ).values_list('file', flat=True)
-
-        # Extract direct children
-        members: set[str] = set()
-        prefix_len = len(prefix)
-
-        for file_path in files:
-            # Get the path after the prefix
-            remainder = file_path[prefix_len:]
-
-            # Get the first path component
-            if '/' in remainder:
-                # This is a file in a subfolder - add the subfolder name
-                folder_name = remainder.split('/')[0]
-                members.add(folder_name)
-            else:
-                # This is a direct child file
-                members.add(remainder)
-
         # Filter out hidden files (markers, .DS_Store, AppleDouble ._* files)
-        members = {m for m in members if not _is_hidden_file(m)}
+        members = {
+            name for name in self._children if not _is_hidden_file(name)
+        }
 
-        # Add .Trash to root if user has deleted files
+        # Add .Trash to root if user has deleted files (only queried there)
         is_root = self._path_mapper.is_root(self.path)
-        has_trash = File.all_objects.filter(
+        if is_root and File.all_objects.filter(
             user=self._user,
             is_deleted=True,
-        ).exists()
-        if is_root and has_trash:
+        ).exists():
             members.add('.Trash')
 
         return sorted(members)
@@ -196,29 +166,19 @@ class FolderCollection(DAVCollection):
         child_path = self._path_mapper.join_paths(self.path, name)
         storage_path = self._path_mapper.to_storage_path(child_path)
 
-        # Check if it's a file
-        try:
-            file_instance = File.objects.get(
-                user=self._user,
-                file=storage_path,
-            )
+        # One query tells a file from a folder (has files with this prefix)
+        file_instance, is_folder = resolve_storage_path(
+            self._user,
+            storage_path,
+        )
+        if file_instance is not None:
             return FileResource(
                 child_path,
                 self.environ,
                 file_instance,
                 self._path_mapper,
             )
-        except File.DoesNotExist:
-            pass
-
-        # Check if it's a folder (has files with this prefix)
-        folder_prefix = storage_path.rstrip('/') + '/'
-        has_children = File.objects.filter(
-            user=self._user,
-            file__startswith=folder_prefix,
-        ).exists()
-
-        if has_children:
+        if is_folder:
             return FolderCollection(
                 child_path,
                 self.environ,
@@ -229,6 +189,57 @@ class FolderCollection(DAVCollection):
         # Member doesn't exist
         raise ValueError(f'Member not found: {name}')
 
+    @override
+    def get_member_list(self) -> list['DAVNonCollection | DAVCollection']:
+        """Get resources for all direct children.
+
+        A depth-1 PROPFIND resolves every member; files are loaded with
+        one query for the whole listing instead of one get_member()
+        lookup per child. Members that are not files are subfolders,
+        since names come from the folder's own listing.
+
+        Returns:
+            List of FileResource and collection instances.
+        """
+        names = self.get_member_names()
+        child_paths = {
+            name: self._path_mapper.join_paths(self.path, name)
+            for name in names
+        }
+        storage_paths = {
+            self._path_mapper.to_storage_path(child_path): name
+            for name, child_path in child_paths.items()
+        }
+        files_by_name = {
+            storage_paths[file_instance.file.name]: file_instance
+            for file_instance in File.objects.filter(
+                user=self._user,
+                file__in=list(storage_paths),
+            )
+        }
+
+        is_root = self._path_mapper.is_root(self.path)
+        members: list[DAVNonCollection | DAVCollection] = []
+        for name, child_path in child_paths.items():
+            file_instance = files_by_name.get(name)
+            if name == '.Trash' and is_root:
+                members.append(self.get_member(name))
+            elif file_instance is None:
+                members.append(FolderCollection(
+                    child_path,
+                    self.environ,
+                    self._user,
+                    self._path_mapper,
+                ))
+            else:
+                members.append(FileResource(
+                    child_path,
+                    self.environ,
+                    file_instance,
+                    self._path_mapper,
+                ))
+        return members
+
     @override
     def create_empty_resource(self, name: str) -> 'DAVNonCollection':
         """Create placeholder for a new file (before PUT content).
@@ -293,32 +304,17 @@ class FolderCollection(DAVCollection):
 
         Moves all files in this folder to trash.
         """
-        storage_path = self._path_mapper.to_storage_path(self.path)
-        prefix = storage_path.rstrip('/') + '/'
-
         logger.info(
             'Soft deleting folder and contents: %s (prefix: %s)',
             self.path,
-            prefix,
+            self._storage_prefix,
         )
 
-        # Get all files in this folder
-        files = File.objects.filter(
-            user=self._user,
-            file__startswith=prefix,
+        # Move all files in this folder to trash in bulk
+        soft_delete_files(
+            files_with_prefix(self._user, self._storage_prefix).only('file'),
         )
 
-        # Soft delete each file
-        for file_instance in files:
-            try:
-                soft_delete_file(file_instance.id)
-            except Exception:
-                logger.exception(
-                    'Failed to soft delete file in folder: %s',
-                    file_instance.file.name,
-                )
-                raise
-
     @override
     def support_recursive_delete(self) -> bool:
         """Check if recursive delete is supported.
@@ -362,39 +358,45 @@ class FolderCollection(DAVCollection):
 
         Args:
             dest_path: Destination WebDAV path.
+
+        Raises:
+            DAVError: HTTP 412 if a destination file is taken.
         """
-        from server.apps.files.logic.file_operations import move_file
+        from server.apps.files.logic.file_operations import move_folder
 
         # Convert paths
         source_storage_prefix = self._path_mapper.to_storage_path(self.path)
         dest_storage_prefix = self._path_mapper.to_storage_path(dest_path)
 
-        # Normalize prefixes (ensure trailing slash)
-        source_prefix = source_storage_prefix.rstrip('/') + '/'
-        dest_prefix = dest_storage_prefix.rstrip('/') + '/'
+        try:
+            moved_count = move_folder(
+                self._user,
+                source_storage_prefix,
+                dest_storage_prefix,
+            )
+        except ValidationError as exc:
+            raise DAVError(HTTP_PRECONDITION_FAILED, str(exc)) from exc
+
+        logger.info('Moved %d files', moved_count)
 
-        logger.info(
-            'Moving folder from %s to %s',
-            source_prefix,
-            dest_prefix,
-        )
+    @cached_property
+    def _children(self) -> dict[str, datetime]:
+        """Direct children with latest modification, loaded once.
 
-        # Get all files under the source prefix
-        files = list(File.objects.filter(
-            user=self._user,
-            file__startswith=source_prefix,
-        ))
-
-        # Move each file to the new location
-        for file_instance in files:
-            relative_path = file_instance.file.name[len(source_prefix):]
-            new_path = dest_prefix + relative_path
-
-            logger.debug(
-                'Moving file: %s -> %s',
-                file_instance.file.name,
-                new_path,
-            )
-            move_file(self._user, file_instance.file.name, new_path)
+        Returns:
+            Dict of child name to latest modified_at (hidden files
+            included).
+        """
+        return list_folder_children(self._user, self._storage_prefix)
 
-        logger.info('Moved %d files', len(files))
+    @cached_property
+    def _storage_prefix(self) -> str:
+        """Storage key prefix of this folder's contents, derived once.
+
+        Returns:
+            Storage path of the folder with a trailing slash (the user
+            ID prefix for the root).
+        """
+        # to_storage_path() strips slashes and maps root to the user ID,
+        # so one trailing slash gives the prefix for root and subfolders
+        return f'{self._path_mapper.to_storage_path(self.path)}/'
@@ -1,22 +1,31 @@
 """WebDAV file resource (DAVNonCollection) implementation."""
 
 import logging
-from io import BytesIO
-from typing import TYPE_CHECKING, BinaryIO, final, override
-
-from django.core.files.base import ContentFile
-from wsgidav.dav_error import HTTP_INSUFFICIENT_STORAGE, DAVError
+from io import SEEK_END, BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import IO, TYPE_CHECKING, BinaryIO, final, override
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import File as DjangoFile
+from wsgidav.dav_error import (
+    HTTP_INSUFFICIENT_STORAGE,
+    HTTP_PRECONDITION_FAILED,
+    DAVError,
+)
 from wsgidav.dav_provider import DAVNonCollection
 
 from server.apps.files.exceptions import QuotaExceededError
 from server.apps.files.logic.file_operations import (
     copy_file,
+    move_file,
     update_file_content,
     upload_file,
 )
 from server.apps.files.logic.trash_operations import soft_delete_file
 from server.apps.files.models import File
 from server.apps.webdav.path_mapper import PathMapper
+from server.apps.webdav.resources.base import get_user_from_environ
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
@@ -32,6 +41,8 @@ class FileResource(DAVNonCollection):
     Each instance represents a single file owned by the authenticated user.
     """
 
+    __slots__ = ('_file', '_path_mapper')
+
     def __init__(
         self,
         path: str,
@@ -111,16 +122,20 @@ class FileResource(DAVNonCollection):
     def get_content(self) -> BinaryIO:
         """Get file content as file-like object.
 
-        Streams content from S3 storage backend.
+        Streams content lazily from S3: nothing is fetched until the
+        first read, and reads after a seek use ranged GETs.
 
         Returns:
             File-like object with file content.
         """
         logger.debug('Getting content for file: %s', self._file.file.name)
-        return self._file.file.open('rb')
+        return self._file.file.storage.open_stream(
+            self._file.file.name,
+            self._file.size_bytes,
+        )
 
     @override
-    def begin_write(self, content_type: str | None = None) -> BinaryIO:
+    def begin_write(self, content_type: str | None = None) -> IO[bytes]:
         """Begin writing new content to the file.
 
         Creates a buffer to collect uploaded content.
@@ -143,7 +158,7 @@ class FileResource(DAVNonCollection):
         marks the file as deleted but preserves it in S3.
         """
         logger.info('Soft deleting file via WebDAV: %s', self._file.file.name)
-        soft_delete_file(self._file.id)
+        soft_delete_file(self._file)
 
     @override
     def support_ranges(self) -> bool:
@@ -158,22 +173,48 @@ class FileResource(DAVNonCollection):
     def support_recursive_move(self, dest_path: str) -> bool:
         """Check if recursive move is supported.
 
-        Files don't have recursive move - that's for collections.
+        Moves are handled natively by move_recursive(), like folders,
+        instead of WsgiDAV's copy followed by delete.
 
         Args:
             dest_path: Destination path.
 
         Returns:
-            False - files don't support recursive move.
+            True - files are renamed in place.
         """
-        return False
+        return True
+
+    @override
+    def move_recursive(self, dest_path: str) -> None:
+        """Move this file to a new path.
+
+        Renames the existing record and copies the object server-side,
+        so the source does not end up in trash and its quota usage is
+        not counted twice.
+
+        Args:
+            dest_path: Destination WebDAV path.
+
+        Raises:
+            DAVError: HTTP 412 if the destination is taken.
+        """
+        dest_storage_path = self._path_mapper.to_storage_path(dest_path)
+        try:
+            move_file(
+                get_user_from_environ(self.environ),
+                self._file.file.name,
+                dest_storage_path,
+            )
+        except ValidationError as exc:
+            raise DAVError(HTTP_PRECONDITION_FAILED, str(exc)) from exc
 
     @override
     def copy_move_single(self, dest_path: str, *, is_move: bool) -> None:
         """Copy or move this file to a new path.
 
-        For both copy and move, we only copy the file here.
-        WsgiDAV will call delete() separately for moves after this succeeds.
+        For both copy and move, we only copy the file here. Moves
+        normally go through move_recursive(); WsgiDAV falls back to this
+        copy, followed by delete(), only when If headers conflict.
 
         Args:
             dest_path: Destination WebDAV path.
@@ -182,8 +223,8 @@ class FileResource(DAVNonCollection):
         Raises:
             DAVError: HTTP 507 if quota exceeded (for copy operations).
         """
-        # Get user from the file instance
-        user = self._file.user
+        # The owner is the authenticated user; no need to fetch file.user
+        user = get_user_from_environ(self.environ)
 
         # Convert WebDAV dest path to storage path
         dest_storage_path = self._path_mapper.to_storage_path(dest_path)
@@ -211,12 +252,48 @@ class FileResource(DAVNonCollection):
         """
         return self._file
 
+    def use_file_instance(self, file_instance: File) -> None:
+        """Replace underlying File model instance.
+
+        Args:
+            file_instance: Updated Django File model instance.
+        """
+        self._file = file_instance
+
 
-class _UploadBuffer(BytesIO):
+class _SpooledBuffer(SpooledTemporaryFile[bytes]):
+    """Buffer for an uploaded request body with bounded memory use.
+
+    Content is kept in memory up to FILE_UPLOAD_MAX_MEMORY_SIZE, like
+    Django's own upload handlers, and spills to a temporary file in
+    FILE_UPLOAD_TEMP_DIR beyond that, so large PUTs are not held in RAM.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        super().__init__(
+            max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE,
+            dir=settings.FILE_UPLOAD_TEMP_DIR,
+        )
+
+    @property
+    def size(self) -> int:
+        """Get buffered content size without moving the position.
+
+        Returns:
+            Content size in bytes.
+        """
+        position = self.tell()
+        size = self.seek(0, SEEK_END)
+        self.seek(position)
+        return size
+
+
+class _UploadBuffer(_SpooledBuffer):
     """Buffer for collecting uploaded file content.
 
-    Wraps BytesIO to capture uploaded content and trigger
-    actual file creation when the buffer is closed.
+    Captures uploaded content and triggers the actual file update when
+    the buffer is closed.
     """
 
     def __init__(self, resource: FileResource) -> None:
@@ -240,31 +317,29 @@ class _UploadBuffer(BytesIO):
         if self.closed:
             return
 
-        # Get buffer content
+        # Upload straight from this buffer instead of copying its bytes
+        size = self.size
         self.seek(0)
-        content = self.read()
-
-        if content:
-            try:
-                self._write_file(content)
-            except QuotaExceededError as exc:
-                logger.warning('Quota exceeded during file update: %s', exc)
-                raise DAVError(HTTP_INSUFFICIENT_STORAGE, str(exc)) from exc
 
-        super().close()
+        try:
+            if size:
+                self._write_file()
+        except QuotaExceededError as exc:
+            logger.warning('Quota exceeded during file update: %s', exc)
+            raise DAVError(HTTP_INSUFFICIENT_STORAGE, str(exc)) from exc
+        finally:
+            # Also removes the temporary file if content was spilled
+            super().close()
 
-    def _write_file(self, content: bytes) -> None:
-        """Write file content to storage atomically.
+    def _write_file(self) -> None:
+        """Write buffered content to storage atomically.
 
         Uses update_file_content for atomic updates to prevent
         data loss if the upload fails.
-
-        Args:
-            content: File content bytes.
         """
         logger.debug(
             'Writing %d bytes to file: %s',
-            len(content),
+            self.size,
             self._resource.path,
         )
 
@@ -272,8 +347,12 @@ class _UploadBuffer(BytesIO):
         file_instance = self._resource.get_file_instance()
 
         # Use atomic update - uploads new content first, then updates DB
-        content_file = ContentFile(content)
-        update_file_content(file_instance.id, content_file)
+        updated = update_file_content(
+            file_instance.id,
+            DjangoFile(self, name=self._resource.name),
+        )
+        # WsgiDAV reads the new ETag from this resource for the response
+        self._resource.use_file_instance(updated)
 
 
 @final
@@ -283,6 +362,8 @@ class NewFileResource(DAVNonCollection):
     Used when a PUT request creates a new file.
     """
 
+    __slots__ = ('_path_mapper', '_user')
+
     def __init__(
         self,
         path: str,
@@ -328,7 +409,7 @@ class NewFileResource(DAVNonCollection):
         return False
 
     @override
-    def begin_write(self, content_type: str | None = None) -> BinaryIO:
+    def begin_write(self, content_type: str | None = None) -> IO[bytes]:
         """Begin writing content to create the file.
 
         Args:
@@ -341,7 +422,7 @@ class NewFileResource(DAVNonCollection):
         return _NewFileBuffer(self, self._user, self._path_mapper)
 
 
-class _NewFileBuffer(BytesIO):
+class _NewFileBuffer(_SpooledBuffer):
     """Buffer for creating new files.
 
     Captures uploaded content and creates the file when closed.
@@ -375,32 +456,26 @@ class _NewFileBuffer(BytesIO):
         if self.closed:
             return
 
-        # Get buffer content
         self.seek(0)
-        content = self.read()
 
         # Always create file, even if empty
         # Finder sends empty PUT first, then LOCK, then PUT with content
         try:
-            self._create_file(content)
+            self._create_file()
         except QuotaExceededError as exc:
             logger.warning('Quota exceeded during file creation: %s', exc)
             raise DAVError(HTTP_INSUFFICIENT_STORAGE, str(exc)) from exc
+        finally:
+            super().close()
 
-        super().close()
-
-    def _create_file(self, content: bytes) -> None:
-        """Create new file with content.
-
-        Args:
-            content: File content bytes.
-        """
+    def _create_file(self) -> None:
+        """Create new file from buffered content without copying it."""
         storage_path = self._path_mapper.to_storage_path(self._resource.path)
+        content_file = DjangoFile(self, name=self._resource.name)
         logger.info(
             'Creating new file via WebDAV: %s (%d bytes)',
             storage_path,
-            len(content),
+            content_file.size,
         )
 
-        content_file = ContentFile(content)
         upload_file(self._user, storage_path, content_file)
@@ -1,8 +1,6 @@
 """WebDAV trash collection (/.Trash/) implementation."""
 
 import logging
-from datetime import UTC, datetime
-from pathlib import Path
 from typing import TYPE_CHECKING, final, override
 
 from wsgidav.dav_error import HTTP_FORBIDDEN, HTTP_NOT_FOUND, DAVError
@@ -10,9 +8,14 @@ from wsgidav.dav_provider import DAVCollection
 
 from server.apps.files.logic.trash_operations import (
     empty_trash,
-    list_trash,
+    latest_trash_modified,
 )
+from server.apps.webdav.middleware import get_request_time
 from server.apps.webdav.path_mapper import PathMapper
+from server.apps.webdav.resources.base import (
+    clear_trash_preload,
+    get_trash_preload,
+)
 from server.apps.webdav.resources.trash_file_resource import TrashFileResource
 
 if TYPE_CHECKING:
@@ -33,6 +36,8 @@ class TrashCollection(DAVCollection):
     - MOVE from trash: Restore files
     """
 
+    __slots__ = ('_path_mapper', '_user')
+
     def __init__(
         self,
         path: str,
@@ -74,15 +79,15 @@ class TrashCollection(DAVCollection):
     def get_last_modified(self) -> float:
         """Get folder modification timestamp.
 
-        Returns most recent deletion time, or now if trash is empty.
+        Returns most recent deletion time, or request time if trash is empty.
 
         Returns:
             Unix timestamp.
         """
-        latest = list_trash(self._user).first()
-        if latest and latest.deleted_at:
-            return latest.deleted_at.timestamp()
-        return datetime.now(tz=UTC).timestamp()
+        latest = latest_trash_modified(self._user)
+        if latest:
+            return latest.timestamp()
+        return get_request_time(self.environ)
 
     @override
     def get_member_names(self) -> list[str]:
@@ -93,8 +98,7 @@ class TrashCollection(DAVCollection):
         Returns:
             List of original filenames.
         """
-        files = list_trash(self._user)
-        return [Path(file_obj.original_path).name for file_obj in files]
+        return list(get_trash_preload(self.environ, self._user))
 
     @override
     def get_member(self, name: str) -> 'DAVNonCollection':
@@ -109,17 +113,20 @@ class TrashCollection(DAVCollection):
         Raises:
             DAVError: HTTP 404 if file not found.
         """
-        files = list_trash(self._user)
-        for file_obj in files:
-            if Path(file_obj.original_path).name == name:
-                return TrashFileResource(
-                    f'/.Trash/{name}',
-                    self.environ,
-                    file_obj,
-                    self._path_mapper,
-                )
-
-        raise DAVError(HTTP_NOT_FOUND, f'File not found in trash: {name}')
+        try:
+            file_obj = get_trash_preload(self.environ, self._user)[name]
+        except KeyError as exc:
+            raise DAVError(
+                HTTP_NOT_FOUND,
+                f'File not found in trash: {name}',
+            ) from exc
+
+        return TrashFileResource(
+            f'/.Trash/{name}',
+            self.environ,
+            file_obj,
+            self._path_mapper,
+        )
 
     @override
     def create_empty_resource(self, name: str) -> 'DAVNonCollection':
@@ -153,6 +160,7 @@ class TrashCollection(DAVCollection):
         """
         logger.info('Emptying trash for user: %s', self._user.username)
         count = empty_trash(self._user)
+        clear_trash_preload(self.environ)
         logger.info('Emptied %d files from trash', count)
 
     @override
@@ -2,9 +2,9 @@
 
 import logging
 from pathlib import Path
-from typing import BinaryIO, final, override
+from typing import BinaryIO, Final, final, override
 
-from wsgidav.dav_error import HTTP_FORBIDDEN, DAVError
+from wsgidav.dav_error import HTTP_FORBIDDEN, HTTP_NOT_FOUND, DAVError
 from wsgidav.dav_provider import DAVNonCollection
 
 from server.apps.files.logic.trash_operations import (
@@ -13,9 +13,19 @@ from server.apps.files.logic.trash_operations import (
 )
 from server.apps.files.models import File
 from server.apps.webdav.path_mapper import PathMapper
+from server.apps.webdav.resources.base import (
+    clear_trash_preload,
+    get_user_from_environ,
+)
 
 logger = logging.getLogger(__name__)
 
+# Namespace of standard live properties, computed from resource getters
+_DAV_NAMESPACE: Final = '{DAV:}'
+
+# Hex digits of the checksum used as ETag (64 bits)
+_ETAG_LENGTH: Final = 16
+
 
 @final
 class TrashFileResource(DAVNonCollection):
@@ -31,6 +41,8 @@ class TrashFileResource(DAVNonCollection):
     - COPY: Cannot copy from trash (must restore first)
     """
 
+    __slots__ = ('_file', '_path_mapper')
+
     def __init__(
         self,
         path: str,
@@ -103,10 +115,14 @@ class TrashFileResource(DAVNonCollection):
     def get_etag(self) -> str:
         """Get entity tag for the file.
 
+        Trashed content never changes, so a checksum prefix identifies it
+        as well as the full digest while keeping headers and PROPFIND
+        responses shorter. WsgiDAV only supports strong ETags.
+
         Returns:
-            Checksum as ETag.
+            Checksum prefix as ETag.
         """
-        return self._file.checksum_sha256
+        return self._file.checksum_sha256[:_ETAG_LENGTH]
 
     @override
     def support_etag(self) -> bool:
@@ -121,28 +137,61 @@ class TrashFileResource(DAVNonCollection):
     def get_content(self) -> BinaryIO:
         """Get file content from S3.
 
+        Streams lazily using ranged GETs instead of downloading the whole
+        object before the first byte is sent.
+
         Returns:
             File-like object with content.
         """
         logger.debug('Getting trashed file content: %s', self._file.file.name)
-        return self._file.file.open('rb')
+        return self._file.file.storage.open_stream(
+            self._file.file.name,
+            self._file.size_bytes,
+        )
 
     @override
     def get_property_value(self, name: str) -> str | None:
         """Get DAV property value.
 
-        Exposes original_path as custom property.
+        Exposes original_path as custom property. Trash files are
+        read-only and never carry dead properties, so non-DAV names are
+        rejected without a property manager lookup.
 
         Args:
             name: Property name (e.g., '{DAV:}original-path').
 
         Returns:
             Property value or None.
+
+        Raises:
+            DAVError: HTTP 404 for properties outside the DAV namespace.
         """
         if name == '{DAV:}original-path':
             return self._file.original_path
+        if not name.startswith(_DAV_NAMESPACE):
+            raise DAVError(HTTP_NOT_FOUND)
         return super().get_property_value(name)
 
+    @override
+    def set_property_value(
+        self,
+        name: str,
+        value: object,
+        *,
+        dry_run: bool = False,
+    ) -> None:
+        """Disallow PROPPATCH on trashed files.
+
+        Args:
+            name: Property name.
+            value: Property value (ignored).
+            dry_run: Whether this is a dry run (ignored).
+
+        Raises:
+            DAVError: HTTP 403 always.
+        """
+        raise DAVError(HTTP_FORBIDDEN, 'Cannot modify files in trash')
+
     @override
     def delete(self) -> None:
         """Permanently delete file from trash.
@@ -154,7 +203,8 @@ class TrashFileResource(DAVNonCollection):
             self._file.trash_name,
             self._file.id,
         )
-        permanent_delete_file(self._file.id)
+        permanent_delete_file(self._file)
+        clear_trash_preload(self.environ)
 
     @override
     def copy_move_single(self, dest_path: str, *, is_move: bool) -> None:
@@ -183,7 +233,10 @@ class TrashFileResource(DAVNonCollection):
             self._file.trash_name,
             dest_storage,
         )
-        restore_file(self._file.id, dest_storage)
+        # The owner is the authenticated user; spares restore_file() a query
+        self._file.user = get_user_from_environ(self.environ)
+        restore_file(self._file, dest_storage)
+        clear_trash_preload(self.environ)
 
     @override
     def begin_write(self, content_type: str | None = None) -> BinaryIO:
@@ -197,6 +250,19 @@ class TrashFileResource(DAVNonCollection):
         """
         raise DAVError(HTTP_FORBIDDEN, 'Cannot modify files in trash')
 
+    @override
+    def prevent_locking(self) -> bool:
+        """Disallow locking trashed files.
+
+        Trash files are read-only, so locks protect nothing. This also
+        drops lockdiscovery and supportedlock from every PROPFIND row,
+        saving a lock manager lookup per trashed file.
+
+        Returns:
+            True - LOCK is refused with HTTP 403.
+        """
+        return True
+
     @override
     def support_ranges(self) -> bool:
         """Check if byte ranges are supported.
@@ -4,16 +4,55 @@ Creates a configured WsgiDAV application that integrates with Django.
 """
 
 import logging
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlsplit
 
+from django.conf import settings
 from wsgidav import wsgidav_app
+from wsgidav.dir_browser import WsgiDavDirBrowser
+from wsgidav.error_printer import ErrorPrinter
+from wsgidav.http_authenticator import HTTPAuthenticator
+from wsgidav.mw.cors import Cors
+from wsgidav.request_resolver import RequestResolver
 
 from server.apps.webdav.dav_provider import DjangoDAVProvider
 from server.apps.webdav.domain_controller import DjangoDomainController
+from server.apps.webdav.middleware import (
+    RequestTimeMiddleware,
+    TrashPropfindCacheMiddleware,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def get_lock_storage() -> bool | dict[str, Any]:
+    """Get WsgiDAV lock storage option from settings.
+
+    With WEBDAV_LOCK_REDIS_URL set, locks live in Redis so every WebDAV
+    server process sees the same lock table; otherwise WsgiDAV keeps
+    them in an in-process dict. The Redis storage class is imported by
+    WsgiDAV only when configured, keeping `redis` an optional dependency.
+
+    Returns:
+        True for in-process locks, or class options for Redis locks.
+    """
+    redis_url = getattr(settings, 'WEBDAV_LOCK_REDIS_URL', '')
+    if not redis_url:
+        return True
+
+    parsed = urlsplit(redis_url)
+    return {
+        'class': 'wsgidav.lock_man.lock_storage_redis.LockStorageRedis',
+        'kwargs': {
+            'host': parsed.hostname or '127.0.0.1',
+            'port': parsed.port or 6379,
+            'db': int(parsed.path.lstrip('/') or 0),
+            'password': parsed.password,
+        },
+    }
+
+
 def create_webdav_app(
     verbose: int = 3,
 ) -> wsgidav_app.WsgiDAVApp:
@@ -23,6 +62,8 @@ def create_webdav_app(
     - DjangoDAVProvider for file operations
     - DjangoDomainController for authentication
     - HTTP Basic authentication
+    - RequestTimeMiddleware stamping each request's start time
+    - TrashPropfindCacheMiddleware caching /.Trash/ listings
 
     Args:
         verbose: Logging verbosity level (0-5).
@@ -40,6 +81,17 @@ def create_webdav_app(
             'accept_digest': False,
             'default_to_digest': False,
         },
+        # WsgiDAV default stack, plus request time stamping first and
+        # trash listing cache after authentication
+        'middleware_stack': [
+            RequestTimeMiddleware,
+            Cors,
+            ErrorPrinter,
+            HTTPAuthenticator,
+            TrashPropfindCacheMiddleware,
+            WsgiDavDirBrowser,
+            RequestResolver,  # Must be the last middleware item
+        ],
         'verbose': verbose,
         'logging': {
             'enable': True,
@@ -51,7 +103,7 @@ def create_webdav_app(
         },
         # Enable lock manager for DAV Class 2 compliance
         # Required for macOS Finder write support
-        'lock_storage': True,
+        'lock_storage': get_lock_storage(),
         # Property manager (in-memory)
         'property_manager': True,
     }
@@ -61,10 +113,13 @@ def create_webdav_app(
     return wsgidav_app.WsgiDAVApp(config)
 
 
+@lru_cache(maxsize=1)
 def get_webdav_app() -> wsgidav_app.WsgiDAVApp:
     """Get or create the WebDAV WSGI application.
 
-    This is a convenience function for getting the application instance.
+    The application is built once per process: the provider, lock and
+    property managers are meant to be long-lived, and all per-request
+    state lives in the WSGI environ.
 
     Returns:
         WsgiDAV WSGI application.
@@ -9,3 +9,6 @@ WEBDAV_PORT = config('WEBDAV_PORT', cast=int, default=8080)
 # Session management
 WEBDAV_SESSION_LIMIT = config('WEBDAV_SESSION_LIMIT', cast=int, default=5)
 WEBDAV_SESSION_TIMEOUT = config('WEBDAV_SESSION_TIMEOUT', cast=int, default=1800)
+
+# Shared lock storage, e.g. redis://redis:6379/0 (empty: in-process locks)
+WEBDAV_LOCK_REDIS_URL = config('WEBDAV_LOCK_REDIS_URL', default='')
@@ -0,0 +1,29 @@
+import pytest
+
+from server.apps.files.models import File
+
+
+@pytest.fixture
+def make_files(user):
+    """Factory creating files for the test user with one bulk INSERT.
+
+    Only database rows are created, no storage objects. The user fixture
+    comes from the app's conftest.
+
+    Returns:
+        Function taking relative paths (and an optional size_bytes)
+        and returning the created File instances.
+    """
+    def factory(*names: str, size_bytes: int = 100) -> list[File]:
+        return File.objects.bulk_create([
+            File(
+                user=user,
+                file=f'{user.id}/{name}',
+                size_bytes=size_bytes,
+                mime_type='text/plain',
+                checksum_sha256='a' * 64,
+            )
+            for name in names
+        ])
+
+    return factory
@@ -4,9 +4,12 @@ import boto3
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.files.base import ContentFile
+from django.db.models import F, Value
+from django.db.models.functions import Replace
+from django.utils import timezone
 from moto import mock_aws
 
-from server.apps.files.models import UserQuota
+from server.apps.files.models import File, UserQuota
 
 User = get_user_model()
 
@@ -39,9 +42,13 @@ def other_user(db):
     )
 
 
-@pytest.fixture
-def mock_s3():
-    """Mock S3 service with photo-album bucket.
+@pytest.fixture(scope='package')
+def s3_service():
+    """Mock S3 service with photo-album bucket, shared by the app's tests.
+
+    Package scope starts moto once per app test directory instead of
+    once per module, while keeping the mock inactive for other tests
+    (e.g. MinIO integration tests that need real S3 calls).
 
     Yields:
         boto3 S3 resource with photo-album bucket created.
@@ -57,13 +64,39 @@ def mock_s3():
 
 
 @pytest.fixture
-def sample_file_content():
+def mock_s3(s3_service):
+    """Mock S3 service with an empty photo-album bucket.
+
+    Reuses the shared mock and only removes objects left by earlier
+    tests, which is much cheaper than starting a new mock per test.
+
+    Returns:
+        boto3 S3 resource with photo-album bucket created.
+    """
+    s3_service.Bucket('photo-album').objects.all().delete()
+    return s3_service
+
+
+@pytest.fixture(scope='session')
+def sample_file_bytes():
+    """Immutable sample payload, shared by the whole test session.
+
+    Returns:
+        Test data bytes.
+    """
+    return b'test file content'
+
+
+@pytest.fixture
+def sample_file_content(sample_file_bytes):
     """Sample file content for testing.
 
+    A fresh file object per test, since reads and seeks mutate it.
+
     Returns:
         ContentFile with test data.
     """
-    return ContentFile(b'test file content', name='test.txt')
+    return ContentFile(sample_file_bytes, name='test.txt')
 
 
 @pytest.fixture
@@ -78,3 +111,41 @@ def user_quota(user, db):
         quota_bytes=10 * 1024 * 1024 * 1024,  # 10 GB
         used_bytes=0,
     )
+
+
+@pytest.fixture
+def used_bytes(db):
+    """Read a user's recorded usage with a single-column query.
+
+    Returns:
+        Function taking a user and returning their quota's used_bytes.
+    """
+    def read_used_bytes(user: User) -> int:
+        return UserQuota.objects.filter(user=user).values_list(
+            'used_bytes',
+            flat=True,
+        ).get()
+
+    return read_used_bytes
+
+
+@pytest.fixture
+def bulk_soft_delete(db):
+    """Soft delete files with a single UPDATE, like soft_delete_file().
+
+    Trash names are derived from the (unique) storage paths.
+
+    Returns:
+        Function taking File instances to move to trash.
+    """
+    def soft_delete(*files: File) -> None:
+        now = timezone.now()
+        File.objects.filter(id__in=[file.id for file in files]).update(
+            is_deleted=True,
+            deleted_at=now,
+            modified_at=now,
+            original_path=F('file'),
+            trash_name=Replace(F('file'), Value('/'), Value('__')),
+        )
+
+    return soft_delete
@@ -0,0 +1,95 @@
+"""Tests for cleanup_orphans management command."""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from server.apps.files.logic.trash_operations import soft_delete_file
+from server.apps.files.models import File
+
+
+@pytest.fixture
+def stored_objects(user, mock_s3):
+    """Store a referenced, a trashed and an orphaned object.
+
+    Returns:
+        Dict of role to storage path.
+    """
+    paths = {
+        'active': f'{user.id}/active.txt',
+        'trashed': f'{user.id}/trashed.txt',
+        'orphan': f'{user.id}/orphan.txt',
+        'foreign': 'static/site.css',
+    }
+    for storage_path in paths.values():
+        mock_s3.Object('photo-album', storage_path).put(Body=b'content')
+    for role in ('active', 'trashed'):
+        File.objects.create(
+            user=user,
+            file=paths[role],
+            size_bytes=7,
+            mime_type='text/plain',
+            checksum_sha256='a' * 64,
+        )
+    soft_delete_file(File.objects.get(file=paths['trashed']))
+    return paths
+
+
+def _stored_keys(mock_s3):
+    bucket = mock_s3.Bucket('photo-album')
+    return sorted(stored.key for stored in bucket.objects.all())
+
+
+@pytest.mark.django_db
+class TestCleanupOrphansCommand:
+    """Tests for cleanup_orphans management command."""
+
+    def test_cleanup_deletes_orphans_only(self, mock_s3, stored_objects):
+        """Test unreferenced user objects are deleted, others kept."""
+        out = StringIO()
+        call_command('cleanup_orphans', '--min-age-hours=0', stdout=out)
+
+        assert _stored_keys(mock_s3) == sorted([
+            stored_objects['active'],
+            stored_objects['foreign'],
+            stored_objects['trashed'],
+        ])
+        assert 'Deleted 1 orphaned objects' in out.getvalue()
+
+    def test_cleanup_skips_recent_objects(self, mock_s3, stored_objects):
+        """Test objects newer than the minimum age are kept."""
+        out = StringIO()
+        call_command('cleanup_orphans', stdout=out)
+
+        assert len(_stored_keys(mock_s3)) == 4
+        assert 'Deleted 0 orphaned objects' in out.getvalue()
+
+    def test_cleanup_dry_run(self, mock_s3, stored_objects):
+        """Test dry run lists orphans without deleting them."""
+        out = StringIO()
+        call_command(
+            'cleanup_orphans',
+            '--min-age-hours=0',
+            '--dry-run',
+            stdout=out,
+        )
+
+        assert len(_stored_keys(mock_s3)) == 4
+        assert f'Would delete: {stored_objects["orphan"]}' in out.getvalue()
+
+    def test_cleanup_prefix(self, user, mock_s3, stored_objects):
+        """Test only objects under the prefix are scanned."""
+        other_orphan = f'{user.id + 1}/orphan.txt'
+        mock_s3.Object('photo-album', other_orphan).put(Body=b'content')
+
+        call_command(
+            'cleanup_orphans',
+            '--min-age-hours=0',
+            f'--prefix={user.id}/',
+            stdout=StringIO(),
+        )
+
+        keys = _stored_keys(mock_s3)
+        assert other_orphan in keys
+        assert stored_objects['orphan'] not in keys
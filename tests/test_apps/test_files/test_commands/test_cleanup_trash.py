@@ -5,6 +5,8 @@ from io import StringIO
 
 import pytest
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from server.apps.files.logic.trash_operations import soft_delete_file
@@ -215,3 +217,29 @@ class TestCleanupTrashCommand:
         # Older file should be deleted, newer should remain
         assert not File.all_objects.filter(id=older.id).exists()
         assert File.all_objects.filter(id=newer.id).exists()
+
+    def test_cleanup_skips_locked_rows(self, user, mock_s3):
+        """Test cleanup claims its batch with FOR UPDATE SKIP LOCKED."""
+        file_instance = File.objects.create(
+            user=user,
+            file=f'{user.id}/old_file.txt',
+            size_bytes=100,
+            mime_type='text/plain',
+            checksum_sha256='a' * 64,
+        )
+        soft_delete_file(file_instance.id)
+        File.all_objects.filter(id=file_instance.id).update(
+            deleted_at=timezone.now() - timedelta(days=31),
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command('cleanup_trash', stdout=StringIO())
+
+        # Parallel runs must claim disjoint batches instead of blocking
+        claims = [
+            query['sql'] for query in queries
+            if 'SKIP LOCKED' in query['sql']
+        ]
+        assert len(claims) == 1
+        assert 'LIMIT' in claims[0]
+        assert not File.all_objects.filter(id=file_instance.id).exists()
@@ -1,15 +1,21 @@
 """Tests for metadata utilities."""
 
+import hashlib
+import io
+from types import SimpleNamespace
+
 import pytest
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 
 from server.apps.files.infrastructure.metadata import (
+    ChecksumReader,
     calculate_checksum,
     detect_mime_type,
     extract_filename,
     extract_folder_path,
     get_file_extension,
+    prefix_range,
     validate_storage_path,
 )
 
@@ -24,6 +30,15 @@ def test_detect_mime_type():
     assert detect_mime_type(file_obj, 'test.png') == 'image/png'
 
 
+def test_detect_mime_type_extension_variants():
+    """Test MIME type detection for upper-case and compound extensions."""
+    file_obj = ContentFile(b'content')
+
+    assert detect_mime_type(file_obj, 'PHOTO.JPG') == 'image/jpeg'
+    assert detect_mime_type(file_obj, 'backup.tar.gz') == 'application/x-tar'
+    assert detect_mime_type(file_obj, 'README') == 'application/octet-stream'
+
+
 def test_detect_mime_type_unknown():
     """Test MIME type detection for unknown extension."""
     file_obj = ContentFile(b'content')
@@ -47,6 +62,56 @@ def test_calculate_checksum():
     assert calculate_checksum(file_obj2) == checksum
 
 
+def test_calculate_checksum_django_file_wrapper():
+    """Test checksum of a Django File hashes the wrapped buffer."""
+    content = b'y' * 300000
+    file_obj = ContentFile(content)
+    file_obj.read(10)
+
+    checksum = calculate_checksum(file_obj)
+
+    assert checksum == hashlib.sha256(content).hexdigest()
+    assert file_obj.tell() == 0
+
+
+def test_calculate_checksum_read_only_stream():
+    """Test checksum falls back to chunked reads without readinto()."""
+    content = b'x' * 20000
+    raw = io.BytesIO(content)
+    file_obj = SimpleNamespace(read=raw.read, seek=raw.seek, tell=raw.tell)
+
+    checksum = calculate_checksum(file_obj)
+
+    assert checksum == hashlib.sha256(content).hexdigest()
+    assert file_obj.tell() == 0
+
+
+def test_checksum_reader_hashes_while_reading():
+    """Test checksum reader hashes re-read bytes only once."""
+    content = b'0123456789' * 1000
+    reader = ChecksumReader(io.BytesIO(content), len(content))
+
+    assert reader.read(4000) == content[:4000]
+    assert reader.hexdigest() is None
+
+    # A retry seeks back and reads overlapping bytes again
+    reader.seek(1000)
+    assert reader.read() == content[1000:]
+
+    assert reader.hexdigest() == hashlib.sha256(content).hexdigest()
+
+
+def test_checksum_reader_out_of_order_reads():
+    """Test checksum reader gives no checksum when bytes were skipped."""
+    content = b'x' * 100
+    reader = ChecksumReader(io.BytesIO(content), len(content))
+
+    reader.seek(50)
+    reader.read()
+
+    assert reader.hexdigest() is None
+
+
 def test_extract_filename():
     """Test filename extraction from path."""
     assert extract_filename('1/documents/test.pdf') == 'test.pdf'
@@ -61,6 +126,13 @@ def test_extract_folder_path():
 
     path2 = '1/file.txt'
     assert extract_folder_path(path2) == '1'
+    assert extract_folder_path('file.txt') == '.'
+
+
+def test_prefix_range():
+    """Test half-open range bounds for a path prefix."""
+    assert prefix_range('1/documents/') == ('1/documents/', '1/documents0')
+    assert prefix_range('1') == ('1', '2')
 
 
 def test_validate_storage_path_valid(user):
@@ -86,6 +158,13 @@ def test_validate_storage_path_no_user_id(user):
         validate_storage_path(user.id, 'documents/test.pdf')
 
 
+def test_validate_storage_path_malformed_user_id(user):
+    """Test storage path validation rejects non-numeric first components."""
+    for storage_path in (f'/{user.id}/a.txt', f'{user.id}abc/a.txt'):
+        with pytest.raises(ValidationError, match='must start with user ID'):
+            validate_storage_path(user.id, storage_path)
+
+
 def test_validate_storage_path_empty(user):
     """Test storage path validation with empty path."""
     with pytest.raises(ValidationError, match='cannot be empty'):
@@ -96,5 +175,7 @@ def test_get_file_extension():
     """Test file extension extraction."""
     assert get_file_extension('test.pdf') == 'pdf'
     assert get_file_extension('test.TXT') == 'txt'  # Lowercase
-    assert get_file_extension('test') == ''  # No extension
+    assert not get_file_extension('test')  # No extension
     assert get_file_extension('test.tar.gz') == 'gz'  # Last extension
+    assert not get_file_extension('.bashrc')  # Dotfile
+    assert not get_file_extension('1/archive.d/README')  # Dotted folder
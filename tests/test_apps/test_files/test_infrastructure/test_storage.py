@@ -0,0 +1,93 @@
+"""Tests for S3 storage backend."""
+
+import pickle  # noqa: S403
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.client import IncompleteRead
+
+import pytest
+from botocore.exceptions import ClientError
+from django.core.files.storage import storages
+
+from server.apps.files.infrastructure import object_reader
+from server.apps.files.infrastructure.storage import FileStorage
+
+
+def test_client_config_keeps_connections_alive():
+    """Test pooling options are merged over the configured client config."""
+    storage = FileStorage(bucket_name='photo-album', addressing_style='path')
+
+    config = storage.client_config
+
+    assert config.max_pool_connections == 20
+    assert config.tcp_keepalive is True
+    assert config.retries == {'max_attempts': 3, 'mode': 'adaptive'}
+    assert config.s3 == {'addressing_style': 'path'}
+
+
+def test_transfer_config_uploads_large_files_in_parallel_parts():
+    """Test large uploads use parallel 8 MiB multipart parts."""
+    storage = FileStorage(bucket_name='photo-album')
+
+    config = storage.transfer_config
+
+    assert config.multipart_threshold == 8 * 1024 * 1024
+    assert config.multipart_chunksize == 8 * 1024 * 1024
+    assert config.max_concurrency == 8
+    assert config.use_threads is True
+
+
+def test_threads_share_one_session(mock_s3):
+    """Test per-thread resources are built from a single session."""
+    storage = FileStorage(bucket_name='photo-album')
+    # Keeps both calls on separate worker threads
+    barrier = threading.Barrier(2)
+
+    def get_connection(_: int) -> object:
+        barrier.wait()
+        return storage.connection
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        connections = list(executor.map(get_connection, range(2)))
+
+    assert connections[0] is not connections[1]
+    session = storage._create_session()  # noqa: SLF001
+    assert session is storage._create_session()  # noqa: SLF001
+
+
+def test_storage_is_picklable():
+    """Test storage pickles without its session and lock."""
+    storage = FileStorage(bucket_name='photo-album')
+    assert storage.connection is not None
+
+    restored = pickle.loads(pickle.dumps(storage))  # noqa: S301
+
+    assert restored.bucket_name == 'photo-album'
+    assert restored.connection is not None
+
+
+def test_stream_fails_on_truncated_object(mock_s3):
+    """Test a body shorter than the expected size is not a clean EOF."""
+    mock_s3.Bucket('photo-album').put_object(Key='1/a.txt', Body=b'short')
+    # Configured backend, so reads hit the bucket mocked by moto
+    storage = storages['default']
+
+    stream = storage.open_stream('1/a.txt', 10)
+
+    with pytest.raises(IncompleteRead):
+        stream.read()
+
+
+def test_stream_fails_on_replaced_object(mock_s3, monkeypatch):
+    """Test windows after the first only read the same object version."""
+    monkeypatch.setattr(object_reader, '_RANGE_CHUNK_SIZE', 4)
+    bucket = mock_s3.Bucket('photo-album')
+    bucket.put_object(Key='1/a.txt', Body=b'first version')
+    storage = storages['default']
+
+    stream = storage.open_stream('1/a.txt', 13)
+    assert stream.read(4) == b'firs'
+    bucket.put_object(Key='1/a.txt', Body=b'other version')
+
+    with pytest.raises(ClientError, match='PreconditionFailed'):
+        stream.read()
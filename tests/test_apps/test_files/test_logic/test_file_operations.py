@@ -1,24 +1,60 @@
 """Tests for file operations business logic."""
 
+import hashlib
 from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
+from botocore.exceptions import ClientError
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, connection
+from django.db.models.fields.files import FieldFile
+from django.test.utils import CaptureQueriesContext
 
 from server.apps.files.exceptions import QuotaExceededError
+from server.apps.files.logic import file_operations
 from server.apps.files.logic.file_operations import (
+    commit_upload,
     copy_file,
+    create_presigned_upload,
     delete_file,
+    delete_files,
+    files_with_prefix,
+    folder_exists,
     list_directory,
+    list_folder_children,
+    move_file,
+    move_folder,
+    resolve_storage_path,
     update_file_content,
     upload_file,
 )
+from server.apps.files.logic.trash_operations import soft_delete_file
 from server.apps.files.models import File, UserQuota
 
 
+def _put_with_checksum(mock_s3, storage_path, content):
+    """Store an object like a presigned PUT, with its SHA256 checksum.
+
+    Returns:
+        Hex-encoded SHA256 checksum of the content.
+    """
+    mock_s3.Object('photo-album', storage_path).put(
+        Body=content,
+        ChecksumAlgorithm='SHA256',
+    )
+    return hashlib.sha256(content).hexdigest()
+
+
 @pytest.mark.django_db
-def test_upload_file_success(user, mock_s3, sample_file_content):
+def test_upload_file_success(
+    user,
+    mock_s3,
+    sample_file_content,
+    sample_file_bytes,
+):
     """Test successful file upload (S3 + DB)."""
     storage_path = f'{user.id}/test.txt'
 
@@ -32,11 +68,188 @@ def test_upload_file_success(user, mock_s3, sample_file_content):
     assert file_instance.size_bytes > 0
     assert file_instance.mime_type == 'text/plain'
     assert len(file_instance.checksum_sha256) == 64
+    assert file_instance.checksum_sha256 == hashlib.sha256(
+        sample_file_bytes,
+    ).hexdigest()
 
     # Check file exists in DB
     assert File.objects.filter(id=file_instance.id).exists()
 
 
+@pytest.mark.django_db
+def test_upload_large_file_multipart(user, mock_s3, monkeypatch):
+    """Test large uploads go multipart and are hashed while streaming."""
+    content = b'x' * (9 * 1024 * 1024)
+    storage_path = f'{user.id}/large.bin'
+
+    def fail_checksum(*args, **kwargs):
+        raise AssertionError('Content must not be re-read for checksum')
+
+    monkeypatch.setattr(file_operations, 'calculate_checksum', fail_checksum)
+
+    file_instance = upload_file(
+        user,
+        storage_path,
+        ContentFile(content, name='large.bin'),
+    )
+
+    stored = mock_s3.Object('photo-album', storage_path)
+    assert stored.content_length == len(content)
+    assert stored.e_tag.strip('"').endswith('-2')  # Two multipart parts
+    assert file_instance.checksum_sha256 == hashlib.sha256(
+        content,
+    ).hexdigest()
+
+
+@pytest.mark.django_db
+def test_direct_upload_presign_and_commit(user, mock_s3):
+    """Test a presigned direct upload is recorded on commit."""
+    content = b'direct upload content'
+    checksum = hashlib.sha256(content).hexdigest()
+    storage_path = f'{user.id}/direct.txt'
+
+    url = create_presigned_upload(user, storage_path, len(content), checksum)
+
+    query = parse_qs(urlsplit(url).query)
+    assert urlsplit(url).path.endswith(f'/{storage_path}')
+    assert 'x-amz-checksum-sha256' in query['X-Amz-SignedHeaders'][0]
+
+    # Client uploads straight to storage, which records the checksum
+    _put_with_checksum(mock_s3, storage_path, content)
+    file_instance = commit_upload(user, storage_path, len(content), checksum)
+
+    assert file_instance.size_bytes == len(content)
+    assert file_instance.mime_type == 'text/plain'
+    assert file_instance.checksum_sha256 == checksum
+    assert UserQuota.objects.get(user=user).used_bytes == len(content)
+
+
+@pytest.mark.django_db
+def test_direct_upload_rejects_existing_path(
+    user,
+    mock_s3,
+    sample_file_content,
+):
+    """Test no upload URL is issued for an existing file."""
+    storage_path = f'{user.id}/test.txt'
+    upload_file(user, storage_path, sample_file_content)
+
+    with pytest.raises(ValidationError, match='already exists'):
+        create_presigned_upload(user, storage_path, 10, 'ab' * 32)
+
+
+@pytest.mark.django_db
+def test_direct_upload_commit_size_mismatch(user, mock_s3):
+    """Test a commit with a wrong size deletes the uploaded object."""
+    storage_path = f'{user.id}/direct.txt'
+    checksum = _put_with_checksum(mock_s3, storage_path, b'12345')
+
+    with pytest.raises(ValidationError, match='does not match'):
+        commit_upload(user, storage_path, 3, checksum)
+
+    keys = [obj.key for obj in mock_s3.Bucket('photo-album').objects.all()]
+    assert storage_path not in keys
+    assert not File.objects.filter(file=storage_path).exists()
+
+
+@pytest.mark.django_db
+def test_direct_upload_commit_checksum_mismatch(user, mock_s3):
+    """Test the declared checksum is verified against storage's."""
+    storage_path = f'{user.id}/direct.txt'
+    _put_with_checksum(mock_s3, storage_path, b'12345')
+
+    with pytest.raises(ValidationError, match='does not match'):
+        commit_upload(user, storage_path, 5, 'ab' * 32)
+
+    keys = [obj.key for obj in mock_s3.Bucket('photo-album').objects.all()]
+    assert storage_path not in keys
+
+
+@pytest.mark.django_db
+def test_direct_upload_commit_unverified(user, mock_s3):
+    """Test an object stored without a checksum is not committed."""
+    content = b'12345'
+    storage_path = f'{user.id}/direct.txt'
+    mock_s3.Object('photo-album', storage_path).put(Body=content)
+
+    with pytest.raises(ValidationError, match='does not match'):
+        commit_upload(
+            user,
+            storage_path,
+            len(content),
+            hashlib.sha256(content).hexdigest(),
+        )
+
+    assert not File.objects.filter(file=storage_path).exists()
+
+
+@pytest.mark.django_db
+def test_direct_upload_commit_keeps_existing_file(
+    user,
+    mock_s3,
+    sample_file_content,
+    sample_file_bytes,
+):
+    """Test a commit onto a recorded path never deletes its object."""
+    storage_path = f'{user.id}/keep.txt'
+    existing = upload_file(user, storage_path, sample_file_content)
+
+    with pytest.raises(ValidationError, match='already exists'):
+        commit_upload(user, storage_path, 999, 'a' * 64)
+
+    stored = mock_s3.Object('photo-album', existing.file.name).get()
+    assert stored['Body'].read() == sample_file_bytes
+
+
+@pytest.mark.django_db
+def test_direct_upload_commit_keeps_trashed_file(user, mock_s3):
+    """Test trashed files keep their objects too."""
+    storage_path = f'{user.id}/trashed.txt'
+    checksum = _put_with_checksum(mock_s3, storage_path, b'12345')
+    soft_delete_file(commit_upload(user, storage_path, 5, checksum))
+
+    with pytest.raises(ValidationError, match='already exists'):
+        create_presigned_upload(user, storage_path, 5, checksum)
+    with pytest.raises(ValidationError, match='already exists'):
+        commit_upload(user, storage_path, 5, checksum)
+
+    keys = [obj.key for obj in mock_s3.Bucket('photo-album').objects.all()]
+    assert keys == [storage_path]
+
+
+@pytest.mark.django_db
+def test_direct_upload_commit_integrity_error(user, mock_s3, monkeypatch):
+    """Test a failed insert deletes the object and releases quota."""
+    storage_path = f'{user.id}/direct.txt'
+    checksum = _put_with_checksum(mock_s3, storage_path, b'12345')
+
+    def fail_create(**kwargs):
+        raise IntegrityError('duplicate key')
+
+    monkeypatch.setattr(File.objects, 'create', fail_create)
+
+    with pytest.raises(IntegrityError):
+        commit_upload(user, storage_path, 5, checksum)
+
+    keys = [obj.key for obj in mock_s3.Bucket('photo-album').objects.all()]
+    assert storage_path not in keys
+    assert UserQuota.objects.get(user=user).used_bytes == 0
+
+
+@pytest.mark.django_db
+def test_direct_upload_commit_over_quota(user, mock_s3):
+    """Test a commit over quota deletes the uploaded object."""
+    UserQuota.objects.create(user=user, quota_bytes=3, used_bytes=0)
+    storage_path = f'{user.id}/direct.txt'
+    checksum = _put_with_checksum(mock_s3, storage_path, b'12345')
+
+    with pytest.raises(QuotaExceededError):
+        commit_upload(user, storage_path, 5, checksum)
+
+    keys = [obj.key for obj in mock_s3.Bucket('photo-album').objects.all()]
+    assert storage_path not in keys
+
+
 @pytest.mark.django_db
 def test_upload_file_invalid_path(user, mock_s3, sample_file_content):
     """Test upload with invalid storage path (wrong user ID)."""
@@ -71,6 +284,114 @@ def test_delete_file_success(user, mock_s3):
     assert not File.objects.filter(id=file_id).exists()
 
 
+@pytest.mark.django_db
+def test_delete_file_removes_content_on_commit(
+    user,
+    mock_s3,
+    sample_file_content,
+    django_capture_on_commit_callbacks,
+):
+    """Test storage content is removed only once the delete commits."""
+    storage_path = f'{user.id}/test.txt'
+    file_instance = upload_file(user, storage_path, sample_file_content)
+    bucket = mock_s3.Bucket('photo-album')
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        delete_file(file_instance.id)
+        keys = [obj.key for obj in bucket.objects.all()]
+        assert storage_path in keys
+
+    for callback in callbacks:
+        callback()
+
+    assert storage_path not in [obj.key for obj in bucket.objects.all()]
+
+
+@pytest.mark.django_db
+def test_delete_file_loads_narrow_row(user, mock_s3):
+    """Test delete_file skips unused columns and the owner lookup."""
+    UserQuota.objects.create(user=user, quota_bytes=1000, used_bytes=100)
+    file_instance = File.objects.create(
+        user=user,
+        file=f'{user.id}/test.txt',
+        size_bytes=100,
+        mime_type='text/plain',
+        checksum_sha256='abcd' * 16,
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        delete_file(file_instance.id)
+
+    selects = [
+        query['sql']
+        for query in queries.captured_queries
+        if query['sql'].startswith('SELECT')
+    ]
+    assert not any('auth_user' in sql for sql in selects)
+    assert not any('checksum_sha256' in sql for sql in selects)
+    assert UserQuota.objects.get(user=user).used_bytes == 0
+
+
+@pytest.mark.django_db
+def test_delete_files_in_bulk(
+    user,
+    other_user,
+    mock_s3,
+    django_capture_on_commit_callbacks,
+):
+    """Test bulk delete removes only the user's files, rows and content."""
+    paths = [f'{user.id}/bulk{index}.txt' for index in range(3)]
+    file_ids = [
+        upload_file(user, path, ContentFile(b'12345', name='bulk.txt')).id
+        for path in paths
+    ]
+    other_file = upload_file(
+        other_user,
+        f'{other_user.id}/keep.txt',
+        ContentFile(b'12345', name='keep.txt'),
+    )
+
+    bucket = mock_s3.Bucket('photo-album')
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        deleted = delete_files(user, [*file_ids[:2], other_file.id])
+        # Content outlives the rows until the delete commits
+        assert paths[0] in [obj.key for obj in bucket.objects.all()]
+
+    for callback in callbacks:
+        callback()
+
+    assert deleted == 2
+    remaining = File.objects.filter(user=user).values_list('id', flat=True)
+    assert list(remaining) == [file_ids[2]]
+    assert File.objects.filter(id=other_file.id).exists()
+    assert UserQuota.objects.get(user=user).used_bytes == 5
+    keys = [obj.key for obj in bucket.objects.all()]
+    assert paths[0] not in keys
+    assert paths[2] in keys
+
+
+@pytest.mark.django_db
+def test_delete_files_waits_for_locked_rows(user, mock_s3):
+    """Test bulk delete locks its rows without skipping locked ones."""
+    file_instance = upload_file(
+        user,
+        f'{user.id}/locked.txt',
+        ContentFile(b'12345', name='locked.txt'),
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        delete_files(user, [file_instance.id])
+
+    claims = [
+        query['sql']
+        for query in queries.captured_queries
+        if 'FOR UPDATE' in query['sql']
+    ]
+    assert len(claims) == 1
+    assert 'SKIP LOCKED' not in claims[0]
+
+
 @pytest.mark.django_db
 def test_delete_file_not_found(user):
     """Test deleting non-existent file."""
@@ -141,6 +462,46 @@ def test_list_directory_subfolder(user, mock_s3):
     )
 
 
+@pytest.mark.django_db
+def test_list_directory_single_query(user, mock_s3, django_assert_num_queries):
+    """Test listing excludes sibling folders and joins owners in."""
+    for path in ('documents/a.txt', 'documents/b.txt', 'documents2/c.txt'):
+        File.objects.create(
+            user=user,
+            file=f'{user.id}/{path}',
+            size_bytes=100,
+            mime_type='text/plain',
+            checksum_sha256='abcd' * 16,
+        )
+
+    with django_assert_num_queries(1):
+        owners = [
+            file_instance.user.username
+            for file_instance in list_directory(user, 'documents')
+        ]
+
+    assert owners == [user.username, user.username]
+
+
+@pytest.mark.django_db
+def test_folder_exists_uses_key_range(user, mock_s3):
+    """Test folder check is a byte-ordered range scan, not LIKE."""
+    File.objects.create(
+        user=user,
+        file=f'{user.id}/documents2/c.txt',
+        size_bytes=100,
+        mime_type='text/plain',
+        checksum_sha256='abcd' * 16,
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        exists = folder_exists(user, f'{user.id}/documents')
+
+    assert not exists
+    assert folder_exists(user, f'{user.id}/documents2')
+    assert 'LIKE' not in queries.captured_queries[0]['sql']
+
+
 @pytest.mark.django_db
 def test_list_directory_user_isolation(user, other_user, mock_s3):
     """Test that list_directory only returns user's files."""
@@ -170,6 +531,157 @@ def test_list_directory_user_isolation(user, other_user, mock_s3):
     assert files.first().user == user
 
 
+@pytest.mark.django_db
+def test_files_with_prefix(user, other_user, mock_s3):
+    """Test prefix range lookup matches only files under the prefix."""
+    for path in ('docs/a.txt', 'docs/sub/b.txt', 'docs0/c.txt', 'docsx.txt'):
+        File.objects.create(
+            user=user,
+            file=f'{user.id}/{path}',
+            size_bytes=100,
+            mime_type='text/plain',
+            checksum_sha256='abcd' * 16,
+        )
+    File.objects.create(
+        user=other_user,
+        file=f'{other_user.id}/docs/d.txt',
+        size_bytes=100,
+        mime_type='text/plain',
+        checksum_sha256='abcd' * 16,
+    )
+
+    files = files_with_prefix(user, f'{user.id}/docs/')
+
+    assert sorted(files.values_list('file', flat=True)) == [
+        f'{user.id}/docs/a.txt',
+        f'{user.id}/docs/sub/b.txt',
+    ]
+
+
+@pytest.mark.django_db
+def test_list_folder_children(user, mock_s3):
+    """Test children are grouped by first path component."""
+    for path in ('docs/a.txt', 'docs/sub/b.txt', 'docs/sub/c.txt'):
+        File.objects.create(
+            user=user,
+            file=f'{user.id}/{path}',
+            size_bytes=100,
+            mime_type='text/plain',
+            checksum_sha256='abcd' * 16,
+        )
+    latest = File.objects.get(file=f'{user.id}/docs/sub/c.txt')
+
+    children = list_folder_children(user, f'{user.id}/docs/')
+
+    assert sorted(children) == ['a.txt', 'sub']
+    assert children['sub'] == latest.modified_at
+
+
+@pytest.mark.django_db
+def test_resolve_storage_path(user, mock_s3):
+    """Test a path resolves to a file, a folder or nothing."""
+    for path in ('docs', 'docs/a.txt', 'docs-old/b.txt'):
+        File.objects.create(
+            user=user,
+            file=f'{user.id}/{path}',
+            size_bytes=100,
+            mime_type='text/plain',
+            checksum_sha256='abcd' * 16,
+        )
+
+    file_instance, is_folder = resolve_storage_path(user, f'{user.id}/docs')
+    assert file_instance.file.name == f'{user.id}/docs'
+    assert is_folder is False
+
+    file_instance, is_folder = resolve_storage_path(user, f'{user.id}/docs-old')
+    assert file_instance is None
+    assert is_folder is True
+
+    assert resolve_storage_path(user, f'{user.id}/doc') == (None, False)
+
+
+@pytest.mark.django_db
+def test_move_file_storage_failure_keeps_usage(user, mock_s3):
+    """Test a failed storage copy leaves the file and quota untouched."""
+    UserQuota.objects.create(user=user, quota_bytes=1000, used_bytes=100)
+    File.objects.create(
+        user=user,
+        file=f'{user.id}/missing.txt',
+        size_bytes=100,
+        mime_type='text/plain',
+        checksum_sha256='abcd' * 16,
+    )
+
+    with pytest.raises(ClientError):
+        move_file(user, f'{user.id}/missing.txt', f'{user.id}/moved.txt')
+
+    assert File.objects.filter(file=f'{user.id}/missing.txt').exists()
+    assert UserQuota.objects.get(user=user).used_bytes == 100
+
+
+@pytest.mark.django_db
+def test_move_folder_success(user, mock_s3, sample_file_content):
+    """Test folder move rewrites DB paths and moves storage objects."""
+    for name in ('a.txt', 'sub/b.txt'):
+        sample_file_content.seek(0)
+        upload_file(user, f'{user.id}/docs/{name}', sample_file_content)
+    upload_file(user, f'{user.id}/docs2/c.txt', ContentFile(b'other'))
+
+    moved_count = move_folder(user, f'{user.id}/docs', f'{user.id}/archive')
+
+    assert moved_count == 2
+    assert sorted(
+        File.objects.filter(user=user).values_list('file', flat=True),
+    ) == [
+        f'{user.id}/archive/a.txt',
+        f'{user.id}/archive/sub/b.txt',
+        f'{user.id}/docs2/c.txt',
+    ]
+    bucket = mock_s3.Bucket('photo-album')
+    keys = sorted(stored.key for stored in bucket.objects.all())
+    assert keys == [
+        f'{user.id}/archive/a.txt',
+        f'{user.id}/archive/sub/b.txt',
+        f'{user.id}/docs2/c.txt',
+    ]
+
+
+@pytest.mark.django_db
+def test_move_folder_keeps_trashed_file(user, mock_s3):
+    """Test folder move copies trashed destination objects aside."""
+    upload_file(user, f'{user.id}/docs/a.txt', ContentFile(b'new'))
+    trashed = soft_delete_file(
+        upload_file(user, f'{user.id}/archive/a.txt', ContentFile(b'old')),
+    )
+
+    assert move_folder(user, f'{user.id}/docs', f'{user.id}/archive') == 1
+
+    trashed.refresh_from_db()
+    bucket = mock_s3.Bucket('photo-album')
+    assert trashed.is_deleted
+    assert trashed.file.name != f'{user.id}/archive/a.txt'
+    assert bucket.Object(trashed.file.name).get()['Body'].read() == b'old'
+    moved = bucket.Object(f'{user.id}/archive/a.txt').get()['Body'].read()
+    assert moved == b'new'
+
+
+@pytest.mark.django_db
+def test_move_folder_refuses_taken_path(user, mock_s3):
+    """Test folder move onto an existing file changes nothing."""
+    upload_file(user, f'{user.id}/docs/a.txt', ContentFile(b'new'))
+    upload_file(user, f'{user.id}/archive/a.txt', ContentFile(b'old'))
+
+    with pytest.raises(ValidationError):
+        move_folder(user, f'{user.id}/docs', f'{user.id}/archive')
+
+    bucket = mock_s3.Bucket('photo-album')
+    assert sorted(
+        File.objects.filter(user=user).values_list('file', flat=True),
+    ) == [f'{user.id}/archive/a.txt', f'{user.id}/docs/a.txt']
+    stored = bucket.Object(f'{user.id}/archive/a.txt').get()['Body'].read()
+    assert stored == b'old'
+
+
 @pytest.mark.django_db
 def test_update_file_content_success(user, mock_s3, sample_file_content):
     """Test atomic file content update."""
@@ -186,6 +698,9 @@ def test_update_file_content_success(user, mock_s3, sample_file_content):
     # Check file was updated
     assert updated_file.id == file_instance.id
     assert updated_file.checksum_sha256 != original_checksum
+    assert updated_file.checksum_sha256 == hashlib.sha256(
+        b'updated content here',
+    ).hexdigest()
     assert updated_file.size_bytes == 20
 
     # File should still exist in DB
@@ -256,6 +771,27 @@ def test_upload_file_raises_quota_exceeded(user, mock_s3):
     assert File.objects.count() == 0
 
 
+@pytest.mark.django_db
+def test_upload_file_failure_releases_quota(user, mock_s3, monkeypatch):
+    """Test a failed upload gives its quota reservation back."""
+    UserQuota.objects.create(
+        user=user,
+        quota_bytes=100,
+        used_bytes=10,
+    )
+
+    def failing_save(*args, **kwargs):
+        raise RuntimeError('upload failed')
+
+    monkeypatch.setattr(default_storage, 'save', failing_save)
+    content = ContentFile(b'a' * 50, name='test.txt')
+
+    with pytest.raises(RuntimeError, match='upload failed'):
+        upload_file(user, f'{user.id}/test.txt', content)
+
+    assert UserQuota.objects.get(user=user).used_bytes == 10
+
+
 @pytest.mark.django_db
 def test_delete_file_decrements_usage(user, mock_s3, sample_file_content):
     """Test delete_file decrements user's quota usage."""
@@ -315,6 +851,29 @@ def test_copy_file_increments_usage(user, mock_s3, sample_file_content):
     assert quota.used_bytes == original_size * 2
 
 
+@pytest.mark.django_db
+def test_copy_file_copies_server_side(user, mock_s3, monkeypatch):
+    """Test copy_file never streams content through the app."""
+    storage_path = f'{user.id}/original.txt'
+    dest_path = f'{user.id}/copy.txt'
+    source_file = upload_file(
+        user,
+        storage_path,
+        ContentFile(b'test content', name='original.txt'),
+    )
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError('File content must not be downloaded')
+
+    monkeypatch.setattr(FieldFile, 'open', fail_open)
+
+    new_file = copy_file(user, storage_path, dest_path)
+
+    assert new_file.checksum_sha256 == source_file.checksum_sha256
+    stored = mock_s3.Object('photo-album', dest_path).get()['Body'].read()
+    assert stored == b'test content'
+
+
 @pytest.mark.django_db
 def test_update_file_content_adjusts_usage_increase(
     user,
@@ -378,6 +937,32 @@ def test_update_file_content_raises_quota_exceeded(user, mock_s3):
         update_file_content(file_instance.id, large_content)
 
 
+@pytest.mark.django_db
+def test_update_file_content_failure_releases_quota(
+    user,
+    mock_s3,
+    monkeypatch,
+):
+    """Test a failed update gives the reserved size increase back."""
+    storage_path = f'{user.id}/test.txt'
+    file_instance = upload_file(
+        user,
+        storage_path,
+        ContentFile(b'small', name='test.txt'),
+    )
+
+    def failing_save(*args, **kwargs):
+        raise RuntimeError('upload failed')
+
+    monkeypatch.setattr(default_storage, 'save', failing_save)
+    large_content = ContentFile(b'a' * 100, name='test.txt')
+
+    with pytest.raises(RuntimeError, match='upload failed'):
+        update_file_content(file_instance.id, large_content)
+
+    assert UserQuota.objects.get(user=user).used_bytes == 5
+
+
 @pytest.mark.django_db
 def test_update_file_content_size_decrease_no_quota_check(user, mock_s3):
     """Test update with smaller content doesn't check quota."""
@@ -1,5 +1,7 @@
 """Tests for quota operations business logic."""
 
+import pickle  # noqa: S403
+
 import pytest
 
 from server.apps.files.exceptions import QuotaExceededError
@@ -10,6 +12,8 @@ from server.apps.files.logic.quota_operations import (
     get_or_create_quota,
     increment_usage,
     recalculate_usage,
+    release_usage,
+    reserve_quota,
 )
 from server.apps.files.models import File, UserQuota
 
@@ -43,7 +47,24 @@ def test_get_or_create_quota_returns_existing(user):
 
 
 @pytest.mark.django_db
-def test_check_quota_passes_when_space_available(user):
+def test_get_or_create_quota_upserts(
+    user,
+    django_assert_num_queries,
+):
+    """Test missing quota is created by one conflict-ignoring insert."""
+    with django_assert_num_queries(3) as captured:
+        quota = get_or_create_quota(user)
+
+    insert_sql = captured.captured_queries[1]['sql']
+    assert 'ON CONFLICT DO NOTHING' in insert_sql
+    assert quota.used_bytes == 0
+
+
+@pytest.mark.django_db
+def test_check_quota_passes_when_space_available(
+    user,
+    django_assert_num_queries,
+):
     """Test check_quota doesn't raise when space is available."""
     UserQuota.objects.create(
         user=user,
@@ -51,8 +72,9 @@ def test_check_quota_passes_when_space_available(user):
         used_bytes=400,
     )
 
-    # Should not raise
-    check_quota(user, 500)
+    # Should not raise, and the check itself is in memory
+    with django_assert_num_queries(1):
+        check_quota(user, 500)
 
 
 @pytest.mark.django_db
@@ -138,6 +160,49 @@ def test_increment_usage_is_atomic(user):
     assert quota.used_bytes == 150
 
 
+@pytest.mark.django_db
+def test_reserve_quota(user, django_assert_num_queries):
+    """Test reserve_quota adds usage with a single UPDATE."""
+    UserQuota.objects.create(
+        user=user,
+        quota_bytes=1000,
+        used_bytes=400,
+    )
+
+    with django_assert_num_queries(1):
+        reserve_quota(user, 600)
+
+    quota = UserQuota.objects.get(user=user)
+    assert quota.used_bytes == 1000
+
+
+@pytest.mark.django_db
+def test_reserve_quota_raises_when_exceeded(user):
+    """Test reserve_quota leaves usage unchanged when over quota."""
+    UserQuota.objects.create(
+        user=user,
+        quota_bytes=1000,
+        used_bytes=900,
+    )
+
+    with pytest.raises(QuotaExceededError) as exc_info:
+        reserve_quota(user, 200)
+
+    assert exc_info.value.quota_bytes == 1000
+    assert exc_info.value.used_bytes == 900
+    assert exc_info.value.required_bytes == 200
+    assert UserQuota.objects.get(user=user).used_bytes == 900
+
+
+@pytest.mark.django_db
+def test_reserve_quota_creates_quota_on_demand(user):
+    """Test reserve_quota creates missing quota."""
+    reserve_quota(user, 100)
+
+    quota = UserQuota.objects.get(user=user)
+    assert quota.used_bytes == 100
+
+
 @pytest.mark.django_db
 def test_decrement_usage(user):
     """Test decrement_usage decreases used_bytes."""
@@ -154,7 +219,10 @@ def test_decrement_usage(user):
 
 
 @pytest.mark.django_db
-def test_decrement_usage_prevents_negative(user):
+def test_decrement_usage_prevents_negative(
+    user,
+    django_assert_num_queries,
+):
     """Test decrement_usage clamps to 0."""
     UserQuota.objects.create(
         user=user,
@@ -162,12 +230,30 @@ def test_decrement_usage_prevents_negative(user):
         used_bytes=100,
     )
 
-    decrement_usage(user, 200)  # More than current usage
+    with django_assert_num_queries(1):
+        decrement_usage(user, 200)  # More than current usage
 
     quota = UserQuota.objects.get(user=user)
     assert quota.used_bytes == 0
 
 
+@pytest.mark.django_db
+def test_release_usage_many_users_one_query(
+    user,
+    other_user,
+    django_assert_num_queries,
+):
+    """Test usage of several users is released by one clamped UPDATE."""
+    UserQuota.objects.create(user=user, used_bytes=500)
+    UserQuota.objects.create(user=other_user, used_bytes=100)
+
+    with django_assert_num_queries(1):
+        release_usage({user.id: 200, other_user.id: 300})
+
+    assert UserQuota.objects.get(user=user).used_bytes == 300
+    assert UserQuota.objects.get(user=other_user).used_bytes == 0
+
+
 @pytest.mark.django_db
 def test_decrement_usage_no_quota(user):
     """Test decrement_usage does nothing if no quota exists."""
@@ -210,6 +296,31 @@ def test_adjust_usage_decrease(user):
     assert quota.used_bytes == 0  # 100 - 100 = 0
 
 
+@pytest.mark.django_db
+def test_adjust_usage_clamps_in_one_query(user, django_assert_num_queries):
+    """Test adjust_usage clamps to 0 with a single UPDATE."""
+    UserQuota.objects.create(
+        user=user,
+        quota_bytes=1000,
+        used_bytes=100,
+    )
+
+    with django_assert_num_queries(1):
+        adjust_usage(user, old_size=300, new_size=50)
+
+    quota = UserQuota.objects.get(user=user)
+    assert quota.used_bytes == 0
+
+
+@pytest.mark.django_db
+def test_adjust_usage_creates_quota_if_missing(user):
+    """Test adjust_usage creates quota on a size increase."""
+    adjust_usage(user, old_size=50, new_size=150)
+
+    quota = UserQuota.objects.get(user=user)
+    assert quota.used_bytes == 100
+
+
 @pytest.mark.django_db
 def test_adjust_usage_no_change(user):
     """Test adjust_usage with no size change."""
@@ -309,3 +420,17 @@ def test_quota_exceeded_error_message(user):
     assert 'only 100 bytes available' in str(error)
     assert 'quota: 1000' in str(error)
     assert 'used: 900' in str(error)
+
+
+def test_quota_exceeded_error_pickles():
+    """Test QuotaExceededError survives a pickle round-trip."""
+    error = QuotaExceededError(
+        quota_bytes=1000,
+        used_bytes=900,
+        required_bytes=200,
+    )
+
+    restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+    assert restored.required_bytes == 200
+    assert str(restored) == str(error)
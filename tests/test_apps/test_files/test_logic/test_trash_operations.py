@@ -3,18 +3,29 @@
 from datetime import timedelta
 
 import pytest
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models.fields.files import FieldFile
+from django.db.models.signals import post_delete
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from server.apps.files.logic.file_operations import upload_file
 from server.apps.files.logic.trash_operations import (
     _generate_trash_name,
     empty_trash,
+    find_trash_file_by_filename,
     get_trash_file_by_name,
+    get_trash_files_by_names,
+    latest_trash_modified,
     list_trash,
     permanent_delete_file,
+    permanent_delete_files,
     restore_file,
     soft_delete_file,
+    soft_delete_files,
 )
-from server.apps.files.models import File, UserQuota
+from server.apps.files.models import File, Tag, UserQuota
 
 
 @pytest.mark.django_db
@@ -39,6 +50,43 @@ class TestSoftDeleteFile:
         assert result.original_path == original_path
         assert result.trash_name != ''
 
+    def test_soft_delete_single_update(
+        self,
+        user,
+        mock_s3,
+        django_assert_num_queries,
+    ):
+        """Test soft delete reads the path and writes flags in one UPDATE."""
+        file_instance = File.objects.create(
+            user=user,
+            file=f'{user.id}/documents/test.txt',
+            size_bytes=100,
+            mime_type='text/plain',
+            checksum_sha256='a' * 64,
+        )
+
+        with django_assert_num_queries(2):
+            soft_delete_file(file_instance.id)
+
+        stored = File.all_objects.get(id=file_instance.id)
+        assert stored.is_deleted is True
+        assert stored.modified_at == stored.deleted_at
+
+    def test_soft_delete_instance_skips_select(
+        self,
+        make_files,
+        django_assert_num_queries,
+    ):
+        """Test soft deleting a loaded instance runs only the UPDATE."""
+        (file_instance,) = make_files('test.txt')
+
+        with django_assert_num_queries(1):
+            result = soft_delete_file(file_instance)
+
+        assert result is file_instance
+        assert file_instance.is_deleted is True
+        assert File.all_objects.get(id=file_instance.id).is_deleted is True
+
     def test_soft_delete_preserves_storage(self, user, mock_s3):
         """Test soft delete doesn't remove file from S3."""
         storage_path = f'{user.id}/documents/test.txt'
@@ -65,9 +113,9 @@ class TestSoftDeleteFile:
         ))
         assert len(objs) == 1
 
-    def test_soft_delete_quota_unchanged(self, user, mock_s3):
+    def test_soft_delete_quota_unchanged(self, user, mock_s3, used_bytes):
         """Test soft delete does not decrement quota."""
-        quota = UserQuota.objects.create(
+        UserQuota.objects.create(
             user=user,
             quota_bytes=10 * 1024 * 1024,
             used_bytes=100,
@@ -83,8 +131,7 @@ class TestSoftDeleteFile:
 
         soft_delete_file(file_instance.id)
 
-        quota.refresh_from_db()
-        assert quota.used_bytes == 100  # Unchanged
+        assert used_bytes(user) == 100  # Unchanged
 
     def test_soft_delete_file_not_found(self, user, mock_s3):
         """Test soft delete raises for non-existent file."""
@@ -111,6 +158,31 @@ class TestTrashNameGeneration:
         assert name1 != name2
 
 
+@pytest.mark.django_db
+class TestSoftDeleteFiles:
+    """Tests for soft_delete_files function."""
+
+    def test_soft_delete_many_in_one_update(
+        self,
+        make_files,
+        django_assert_num_queries,
+    ):
+        """Test bulk soft delete shares a timestamp and keeps names unique."""
+        files = make_files('a/report.pdf', 'b/report.pdf', 'c.txt')
+
+        with django_assert_num_queries(1):
+            count = soft_delete_files(files)
+
+        trashed = list(File.all_objects.filter(is_deleted=True))
+        assert count == 3
+        assert len(trashed) == 3
+        assert len({file.deleted_at for file in trashed}) == 1
+        assert len({file.trash_name for file in trashed}) == 3
+        assert {file.original_path for file in trashed} == {
+            file.file.name for file in files
+        }
+
+
 @pytest.mark.django_db
 class TestRestoreFile:
     """Tests for restore_file function."""
@@ -133,11 +205,26 @@ class TestRestoreFile:
         assert result.original_path == ''
         assert result.trash_name == ''
 
+    def test_restore_accepts_instance(self, user, make_files, bulk_soft_delete):
+        """Test restore works on an already loaded trashed instance."""
+        (file_instance,) = make_files('test.txt')
+        bulk_soft_delete(file_instance)
+        trashed = File.all_objects.get(id=file_instance.id)
+
+        result = restore_file(trashed)
+
+        assert result.is_deleted is False
+        assert File.objects.filter(id=file_instance.id).exists()
+
+    def test_restore_instance_requires_is_deleted(self, make_files):
+        """Test restore rejects an instance that is not in trash."""
+        (file_instance,) = make_files('test.txt')
+
+        with pytest.raises(File.DoesNotExist):
+            restore_file(file_instance)
+
     def test_restore_to_original_path(self, user, mock_s3):
         """Test restore uses original path by default."""
-        from django.core.files.base import ContentFile
-        from server.apps.files.logic.file_operations import upload_file
-
         original_path = f'{user.id}/docs/test.txt'
         content = ContentFile(b'test content', name='test.txt')
         file_instance = upload_file(user, original_path, content)
@@ -152,9 +239,6 @@ class TestRestoreFile:
 
     def test_restore_to_custom_path(self, user, mock_s3):
         """Test restore to custom destination path."""
-        from django.core.files.base import ContentFile
-        from server.apps.files.logic.file_operations import upload_file
-
         original_path = f'{user.id}/test.txt'
         dest_path = f'{user.id}/restored/new_test.txt'
 
@@ -169,15 +253,37 @@ class TestRestoreFile:
         assert result.file.name.startswith(f'{user.id}/restored/new_test')
         assert result.is_deleted is False
 
+    def test_restore_copies_server_side(self, user, mock_s3, monkeypatch):
+        """Test restore to a new path never streams content via the app."""
+        original_path = f'{user.id}/test.txt'
+        dest_path = f'{user.id}/restored/test.txt'
+        file_instance = upload_file(
+            user,
+            original_path,
+            ContentFile(b'test content', name='test.txt'),
+        )
+        soft_delete_file(file_instance.id)
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError('File content must not be downloaded')
+
+        monkeypatch.setattr(FieldFile, 'open', fail_open)
+
+        restore_file(file_instance.id, dest_path)
+
+        bucket = mock_s3.Bucket('photo-album')
+        keys = [obj.key for obj in bucket.objects.all()]
+        assert original_path not in keys
+        assert dest_path in keys
+        stored = bucket.Object(dest_path).get()['Body'].read()
+        assert stored == b'test content'
+
     def test_restore_auto_rename_conflict(self, user, mock_s3):
         """Test restore auto-renames when restoring to occupied path.
 
         Scenario: File A and B exist. Delete A. Try to restore A but specify
         B's path as destination. Should rename to avoid conflict.
         """
-        from django.core.files.base import ContentFile
-        from server.apps.files.logic.file_operations import upload_file
-
         path_a = f'{user.id}/file_a.txt'
         path_b = f'{user.id}/file_b.txt'
 
@@ -201,8 +307,6 @@ class TestRestoreFile:
 
     def test_restore_preserves_tags(self, user, mock_s3):
         """Test restore keeps tags attached to file."""
-        from server.apps.files.models import Tag
-
         tag = Tag.objects.create(user=user, name='important')
 
         file_instance = File.objects.create(
@@ -253,9 +357,9 @@ class TestPermanentDeleteFile:
 
         assert not File.all_objects.filter(id=file_id).exists()
 
-    def test_permanent_delete_updates_quota(self, user, mock_s3):
+    def test_permanent_delete_updates_quota(self, user, mock_s3, used_bytes):
         """Test permanent delete decrements quota."""
-        quota = UserQuota.objects.create(
+        UserQuota.objects.create(
             user=user,
             quota_bytes=10 * 1024 * 1024,
             used_bytes=100,
@@ -272,8 +376,82 @@ class TestPermanentDeleteFile:
 
         permanent_delete_file(file_instance.id)
 
+        assert used_bytes(user) == 0
+
+    def test_permanent_delete_skips_model_signals(
+        self,
+        user,
+        mock_s3,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test permanent delete removes tags and content without signals."""
+        storage_path = f'{user.id}/test.txt'
+        bucket = mock_s3.Bucket('photo-album')
+        bucket.put_object(Key=storage_path, Body=b'x')
+        file_instance = File.objects.create(
+            user=user,
+            file=storage_path,
+            size_bytes=1,
+            mime_type='text/plain',
+            checksum_sha256='a' * 64,
+        )
+        file_instance.tags.add(Tag.objects.create(user=user, name='old'))
+        soft_delete_file(file_instance.id)
+        received = []
+
+        def receiver(**kwargs):
+            received.append(kwargs['instance'])
+
+        post_delete.connect(receiver, sender=File)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                permanent_delete_file(file_instance.id)
+        finally:
+            post_delete.disconnect(receiver, sender=File)
+
+        assert not received
+        assert not File.tags.through.objects.exists()
+        assert not list(bucket.objects.all())
+
+    def test_permanent_delete_clamps_quota_at_zero(
+        self,
+        user,
+        mock_s3,
+        make_files,
+        bulk_soft_delete,
+    ):
+        """Test permanent delete never drives usage below zero."""
+        quota = UserQuota.objects.create(user=user, used_bytes=40)
+        (file_instance,) = make_files('test.txt', size_bytes=100)
+        bulk_soft_delete(file_instance)
+
+        permanent_delete_file(file_instance.id)
+
         quota.refresh_from_db()
         assert quota.used_bytes == 0
+        assert quota.available_bytes() == quota.quota_bytes
+
+    def test_permanent_delete_waits_for_locked_row(
+        self,
+        user,
+        mock_s3,
+        make_files,
+        bulk_soft_delete,
+    ):
+        """Test a locked row is waited for instead of reported missing."""
+        (file_instance,) = make_files('test.txt')
+        bulk_soft_delete(file_instance)
+
+        with CaptureQueriesContext(connection) as queries:
+            permanent_delete_file(file_instance.id)
+
+        claims = [
+            query['sql']
+            for query in queries.captured_queries
+            if 'FOR UPDATE' in query['sql']
+        ]
+        assert len(claims) == 1
+        assert 'SKIP LOCKED' not in claims[0]
 
     def test_permanent_delete_requires_is_deleted(self, user, mock_s3):
         """Test permanent delete raises for non-deleted file."""
@@ -288,99 +466,130 @@ class TestPermanentDeleteFile:
         with pytest.raises(File.DoesNotExist):
             permanent_delete_file(file_instance.id)
 
+    def test_permanent_delete_files_in_bulk(
+        self,
+        user,
+        mock_s3,
+        used_bytes,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test bulk delete removes rows, objects and quota usage."""
+        UserQuota.objects.create(
+            user=user,
+            quota_bytes=10 * 1024 * 1024,
+            used_bytes=250,
+        )
+        tag = Tag.objects.create(user=user, name='old')
+        bucket = mock_s3.Bucket('photo-album')
+        file_ids = []
+        for index in range(3):
+            storage_path = f'{user.id}/file{index}.txt'
+            bucket.put_object(Key=storage_path, Body=b'x')
+            file_instance = File.objects.create(
+                user=user,
+                file=storage_path,
+                size_bytes=50,
+                mime_type='text/plain',
+                checksum_sha256='a' * 64,
+            )
+            file_instance.tags.add(tag)
+            file_ids.append(file_instance.id)
+        for file_id in file_ids[:2]:
+            soft_delete_file(file_id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            deleted = permanent_delete_files(file_ids)
+
+        # The active file is left alone
+        assert deleted == 2
+        assert list(File.all_objects.values_list('id', flat=True)) == [
+            file_ids[2],
+        ]
+        assert [obj.key for obj in bucket.objects.all()] == [
+            f'{user.id}/file2.txt',
+        ]
+        assert tag.files.count() == 1
+        assert used_bytes(user) == 150
+
 
 @pytest.mark.django_db
 class TestListTrash:
     """Tests for list_trash function."""
 
-    def test_list_trash_returns_deleted_only(self, user, mock_s3):
+    def test_list_trash_returns_deleted_only(
+        self,
+        user,
+        make_files,
+        bulk_soft_delete,
+    ):
         """Test list_trash only returns deleted files."""
-        # Create non-deleted file
-        File.objects.create(
-            user=user,
-            file=f'{user.id}/active.txt',
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
-        )
-
-        # Create and delete another file
-        file2 = File.objects.create(
-            user=user,
-            file=f'{user.id}/deleted.txt',
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
-        )
-        soft_delete_file(file2.id)
+        # Create a non-deleted file and a deleted one
+        _, file2 = make_files('active.txt', 'deleted.txt')
+        bulk_soft_delete(file2)
 
         trash_files = list(list_trash(user))
 
         assert len(trash_files) == 1
         assert trash_files[0].id == file2.id
 
-    def test_list_trash_sorted_by_deleted_at(self, user, mock_s3):
+    def test_list_trash_sorted_by_deleted_at(
+        self,
+        user,
+        make_files,
+        bulk_soft_delete,
+    ):
         """Test list_trash returns newest first."""
-        file1 = File.objects.create(
-            user=user,
-            file=f'{user.id}/old.txt',
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
-        )
-        soft_delete_file(file1.id)
+        file1, file2 = make_files('old.txt', 'new.txt')
+        bulk_soft_delete(file1, file2)
         # Set older deleted_at time
         File.all_objects.filter(id=file1.id).update(
             deleted_at=timezone.now() - timedelta(days=1),
         )
 
-        file2 = File.objects.create(
-            user=user,
-            file=f'{user.id}/new.txt',
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
-        )
-        soft_delete_file(file2.id)
-
         trash_files = list(list_trash(user))
 
         assert len(trash_files) == 2
         assert trash_files[0].id == file2.id  # Newer first
         assert trash_files[1].id == file1.id
 
+    def test_latest_trash_modified(self, user, mock_s3):
+        """Test latest_trash_modified returns newest deletion time."""
+        assert latest_trash_modified(user) is None
+
+        file_instance = File.objects.create(
+            user=user,
+            file=f'{user.id}/deleted.txt',
+            size_bytes=100,
+            mime_type='text/plain',
+            checksum_sha256='a' * 64,
+        )
+        deleted = soft_delete_file(file_instance.id)
+
+        assert latest_trash_modified(user) == deleted.deleted_at
+
 
 @pytest.mark.django_db
 class TestEmptyTrash:
     """Tests for empty_trash function."""
 
-    def test_empty_trash_deletes_all(self, user, mock_s3):
+    def test_empty_trash_deletes_all(
+        self,
+        user,
+        mock_s3,
+        make_files,
+        bulk_soft_delete,
+    ):
         """Test empty_trash permanently deletes all trashed files."""
-        file1 = File.objects.create(
-            user=user,
-            file=f'{user.id}/file1.txt',
-            size_bytes=50,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
-        )
-        file2 = File.objects.create(
-            user=user,
-            file=f'{user.id}/file2.txt',
-            size_bytes=50,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
-        )
-        soft_delete_file(file1.id)
-        soft_delete_file(file2.id)
+        bulk_soft_delete(*make_files('file1.txt', 'file2.txt'))
 
         count = empty_trash(user)
 
         assert count == 2
         assert not File.all_objects.filter(user=user).exists()
 
-    def test_empty_trash_updates_quota(self, user, mock_s3):
+    def test_empty_trash_updates_quota(self, user, mock_s3, used_bytes):
         """Test empty_trash decrements quota for all files."""
-        quota = UserQuota.objects.create(
+        UserQuota.objects.create(
             user=user,
             quota_bytes=10 * 1024 * 1024,
             used_bytes=100,
@@ -405,8 +614,48 @@ class TestEmptyTrash:
 
         empty_trash(user)
 
-        quota.refresh_from_db()
-        assert quota.used_bytes == 0
+        assert used_bytes(user) == 0
+
+    def test_empty_trash_runs_constant_queries(
+        self,
+        user,
+        mock_s3,
+        make_files,
+        bulk_soft_delete,
+        django_assert_num_queries,
+    ):
+        """Test empty_trash cost does not grow with trash size."""
+        UserQuota.objects.create(user=user, used_bytes=500)
+        names = [f'file{index}.txt' for index in range(5)]
+        bulk_soft_delete(*make_files(*names, size_bytes=100))
+
+        # Savepoint, claim, tags, delete, quota, release savepoint
+        with django_assert_num_queries(6):
+            count = empty_trash(user)
+
+        assert count == 5
+        assert UserQuota.objects.get(user=user).used_bytes == 0
+
+    def test_empty_trash_waits_for_locked_rows(
+        self,
+        user,
+        mock_s3,
+        make_files,
+        bulk_soft_delete,
+    ):
+        """Test empty_trash never leaves rows locked elsewhere in trash."""
+        bulk_soft_delete(*make_files('file.txt'))
+
+        with CaptureQueriesContext(connection) as queries:
+            empty_trash(user)
+
+        claims = [
+            query['sql']
+            for query in queries.captured_queries
+            if 'FOR UPDATE' in query['sql']
+        ]
+        assert len(claims) == 1
+        assert 'SKIP LOCKED' not in claims[0]
 
 
 @pytest.mark.django_db
@@ -435,49 +684,105 @@ class TestGetTrashFileByName:
 
 
 @pytest.mark.django_db
-class TestModelManagers:
-    """Tests for custom model managers."""
+class TestGetTrashFilesByNames:
+    """Tests for get_trash_files_by_names function."""
+
+    def test_get_many_in_one_query(
+        self,
+        make_files,
+        bulk_soft_delete,
+        django_assert_num_queries,
+    ):
+        """Test batch lookup maps found trash names to files."""
+        files = make_files('a.txt', 'b.txt', 'active.txt')
+        bulk_soft_delete(*files[:2])
+        trashed = File.all_objects.filter(is_deleted=True)
+        names = [file_instance.trash_name for file_instance in trashed]
+        user = files[0].user
+
+        with django_assert_num_queries(1):
+            found = get_trash_files_by_names(user, [*names, 'missing.txt'])
+
+        assert sorted(found) == sorted(names)
+        assert {found_file.id for found_file in found.values()} == {
+            files[0].id,
+            files[1].id,
+        }
 
-    def test_default_manager_excludes_deleted(self, user, mock_s3):
-        """Test File.objects excludes soft-deleted files."""
-        file1 = File.objects.create(
+
+@pytest.mark.django_db
+class TestFindTrashFileByFilename:
+    """Tests for find_trash_file_by_filename function."""
+
+    def test_find_newest_by_filename(self, user, mock_s3):
+        """Test lookup returns most recently deleted matching file."""
+        older = File.objects.create(
             user=user,
-            file=f'{user.id}/active.txt',
+            file=f'{user.id}/a/report.pdf',
             size_bytes=100,
-            mime_type='text/plain',
+            mime_type='application/pdf',
             checksum_sha256='a' * 64,
         )
-        file2 = File.objects.create(
+        soft_delete_file(older.id)
+        File.all_objects.filter(id=older.id).update(
+            deleted_at=timezone.now() - timedelta(days=1),
+        )
+        newer = File.objects.create(
             user=user,
-            file=f'{user.id}/deleted.txt',
+            file=f'{user.id}/b/report.pdf',
             size_bytes=100,
-            mime_type='text/plain',
+            mime_type='application/pdf',
             checksum_sha256='b' * 64,
         )
-        soft_delete_file(file2.id)
+        soft_delete_file(newer.id)
+
+        found = find_trash_file_by_filename(user, 'report.pdf')
+
+        assert found is not None
+        assert found.id == newer.id
+
+    def test_find_by_filename_not_found(self, user, mock_s3):
+        """Test lookup ignores partial filename matches."""
+        file_instance = File.objects.create(
+            user=user,
+            file=f'{user.id}/myreport.pdf',
+            size_bytes=100,
+            mime_type='application/pdf',
+            checksum_sha256='a' * 64,
+        )
+        soft_delete_file(file_instance.id)
+
+        assert find_trash_file_by_filename(user, 'report.pdf') is None
+
+
+@pytest.mark.django_db
+class TestModelManagers:
+    """Tests for custom model managers."""
+
+    def test_default_manager_excludes_deleted(
+        self,
+        user,
+        make_files,
+        bulk_soft_delete,
+    ):
+        """Test File.objects excludes soft-deleted files."""
+        file1, file2 = make_files('active.txt', 'deleted.txt')
+        bulk_soft_delete(file2)
 
         # Default manager should only return active files
         files = list(File.objects.filter(user=user))
         assert len(files) == 1
         assert files[0].id == file1.id
 
-    def test_all_objects_includes_deleted(self, user, mock_s3):
+    def test_all_objects_includes_deleted(
+        self,
+        user,
+        make_files,
+        bulk_soft_delete,
+    ):
         """Test File.all_objects includes soft-deleted files."""
-        file1 = File.objects.create(
-            user=user,
-            file=f'{user.id}/active.txt',
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
-        )
-        file2 = File.objects.create(
-            user=user,
-            file=f'{user.id}/deleted.txt',
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
-        )
-        soft_delete_file(file2.id)
+        _, file2 = make_files('active.txt', 'deleted.txt')
+        bulk_soft_delete(file2)
 
         # all_objects should return both
         files = list(File.all_objects.filter(user=user))
@@ -1,6 +1,7 @@
 """Tests for File model."""
 
 import pytest
+from django.db import connection
 
 from server.apps.files.models import File
 
@@ -20,6 +21,28 @@ def test_file_model_str(user, mock_s3):
     assert str(file_instance) == expected
 
 
+@pytest.mark.django_db
+def test_file_model_str_without_loaded_user(
+    user,
+    mock_s3,
+    django_assert_num_queries,
+):
+    """Test File __str__ does not fetch an unloaded owner."""
+    File.objects.create(
+        user=user,
+        file=f'{user.id}/test.txt',
+        size_bytes=100,
+        mime_type='text/plain',
+        checksum_sha256='abcd' * 16,
+    )
+    file_instance = File.objects.get(file=f'{user.id}/test.txt')
+
+    with django_assert_num_queries(0):
+        file_repr = str(file_instance)
+
+    assert file_repr == f'{user.id}:{user.id}/test.txt'
+
+
 @pytest.mark.django_db
 def test_file_get_filename(user, mock_s3):
     """Test get_filename method extracts filename correctly."""
@@ -63,6 +86,15 @@ def test_file_get_extension(user, mock_s3):
     assert file_instance.get_extension() == 'pdf'
 
 
+def test_file_path_helpers_on_folder_marker(user):
+    """Test path helpers treat a dotfile as a name without extension."""
+    file_instance = File(user=user, file=f'{user.id}/docs/.folder')
+
+    assert file_instance.get_filename() == '.folder'
+    assert file_instance.get_folder_path() == f'{user.id}/docs'
+    assert not file_instance.get_extension()
+
+
 @pytest.mark.django_db
 def test_file_cascade_delete_with_user(user, mock_s3):
     """Test files are deleted when user is deleted."""
@@ -80,3 +112,32 @@ def test_file_cascade_delete_with_user(user, mock_s3):
 
     # File should be cascade deleted
     assert File.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_file_path_indexes_exist():
+    """Test directory prefix scans have (user, file) indexes to use."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(
+            cursor,
+            File._meta.db_table,  # noqa: SLF001
+        )
+
+    for index_name in ('files_user_file_idx', 'files_user_file_range_idx'):
+        assert constraints[index_name]['index']
+    assert constraints['files_user_file_idx']['columns'] == ['user_id', 'file']
+    assert 'files_user_file_prefix_idx' not in constraints
+
+
+@pytest.mark.django_db
+def test_trash_index_matches_listing_order():
+    """Test trash listings read (user, deleted_at DESC) index order."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(
+            cursor,
+            File._meta.db_table,  # noqa: SLF001
+        )
+
+    trash_index = constraints['files_user_trash_idx']
+    assert trash_index['columns'] == ['user_id', 'deleted_at']
+    assert trash_index['orders'] == ['ASC', 'DESC']
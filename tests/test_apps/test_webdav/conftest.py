@@ -42,9 +42,13 @@ def other_user(db):
     )
 
 
-@pytest.fixture
-def mock_s3():
-    """Mock S3 service with photo-album bucket.
+@pytest.fixture(scope='package')
+def s3_service():
+    """Mock S3 service with photo-album bucket, shared by the app's tests.
+
+    Package scope starts moto once per app test directory instead of
+    once per module, while keeping the mock inactive for other tests
+    (e.g. MinIO integration tests that need real S3 calls).
 
     Yields:
         boto3 S3 resource with photo-album bucket created.
@@ -59,6 +63,20 @@ def mock_s3():
         yield conn
 
 
+@pytest.fixture
+def mock_s3(s3_service):
+    """Mock S3 service with an empty photo-album bucket.
+
+    Reuses the shared mock and only removes objects left by earlier
+    tests, which is much cheaper than starting a new mock per test.
+
+    Returns:
+        boto3 S3 resource with photo-album bucket created.
+    """
+    s3_service.Bucket('photo-album').objects.all().delete()
+    return s3_service
+
+
 @pytest.fixture
 def path_mapper(user):
     """Create PathMapper for test user.
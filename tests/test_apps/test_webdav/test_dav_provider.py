@@ -2,10 +2,14 @@
 
 import pytest
 
+from server.apps.files.logic.trash_operations import soft_delete_file
 from server.apps.files.models import File
 from server.apps.webdav.domain_controller import ENVIRON_USER_KEY
 from server.apps.webdav.resources.collection import FolderCollection
 from server.apps.webdav.resources.file_resource import FileResource
+from server.apps.webdav.resources.trash_file_resource import (
+    TrashFileResource,
+)
 
 
 class TestDjangoDAVProvider:
@@ -62,6 +66,51 @@ class TestDjangoDAVProvider:
         assert resource is not None
         assert isinstance(resource, FolderCollection)
 
+    @pytest.mark.django_db
+    def test_get_resource_inst_trash_file_reuses_listing(
+        self,
+        dav_provider,
+        user,
+        webdav_environ,
+        sample_file,
+        mock_s3,
+        django_assert_num_queries,
+    ):
+        """Test trash members resolve from the request's trash listing."""
+        soft_delete_file(sample_file.id)
+        trash = dav_provider.get_resource_inst('/.Trash/', webdav_environ)
+        assert trash.get_member_names() == ['test.txt']
+
+        with django_assert_num_queries(0):
+            resource = dav_provider.get_resource_inst(
+                '/.Trash/test.txt',
+                webdav_environ,
+            )
+
+        assert isinstance(resource, TrashFileResource)
+
+    @pytest.mark.django_db
+    def test_get_resource_inst_trash_file_single_row(
+        self,
+        dav_provider,
+        user,
+        webdav_environ,
+        sample_file,
+        mock_s3,
+        django_assert_num_queries,
+    ):
+        """Test a trash file resolves without listing the whole trash."""
+        soft_delete_file(sample_file.id)
+
+        with django_assert_num_queries(1) as queries:
+            resource = dav_provider.get_resource_inst(
+                '/.Trash/test.txt',
+                webdav_environ,
+            )
+
+        assert isinstance(resource, TrashFileResource)
+        assert 'LIMIT 1' in queries.captured_queries[0]['sql']
+
     @pytest.mark.django_db
     def test_get_resource_inst_not_found(
         self,
@@ -3,13 +3,21 @@
 from io import BytesIO
 
 import pytest
+from django.core.cache import cache
 
+from server.apps.webdav import domain_controller as domain_controller_module
 from server.apps.webdav.domain_controller import (
     ENVIRON_USER_KEY,
     DjangoDomainController,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test without cached credentials."""
+    cache.clear()
+
+
 @pytest.fixture
 def domain_controller():
     """Create domain controller instance.
@@ -138,3 +146,93 @@ class TestDjangoDomainController:
 
         assert result is False
         assert ENVIRON_USER_KEY not in minimal_environ
+
+    @pytest.mark.django_db
+    def test_basic_auth_user_cached(
+        self,
+        domain_controller,
+        user,
+        minimal_environ,
+        monkeypatch,
+        django_assert_num_queries,
+    ):
+        """Test repeated credentials skip Django authentication."""
+        domain_controller.basic_auth_user(
+            'Photo Album',
+            'testuser',
+            'testpass123',
+            {**minimal_environ},
+        )
+
+        def fail_authenticate(**kwargs):
+            raise AssertionError('authenticate() should not be called')
+
+        monkeypatch.setattr(
+            domain_controller_module,
+            'authenticate',
+            fail_authenticate,
+        )
+        with django_assert_num_queries(1):
+            result = domain_controller.basic_auth_user(
+                'Photo Album',
+                'testuser',
+                'testpass123',
+                minimal_environ,
+            )
+
+        assert result is True
+        assert minimal_environ[ENVIRON_USER_KEY].pk == user.pk
+
+    @pytest.mark.django_db
+    def test_basic_auth_user_cache_password_change(
+        self,
+        domain_controller,
+        user,
+        minimal_environ,
+    ):
+        """Test cached credentials stop working after a password change."""
+        domain_controller.basic_auth_user(
+            'Photo Album',
+            'testuser',
+            'testpass123',
+            {**minimal_environ},
+        )
+        user.set_password('newpass456')
+        user.save()
+
+        result = domain_controller.basic_auth_user(
+            'Photo Album',
+            'testuser',
+            'testpass123',
+            minimal_environ,
+        )
+
+        assert result is False
+        assert ENVIRON_USER_KEY not in minimal_environ
+
+    @pytest.mark.django_db
+    def test_basic_auth_user_cache_inactive(
+        self,
+        domain_controller,
+        user,
+        minimal_environ,
+    ):
+        """Test cached credentials stop working for a deactivated user."""
+        domain_controller.basic_auth_user(
+            'Photo Album',
+            'testuser',
+            'testpass123',
+            {**minimal_environ},
+        )
+        user.is_active = False
+        user.save()
+
+        result = domain_controller.basic_auth_user(
+            'Photo Album',
+            'testuser',
+            'testpass123',
+            minimal_environ,
+        )
+
+        assert result is False
+        assert ENVIRON_USER_KEY not in minimal_environ
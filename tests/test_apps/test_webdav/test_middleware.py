@@ -0,0 +1,73 @@
+"""Tests for WebDAV WSGI middleware."""
+
+from io import BytesIO
+
+import pytest
+from django.core.cache import cache
+
+from server.apps.files.logic.trash_operations import soft_delete_file
+from server.apps.webdav.domain_controller import ENVIRON_USER_KEY
+from server.apps.webdav.middleware import (
+    REQUEST_TIME_KEY,
+    RequestTimeMiddleware,
+    TrashPropfindCacheMiddleware,
+    get_request_time,
+)
+
+
+def test_request_time_middleware_stamps_environ():
+    """Test middleware records request time before calling next app."""
+    seen: dict = {}
+
+    def next_app(environ, start_response):
+        seen.update(environ)
+        return [b'']
+
+    middleware = RequestTimeMiddleware(None, next_app, {})
+    middleware({}, lambda *args: None)
+
+    assert seen[REQUEST_TIME_KEY] > 0
+
+
+def test_get_request_time_uses_stamp():
+    """Test stamped time is reused."""
+    assert get_request_time({REQUEST_TIME_KEY: 123}) == 123
+
+
+def test_get_request_time_fallback():
+    """Test fallback to current time without stamp."""
+    assert get_request_time({}) > 0
+
+
+@pytest.mark.django_db
+def test_trash_propfind_cache(user, sample_file, mock_s3):
+    """Test trash PROPFIND is served from cache until trash changes."""
+    cache.clear()
+    calls: list[str] = []
+
+    def next_app(environ, start_response):
+        calls.append(environ['wsgi.input'].read())
+        start_response('207 Multi-Status', [('Content-Type', 'text/xml')])
+        return [b'<multistatus/>']
+
+    def make_environ():
+        return {
+            ENVIRON_USER_KEY: user,
+            'REQUEST_METHOD': 'PROPFIND',
+            'PATH_INFO': '/.Trash/',
+            'HTTP_DEPTH': '1',
+            'CONTENT_LENGTH': '6',
+            'wsgi.input': BytesIO(b'<body>'),
+        }
+
+    middleware = TrashPropfindCacheMiddleware(None, next_app, {})
+    first = middleware(make_environ(), lambda *args: None)
+    second = middleware(make_environ(), lambda *args: None)
+
+    assert first == second == [b'<multistatus/>']
+    assert calls == [b'<body>']
+
+    soft_delete_file(sample_file.id)
+    middleware(make_environ(), lambda *args: None)
+
+    assert len(calls) == 2
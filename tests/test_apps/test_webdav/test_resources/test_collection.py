@@ -48,6 +48,7 @@ class TestFolderCollection:
         sample_file,
         path_mapper,
         mock_s3,
+        django_assert_num_queries,
     ):
         """Test last modified based on files in folder."""
         collection = FolderCollection(
@@ -57,9 +58,13 @@ class TestFolderCollection:
             path_mapper,
         )
 
-        last_modified = collection.get_last_modified()
+        # Aggregated together with the listing in a single query
+        with django_assert_num_queries(1):
+            last_modified = collection.get_last_modified()
+            member_names = collection.get_member_names()
 
         assert last_modified == sample_file.modified_at.timestamp()
+        assert member_names == ['test.txt']
 
     @pytest.mark.django_db
     def test_get_member_names_root(
@@ -68,23 +73,11 @@ class TestFolderCollection:
         webdav_environ,
         path_mapper,
         mock_s3,
+        make_files,
     ):
         """Test listing root directory members."""
         # Create files in root and subdirectory
-        File.objects.create(
-            user=user,
-            file='{id}/file1.txt'.format(id=user.id),
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
-        )
-        File.objects.create(
-            user=user,
-            file='{id}/documents/file2.txt'.format(id=user.id),
-            size_bytes=200,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
-        )
+        make_files('file1.txt', 'documents/file2.txt')
 
         collection = FolderCollection('/', webdav_environ, user, path_mapper)
 
@@ -100,23 +93,12 @@ class TestFolderCollection:
         webdav_environ,
         path_mapper,
         mock_s3,
+        make_files,
+        django_assert_num_queries,
     ):
         """Test listing subfolder members."""
         # Create files in documents and its subdirectory
-        File.objects.create(
-            user=user,
-            file='{id}/documents/file1.txt'.format(id=user.id),
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
-        )
-        File.objects.create(
-            user=user,
-            file='{id}/documents/reports/file2.txt'.format(id=user.id),
-            size_bytes=200,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
-        )
+        make_files('documents/file1.txt', 'documents/reports/file2.txt')
 
         collection = FolderCollection(
             '/documents',
@@ -125,7 +107,9 @@ class TestFolderCollection:
             path_mapper,
         )
 
-        members = collection.get_member_names()
+        # Only the listing itself; .Trash is looked up at the root only
+        with django_assert_num_queries(1):
+            members = collection.get_member_names()
 
         assert sorted(members) == ['file1.txt', 'reports']
 
@@ -137,6 +121,7 @@ class TestFolderCollection:
         sample_file,
         path_mapper,
         mock_s3,
+        django_assert_num_queries,
     ):
         """Test getting file member."""
         collection = FolderCollection(
@@ -146,7 +131,8 @@ class TestFolderCollection:
             path_mapper,
         )
 
-        member = collection.get_member('test.txt')
+        with django_assert_num_queries(1):
+            member = collection.get_member('test.txt')
 
         assert isinstance(member, FileResource)
 
@@ -157,6 +143,7 @@ class TestFolderCollection:
         webdav_environ,
         path_mapper,
         mock_s3,
+        django_assert_num_queries,
     ):
         """Test getting folder member."""
         # Create file in subfolder
@@ -175,10 +162,49 @@ class TestFolderCollection:
             path_mapper,
         )
 
-        member = collection.get_member('reports')
+        with django_assert_num_queries(1):
+            member = collection.get_member('reports')
 
         assert isinstance(member, FolderCollection)
 
+    @pytest.mark.django_db
+    def test_get_member_list_batches_files(
+        self,
+        user,
+        webdav_environ,
+        path_mapper,
+        mock_s3,
+        make_files,
+        django_assert_num_queries,
+    ):
+        """Test resolving all members loads files in one query."""
+        make_files(
+            'documents/a.txt',
+            'documents/b.txt',
+            'documents/c.txt',
+            'documents/reports/d.txt',
+        )
+
+        collection = FolderCollection(
+            '/documents',
+            webdav_environ,
+            user,
+            path_mapper,
+        )
+
+        # Listing plus one batch load of the files
+        with django_assert_num_queries(2):
+            members = collection.get_member_list()
+
+        assert [member.name for member in members] == [
+            'a.txt',
+            'b.txt',
+            'c.txt',
+            'reports',
+        ]
+        assert isinstance(members[0], FileResource)
+        assert isinstance(members[3], FolderCollection)
+
     @pytest.mark.django_db
     def test_get_member_not_found(
         self,
@@ -245,6 +271,7 @@ class TestFolderCollection:
         webdav_environ,
         path_mapper,
         mock_s3,
+        make_files,
     ):
         """Test deleting folder and contents."""
         # Create files in folder
@@ -260,19 +287,10 @@ class TestFolderCollection:
             Body=b'content2',
         )
 
-        File.objects.create(
-            user=user,
-            file=storage_path1,
+        make_files(
+            'documents/file1.txt',
+            'documents/sub/file2.txt',
             size_bytes=8,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
-        )
-        File.objects.create(
-            user=user,
-            file=storage_path2,
-            size_bytes=8,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
         )
 
         collection = FolderCollection(
@@ -287,6 +305,38 @@ class TestFolderCollection:
         # All files should be deleted
         assert File.objects.filter(user=user).count() == 0
 
+    @pytest.mark.django_db
+    def test_delete_folder_in_bulk(
+        self,
+        user,
+        webdav_environ,
+        path_mapper,
+        mock_s3,
+        make_files,
+        django_assert_num_queries,
+    ):
+        """Test folder delete trashes files in bulk and keeps S3 objects."""
+        bucket = mock_s3.Bucket('photo-album')
+        files = make_files(
+            *(f'documents/file{index}.txt' for index in range(5)),
+            size_bytes=7,
+        )
+        for file_instance in files:
+            bucket.put_object(Key=file_instance.file.name, Body=b'content')
+        collection = FolderCollection(
+            '/documents',
+            webdav_environ,
+            user,
+            path_mapper,
+        )
+
+        # One SELECT and one UPDATE, not one query per file
+        with django_assert_num_queries(2):
+            collection.delete()
+
+        assert File.all_objects.filter(user=user, is_deleted=True).count() == 5
+        assert len(list(bucket.objects.all())) == 5
+
     @pytest.mark.django_db
     def test_support_recursive_delete(
         self,
@@ -1,7 +1,15 @@
 """Tests for WebDAV file resource."""
 
+import hashlib
+import threading
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from wsgidav.dav_error import HTTP_PRECONDITION_FAILED, DAVError
 
+from server.apps.files.infrastructure import object_reader
+from server.apps.files.logic import file_operations
 from server.apps.files.models import File
 from server.apps.webdav.path_mapper import PathMapper
 from server.apps.webdav.resources.file_resource import (
@@ -49,6 +57,81 @@ class TestFileResource:
 
         assert resource.get_content_type() == 'text/plain'
 
+    @pytest.mark.django_db
+    def test_get_content_supports_ranges(
+        self,
+        user,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+    ):
+        """Test content stream reads from an arbitrary offset."""
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            sample_file,
+            path_mapper,
+        )
+
+        stream = resource.get_content()
+        stream.seek(5)
+        assert stream.read(4) == b'file'
+        assert stream.read() == b' content'
+        stream.seek(0)
+        assert stream.read() == b'test file content'
+        stream.close()
+
+    @pytest.mark.django_db
+    def test_get_content_is_lazy(
+        self,
+        user,
+        webdav_environ,
+        mock_s3,
+        path_mapper,
+    ):
+        """Test content stream issues no S3 request until first read."""
+        # Row without an object: any eager HEAD or GET would fail
+        file_instance = File.objects.create(
+            user=user,
+            file=f'{user.id}/documents/missing.txt',
+            size_bytes=17,
+            mime_type='text/plain',
+            checksum_sha256='a' * 64,
+        )
+        resource = FileResource(
+            '/documents/missing.txt',
+            webdav_environ,
+            file_instance,
+            path_mapper,
+        )
+
+        stream = resource.get_content()
+        stream.seek(5)
+        stream.close()
+
+    @pytest.mark.django_db
+    def test_get_content_reads_in_windows(
+        self,
+        user,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+        monkeypatch,
+    ):
+        """Test content spanning several ranged GET windows."""
+        monkeypatch.setattr(object_reader, '_RANGE_CHUNK_SIZE', 4)
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            sample_file,
+            path_mapper,
+        )
+
+        stream = resource.get_content()
+
+        assert stream.read() == b'test file content'
+        stream.close()
+
     @pytest.mark.django_db
     def test_get_etag(
         self,
@@ -88,6 +171,53 @@ class TestFileResource:
 
         assert resource.support_etag() is True
 
+    @pytest.mark.django_db
+    def test_get_content_prefetches_windows(
+        self,
+        user,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+        monkeypatch,
+    ):
+        """Test sequential reads of large objects fetch windows ahead."""
+        monkeypatch.setattr(object_reader, '_RANGE_CHUNK_SIZE', 4)
+        monkeypatch.setattr(object_reader, '_PARALLEL_MIN_SIZE', 8)
+        fetched = []
+        threads = set()
+        fetch_range = object_reader.S3ObjectReader._fetch_range  # noqa: SLF001
+
+        def record_fetch(reader, start, end):
+            fetched.append(start)
+            threads.add(threading.current_thread().name.split('_')[0])
+            return fetch_range(reader, start, end)
+
+        monkeypatch.setattr(
+            object_reader.S3ObjectReader,
+            '_fetch_range',
+            record_fetch,
+        )
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            sample_file,
+            path_mapper,
+        )
+
+        stream = resource.get_content()
+        assert stream.read(6) == b'test f'
+        # A seek drops the read-ahead and falls back to a single window
+        stream.seek(10)
+        assert stream.read(3) == b'con'
+        stream.seek(0)
+        fetched.clear()
+
+        assert stream.read() == b'test file content'
+        stream.close()
+        # Windows after the second one come from the read-ahead
+        assert fetched == [8, 12, 16]
+        assert threads == {'s3-prefetch'}
+
     @pytest.mark.django_db
     def test_support_ranges(
         self,
@@ -191,6 +321,164 @@ class TestFileResource:
 
         assert not File.objects.filter(id=file_id).exists()
 
+    @pytest.mark.django_db(transaction=True)
+    def test_move_recursive_renames_file(
+        self,
+        user,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+        mock_s3,
+    ):
+        """Test moving a file renames it instead of trashing the source."""
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            sample_file,
+            path_mapper,
+        )
+
+        assert resource.support_recursive_move('/renamed.txt') is True
+        resource.move_recursive('/renamed.txt')
+
+        sample_file.refresh_from_db()
+        assert sample_file.file.name == f'{user.id}/renamed.txt'
+        assert File.all_objects.filter(user=user).count() == 1
+        keys = [obj.key for obj in mock_s3.Bucket('photo-album').objects.all()]
+        assert keys == [f'{user.id}/renamed.txt']
+
+    @pytest.mark.django_db(transaction=True)
+    def test_move_recursive_overwrites_file(
+        self,
+        user,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+        mock_s3,
+    ):
+        """Test MOVE with Overwrite keeps the replaced file in trash."""
+        bucket = mock_s3.Bucket('photo-album')
+        dest_path = f'{user.id}/other.txt'
+        bucket.put_object(Key=dest_path, Body=b'other content')
+        dest_file = File.objects.create(
+            user=user,
+            file=dest_path,
+            size_bytes=13,
+            mime_type='text/plain',
+            checksum_sha256='b' * 64,
+        )
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            sample_file,
+            path_mapper,
+        )
+
+        # WsgiDAV deletes the destination before moving onto it
+        FileResource(
+            '/other.txt',
+            webdav_environ,
+            dest_file,
+            path_mapper,
+        ).delete()
+        resource.move_recursive('/other.txt')
+
+        sample_file.refresh_from_db()
+        dest_file = File.all_objects.get(id=dest_file.id)
+        assert sample_file.file.name == dest_path
+        assert dest_file.is_deleted
+        assert dest_file.file.name != dest_path
+        assert bucket.Object(dest_path).get()['Body'].read() == (
+            b'test file content'
+        )
+        trashed_body = bucket.Object(dest_file.file.name).get()['Body']
+        assert trashed_body.read() == b'other content'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_move_recursive_refuses_taken_path(
+        self,
+        user,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+        mock_s3,
+    ):
+        """Test moving onto an existing file leaves both files intact."""
+        bucket = mock_s3.Bucket('photo-album')
+        dest_path = f'{user.id}/other.txt'
+        bucket.put_object(Key=dest_path, Body=b'other content')
+        File.objects.create(
+            user=user,
+            file=dest_path,
+            size_bytes=13,
+            mime_type='text/plain',
+            checksum_sha256='b' * 64,
+        )
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            sample_file,
+            path_mapper,
+        )
+
+        with pytest.raises(DAVError) as exc_info:
+            resource.move_recursive('/other.txt')
+
+        assert exc_info.value.value == HTTP_PRECONDITION_FAILED
+        assert bucket.Object(dest_path).get()['Body'].read() == (
+            b'other content'
+        )
+        sample_file.refresh_from_db()
+        assert sample_file.file.name == f'{user.id}/documents/test.txt'
+
+    @pytest.mark.django_db
+    def test_move_recursive_reuses_authenticated_user(
+        self,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+        mock_s3,
+    ):
+        """Test moving a file does not fetch its owner again."""
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            File.objects.get(id=sample_file.id),
+            path_mapper,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            resource.move_recursive('/renamed.txt')
+
+        sql = [query['sql'] for query in queries.captured_queries]
+        assert not [query for query in sql if 'FROM "auth_user"' in query]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_properties_reflect_written_content(
+        self,
+        user,
+        webdav_environ,
+        sample_file,
+        path_mapper,
+        mock_s3,
+    ):
+        """Test properties read after a PUT describe the new content."""
+        content = b'updated content!!'
+        resource = FileResource(
+            '/documents/test.txt',
+            webdav_environ,
+            sample_file,
+            path_mapper,
+        )
+
+        buffer = resource.begin_write()
+        buffer.write(content)
+        buffer.close()
+
+        # WsgiDAV sends this ETag in the PUT response
+        assert resource.get_etag() == hashlib.sha256(content).hexdigest()
+        assert resource.get_content_length() == len(content)
+
 
 class TestNewFileResource:
     """Tests for NewFileResource."""
@@ -218,3 +506,70 @@ class TestNewFileResource:
         )
 
         assert resource.get_content_type() == 'application/octet-stream'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_write_spills_large_content_to_disk(
+        self,
+        user,
+        webdav_environ,
+        path_mapper,
+        mock_s3,
+        settings,
+    ):
+        """Test large uploads are buffered on disk, not in memory."""
+        settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 8
+        content = b'0123456789' * 10
+        resource = NewFileResource(
+            '/large.bin',
+            webdav_environ,
+            user,
+            path_mapper,
+        )
+
+        buffer = resource.begin_write()
+        buffer.write(content)
+        assert buffer._rolled is True  # noqa: SLF001
+        buffer.close()
+
+        created = File.objects.get(file=f'{user.id}/large.bin')
+        body = mock_s3.Object('photo-album', created.file.name).get()['Body']
+        assert created.size_bytes == len(content)
+        assert created.checksum_sha256 == hashlib.sha256(content).hexdigest()
+        assert body.read() == content
+        assert buffer.closed
+
+    @pytest.mark.django_db(transaction=True)
+    def test_write_hashes_multipart_upload_in_one_pass(
+        self,
+        user,
+        webdav_environ,
+        path_mapper,
+        mock_s3,
+        monkeypatch,
+    ):
+        """Test a multipart PUT is hashed while uploading, not re-read."""
+        content = b'x' * (9 * 1024 * 1024)
+
+        def fail_checksum(*args, **kwargs):
+            raise AssertionError('Content must not be re-read for checksum')
+
+        monkeypatch.setattr(
+            file_operations,
+            'calculate_checksum',
+            fail_checksum,
+        )
+        resource = NewFileResource(
+            '/large.bin',
+            webdav_environ,
+            user,
+            path_mapper,
+        )
+
+        buffer = resource.begin_write()
+        buffer.write(content)
+        buffer.close()
+
+        created = File.objects.get(file=f'{user.id}/large.bin')
+        stored = mock_s3.Object('photo-album', created.file.name)
+        assert stored.e_tag.strip('"').endswith('-2')  # Two multipart parts
+        assert created.checksum_sha256 == hashlib.sha256(content).hexdigest()
@@ -3,7 +3,10 @@
 import pytest
 from wsgidav.dav_error import DAVError
 
-from server.apps.files.logic.trash_operations import soft_delete_file
+from server.apps.files.logic.trash_operations import (
+    soft_delete_file,
+    soft_delete_files,
+)
 from server.apps.files.models import File, UserQuota
 from server.apps.webdav.path_mapper import PathMapper
 from server.apps.webdav.resources.trash_collection import TrashCollection
@@ -30,25 +33,11 @@ class TestTrashCollection:
         mock_s3,
         webdav_environ,
         path_mapper,
+        make_files,
+        django_assert_num_queries,
     ):
         """Test PROPFIND shows original filenames, not trash_names."""
-        # Create and delete files
-        file1 = File.objects.create(
-            user=user,
-            file=f'{user.id}/docs/report.pdf',
-            size_bytes=100,
-            mime_type='application/pdf',
-            checksum_sha256='a' * 64,
-        )
-        file2 = File.objects.create(
-            user=user,
-            file=f'{user.id}/photos/image.jpg',
-            size_bytes=200,
-            mime_type='image/jpeg',
-            checksum_sha256='b' * 64,
-        )
-        soft_delete_file(file1.id)
-        soft_delete_file(file2.id)
+        soft_delete_files(make_files('docs/report.pdf', 'photos/image.jpg'))
 
         collection = TrashCollection(
             '/.Trash/',
@@ -57,7 +46,8 @@ class TestTrashCollection:
             path_mapper,
         )
 
-        members = collection.get_member_names()
+        with django_assert_num_queries(1):
+            members = collection.get_member_names()
 
         assert 'report.pdf' in members
         assert 'image.jpg' in members
@@ -68,6 +58,7 @@ class TestTrashCollection:
         mock_s3,
         webdav_environ,
         path_mapper,
+        django_assert_num_queries,
     ):
         """Test get_member returns TrashFileResource."""
         from server.apps.webdav.resources.trash_file_resource import (
@@ -90,10 +81,45 @@ class TestTrashCollection:
             path_mapper,
         )
 
-        member = collection.get_member('test.txt')
+        with django_assert_num_queries(1):
+            member = collection.get_member('test.txt')
 
         assert isinstance(member, TrashFileResource)
 
+    def test_get_members_share_single_query(
+        self,
+        user,
+        mock_s3,
+        webdav_environ,
+        path_mapper,
+        make_files,
+        django_assert_num_queries,
+    ):
+        """Test listing and resolving members runs one trash query."""
+        soft_delete_files(make_files('file0.txt', 'file1.txt', 'file2.txt'))
+
+        collection = TrashCollection(
+            '/.Trash/',
+            webdav_environ,
+            user,
+            path_mapper,
+        )
+
+        with django_assert_num_queries(1):
+            members = [
+                collection.get_member(name)
+                for name in collection.get_member_names()
+            ]
+            # Live properties of a PROPFIND need no per-member queries
+            for member in members:
+                member.get_display_name()
+                member.get_content_length()
+                member.get_etag()
+                member.get_last_modified()
+                member.get_property_value('{DAV:}original-path')
+
+        assert len(members) == 3
+
     def test_get_member_not_found(
         self,
         user,
@@ -151,6 +177,8 @@ class TestTrashCollection:
         mock_s3,
         webdav_environ,
         path_mapper,
+        make_files,
+        django_assert_num_queries,
     ):
         """Test DELETE on /.Trash/ empties all trash files."""
         quota = UserQuota.objects.create(
@@ -159,22 +187,10 @@ class TestTrashCollection:
             used_bytes=300,
         )
 
-        file1 = File.objects.create(
-            user=user,
-            file=f'{user.id}/file1.txt',
-            size_bytes=100,
-            mime_type='text/plain',
-            checksum_sha256='a' * 64,
+        soft_delete_files(
+            make_files('file1.txt', size_bytes=100)
+            + make_files('file2.txt', size_bytes=200),
         )
-        file2 = File.objects.create(
-            user=user,
-            file=f'{user.id}/file2.txt',
-            size_bytes=200,
-            mime_type='text/plain',
-            checksum_sha256='b' * 64,
-        )
-        soft_delete_file(file1.id)
-        soft_delete_file(file2.id)
 
         collection = TrashCollection(
             '/.Trash/',
@@ -183,7 +199,9 @@ class TestTrashCollection:
             path_mapper,
         )
 
-        collection.delete()
+        # Bulk claim, delete and quota release, independent of file count
+        with django_assert_num_queries(6):
+            collection.delete()
 
         # All files should be permanently deleted
         assert not File.all_objects.filter(user=user).exists()
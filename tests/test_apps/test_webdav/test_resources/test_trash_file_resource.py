@@ -2,8 +2,13 @@
 
 import pytest
 from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from wsgidav.dav_error import DAVError
+from wsgidav.lock_man.lock_manager import LockManager
+from wsgidav.lock_man.lock_storage import LockStorageDict
 
+from server.apps.files.infrastructure import object_reader
 from server.apps.files.logic.file_operations import upload_file
 from server.apps.files.logic.trash_operations import soft_delete_file
 from server.apps.files.models import File, UserQuota
@@ -106,12 +111,51 @@ class TestTrashFileResource:
         finally:
             content.close()
 
+    def test_get_content_is_lazy_and_ranged(
+        self,
+        user,
+        mock_s3,
+        webdav_environ,
+        path_mapper,
+        monkeypatch,
+    ):
+        """Test GET fetches nothing up front and reads ranges on demand."""
+        file_instance = self._create_trash_file(user, mock_s3)
+        opened = []
+        open_window = object_reader.S3ObjectReader._open_window  # noqa: SLF001
+
+        def record_open(reader):
+            opened.append(reader.tell())
+            open_window(reader)
+
+        monkeypatch.setattr(
+            object_reader.S3ObjectReader,
+            '_open_window',
+            record_open,
+        )
+        resource = TrashFileResource(
+            '/.Trash/test.txt',
+            webdav_environ,
+            file_instance,
+            path_mapper,
+        )
+
+        content = resource.get_content()
+        try:
+            assert opened == []
+            content.seek(10)
+            assert content.read() == b'content'
+        finally:
+            content.close()
+        assert opened == [10]
+
     def test_delete_permanently_deletes(
         self,
         user,
         mock_s3,
         webdav_environ,
         path_mapper,
+        django_assert_num_queries,
     ):
         """Test DELETE permanently removes file."""
         file_instance = self._create_trash_file(user, mock_s3)
@@ -129,7 +173,9 @@ class TestTrashFileResource:
             path_mapper,
         )
 
-        resource.delete()
+        # Claim, tag and row deletes, quota release; no collector SELECTs
+        with django_assert_num_queries(6):
+            resource.delete()
 
         # File should be gone from DB
         assert not File.all_objects.filter(id=file_id).exists()
@@ -162,6 +208,28 @@ class TestTrashFileResource:
         file_instance.refresh_from_db()
         assert file_instance.is_deleted is False
 
+    def test_move_out_of_trash_reuses_authenticated_user(
+        self,
+        user,
+        mock_s3,
+        webdav_environ,
+        path_mapper,
+    ):
+        """Test restore does not fetch the owner again."""
+        file_id = self._create_trash_file(user, mock_s3).id
+        resource = TrashFileResource(
+            '/.Trash/test.txt',
+            webdav_environ,
+            File.all_objects.get(id=file_id),
+            path_mapper,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            resource.copy_move_single('/restored/test.txt', is_move=True)
+
+        sql = [query['sql'] for query in queries.captured_queries]
+        assert not [query for query in sql if 'FROM "auth_user"' in query]
+
     def test_copy_from_trash_forbidden(
         self,
         user,
@@ -245,6 +313,28 @@ class TestTrashFileResource:
         assert original_path.startswith(f'{user.id}/documents/test')
         assert original_path.endswith('.txt')
 
+    def test_dead_properties_skip_property_manager(
+        self,
+        user,
+        mock_s3,
+        webdav_environ,
+        path_mapper,
+    ):
+        """Test dead properties are rejected and cannot be set."""
+        file_instance = self._create_trash_file(user, mock_s3)
+
+        resource = TrashFileResource(
+            '/.Trash/test.txt',
+            webdav_environ,
+            file_instance,
+            path_mapper,
+        )
+
+        with pytest.raises(DAVError):
+            resource.get_property_value('{http://example.com/ns}color')
+        with pytest.raises(DAVError):
+            resource.set_property_value('{http://example.com/ns}color', 'red')
+
     def test_support_ranges(
         self,
         user,
@@ -264,6 +354,53 @@ class TestTrashFileResource:
 
         assert resource.support_ranges() is True
 
+    def test_depth_one_propfind_lists_only_self(
+        self,
+        user,
+        mock_s3,
+        webdav_environ,
+        path_mapper,
+    ):
+        """Test a Depth: 1 PROPFIND on a trash file does not recurse."""
+        file_instance = self._create_trash_file(user, mock_s3)
+
+        resource = TrashFileResource(
+            '/.Trash/test.txt',
+            webdav_environ,
+            file_instance,
+            path_mapper,
+        )
+
+        # Same call WsgiDAV makes for PROPFIND; leaves have no members
+        assert resource.get_descendants(depth='1', add_self=True) == [
+            resource,
+        ]
+
+    def test_properties_skip_locking(
+        self,
+        user,
+        mock_s3,
+        webdav_environ,
+        path_mapper,
+    ):
+        """Test trash files are not lockable and list no lock properties."""
+        file_instance = self._create_trash_file(user, mock_s3)
+        webdav_environ['wsgidav.provider'].set_lock_manager(
+            LockManager(LockStorageDict()),
+        )
+
+        resource = TrashFileResource(
+            '/.Trash/test.txt',
+            webdav_environ,
+            file_instance,
+            path_mapper,
+        )
+
+        names = resource.get_property_names(is_allprop=True)
+        assert resource.prevent_locking() is True
+        assert '{DAV:}lockdiscovery' not in names
+        assert '{DAV:}getetag' in names
+
     def test_get_etag(
         self,
         user,
@@ -271,7 +408,7 @@ class TestTrashFileResource:
         webdav_environ,
         path_mapper,
     ):
-        """Test get_etag returns checksum."""
+        """Test get_etag returns checksum prefix."""
         file_instance = self._create_trash_file(user, mock_s3)
 
         resource = TrashFileResource(
@@ -282,8 +419,7 @@ class TestTrashFileResource:
         )
 
         # ETag should be the SHA256 checksum (computed by upload_file)
-        assert resource.get_etag() == file_instance.checksum_sha256
-        assert len(resource.get_etag()) == 64
+        assert resource.get_etag() == file_instance.checksum_sha256[:16]
 
     def test_get_last_modified_uses_deleted_at(
         self,
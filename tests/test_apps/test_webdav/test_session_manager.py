@@ -3,6 +3,8 @@
 from datetime import timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from server.apps.webdav.logic.session_manager import (
@@ -89,6 +91,22 @@ class TestCreateSession:
         with pytest.raises(SessionLimitExceededError):
             create_session(user, '192.168.1.3', 'Agent3')
 
+    @pytest.mark.django_db
+    def test_create_session_locks_owner(self, user, settings):
+        """Test the limit check locks the owner and bounds the count."""
+        settings.WEBDAV_SESSION_LIMIT = 2
+
+        with CaptureQueriesContext(connection) as queries:
+            create_session(user, '192.168.1.1', 'Agent1')
+
+        sql = [query['sql'] for query in queries.captured_queries]
+        locks = [query for query in sql if 'FOR UPDATE' in query]
+        counts = [query for query in sql if 'COUNT(*)' in query]
+        assert len(locks) == 1
+        assert 'auth_user' in locks[0]
+        assert len(counts) == 1
+        assert 'LIMIT 2' in counts[0]
+
     @pytest.mark.django_db
     def test_create_session_different_users(self, user, other_user, settings):
         """Test that session limits are per-user."""
@@ -131,6 +149,19 @@ class TestUpdateSessionActivity:
         assert result is True
         assert session.last_activity >= original_activity
 
+    @pytest.mark.django_db
+    def test_update_session_activity_single_column_update(self, user):
+        """Test activity is recorded with one UPDATE of one column."""
+        session = create_session(user, '192.168.1.1')
+
+        with CaptureQueriesContext(connection) as queries:
+            update_session_activity(session.session_id)
+
+        assert len(queries.captured_queries) == 1
+        sql = queries.captured_queries[0]['sql']
+        assert sql.startswith('UPDATE')
+        assert sql.count('=') == 2  # SET last_activity, WHERE session_id
+
     @pytest.mark.django_db
     def test_update_session_activity_not_found(self):
         """Test updating nonexistent session."""
@@ -184,6 +215,27 @@ class TestCleanupStaleSessions:
         assert deleted == 1
         assert not WebDAVSession.objects.filter(id=session.id).exists()
 
+    @pytest.mark.django_db
+    def test_cleanup_stale_sessions_single_delete(
+        self,
+        user,
+        settings,
+        django_assert_num_queries,
+    ):
+        """Test that cleanup deletes all stale sessions in one query."""
+        settings.WEBDAV_SESSION_LIMIT = 3
+        settings.WEBDAV_SESSION_TIMEOUT = 1800
+        for index in range(3):
+            create_session(user, f'192.168.1.{index}')
+        WebDAVSession.objects.update(
+            last_activity=timezone.now() - timedelta(seconds=3600),
+        )
+
+        with django_assert_num_queries(1):
+            deleted = cleanup_stale_sessions()
+
+        assert deleted == 3
+
     @pytest.mark.django_db
     def test_cleanup_keeps_active_sessions(self, user, settings):
         """Test that active sessions are not cleaned up."""
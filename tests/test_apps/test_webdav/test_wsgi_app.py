@@ -0,0 +1,32 @@
+"""Tests for WebDAV WSGI application factory."""
+
+from server.apps.webdav.wsgi_app import get_lock_storage, get_webdav_app
+
+
+def test_get_webdav_app_is_singleton():
+    """Test application is built once per process."""
+    assert get_webdav_app() is get_webdav_app()
+
+
+def test_get_lock_storage_in_process(settings):
+    """Test in-process lock storage without Redis URL."""
+    settings.WEBDAV_LOCK_REDIS_URL = ''
+
+    assert get_lock_storage() is True
+
+
+def test_get_lock_storage_redis(settings):
+    """Test Redis lock storage options parsed from URL."""
+    settings.WEBDAV_LOCK_REDIS_URL = 'redis://:secret@redis:6380/2'
+
+    lock_storage = get_lock_storage()
+
+    assert lock_storage == {
+        'class': 'wsgidav.lock_man.lock_storage_redis.LockStorageRedis',
+        'kwargs': {
+            'host': 'redis',
+            'port': 6380,
+            'db': 2,
+            'password': 'secret',
+        },
+    }
@@ -3,7 +3,9 @@
 These tests verify that MinIO is properly configured and accessible
 when running in Docker Compose. They test the S3 API using boto3.
 """
+import hashlib
 import os
+from collections.abc import Iterator
 from typing import Final
 
 import boto3
@@ -16,10 +18,13 @@ _TEST_FILE_KEY: Final = 'test-file.txt'
 _TEST_FILE_CONTENT: Final = b'Hello from MinIO integration test!'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def s3_client() -> BaseClient:
     """Create S3 client for MinIO.
 
+    Shared by all tests, so botocore loads its service model and opens
+    its connection pool once.
+
     Returns:
         Configured boto3 S3 client for MinIO.
     """
@@ -36,14 +41,17 @@ def s3_client() -> BaseClient:
     )
 
 
-@pytest.fixture
-def test_bucket(s3_client: BaseClient) -> str:
+@pytest.fixture(scope='session')
+def test_bucket(s3_client: BaseClient) -> Iterator[str]:
     """Ensure test bucket exists.
 
+    The bucket is the one the application uses, so teardown removes
+    only the object written by these tests.
+
     Args:
         s3_client: boto3 S3 client.
 
-    Returns:
+    Yields:
         Name of the test bucket.
     """
     try:
@@ -51,7 +59,9 @@ def test_bucket(s3_client: BaseClient) -> str:
     except ClientError:
         s3_client.create_bucket(Bucket=_TEST_BUCKET)
 
-    return _TEST_BUCKET
+    yield _TEST_BUCKET
+
+    s3_client.delete_object(Bucket=_TEST_BUCKET, Key=_TEST_FILE_KEY)
 
 
 @pytest.mark.integration
@@ -83,16 +93,16 @@ def test_upload_object(s3_client: BaseClient, test_bucket: str) -> None:
         s3_client: boto3 S3 client.
         test_bucket: Name of the test bucket.
     """
-    s3_client.put_object(
+    response = s3_client.put_object(
         Bucket=test_bucket,
         Key=_TEST_FILE_KEY,
         Body=_TEST_FILE_CONTENT,
     )
 
-    # Verify object exists
-    response = s3_client.head_object(Bucket=test_bucket, Key=_TEST_FILE_KEY)
+    # Single-part ETag is the MD5 of the stored bytes, no HEAD needed
+    content_md5 = hashlib.md5(_TEST_FILE_CONTENT).hexdigest()  # noqa: S324
     assert response['ResponseMetadata']['HTTPStatusCode'] == 200
-    assert response['ContentLength'] == len(_TEST_FILE_CONTENT)
+    assert response['ETag'] == f'"{content_md5}"'
 
 
 @pytest.mark.integration